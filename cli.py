@@ -1,11 +1,14 @@
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 from cryptography.fernet import InvalidToken
 
-from voice_dna import VoiceDNA
+from voice_dna import BINARY_SUFFIX, VoiceDNA, convert_to_binary
+from voicedna.enrollment import BatchEnroller, load_jobs, summarize
 from voicedna.synthesis import (
     detect_natural_backend_decision,
     inspect_natural_backend_health,
@@ -228,10 +231,11 @@ def _resolve_dna_path(dna_path: str) -> str:
     if voices_candidate.exists():
         return str(voices_candidate)
 
-    if not dna_path.endswith(".voicedna.enc"):
-        named_candidate = VOICES_DIR / f"{dna_path}.voicedna.enc"
-        if named_candidate.exists():
-            return str(named_candidate)
+    if not dna_path.endswith((".voicedna.enc", BINARY_SUFFIX)):
+        for suffix in (".voicedna.enc", BINARY_SUFFIX):
+            named_candidate = VOICES_DIR / f"{dna_path}{suffix}"
+            if named_candidate.exists():
+                return str(named_candidate)
 
     return dna_path
 
@@ -255,6 +259,16 @@ def _load_encrypted_or_exit(password: str, dna_path: str) -> VoiceDNA:
         raise typer.Exit(code=2)
 
 
+def _read_fingerprint_ids_or_exit(path: str) -> list[str]:
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+        loaded = json.loads(text) if text.lstrip().startswith("[") else text.split()
+    except (OSError, ValueError) as error:
+        typer.secho(f"Could not read candidates: {error}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    return [str(value) for value in loaded]
+
+
 @app.command("birth")
 def birth(
     imprint: str = typer.Option(..., help="Imprint audio description"),
@@ -276,6 +290,403 @@ def birth(
     typer.echo(f"Saved encrypted file: {output_path}")
 
 
+@app.command("enroll-batch")
+def enroll_batch(
+    source: str = typer.Argument(
+        ..., help="Directory of recordings or a CSV/JSON/JSONL manifest"
+    ),
+    password: str = typer.Option(
+        ..., prompt=True, hide_input=True, confirmation_prompt=True
+    ),
+    voices_dir: str = typer.Option(str(VOICES_DIR), help="Output directory"),
+    binary: bool = typer.Option(
+        False, "--binary", help=f"Write encrypted {BINARY_SUFFIX} files"
+    ),
+    batch_size: int = typer.Option(16, min=1, help="Clips per encoder batch"),
+    decode_workers: int = typer.Option(4, min=1, help="Audio decode threads"),
+    encrypt_workers: int = typer.Option(
+        0, min=0, help="Encryption processes (0 = one per CPU)"
+    ),
+    overwrite: bool = typer.Option(
+        False, "--overwrite", help="Recreate voices whose output already exists"
+    ),
+    summary_json: str = typer.Option(
+        "", help="Optional path for the per-file timing summary"
+    ),
+):
+    try:
+        jobs = load_jobs(source)
+    except (OSError, ValueError) as error:
+        typer.secho(f"Could not read enrollment source: {error}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    if not jobs:
+        typer.secho(f"No recordings found in {source}", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    def _progress(result, done, total):
+        color = {"created": typer.colors.GREEN, "failed": typer.colors.RED}.get(
+            result.status, typer.colors.CYAN
+        )
+        detail = result.error or f"{result.total_seconds:.2f}s {result.backend}"
+        typer.secho(
+            f"[{done}/{total}] {result.status:<7} {result.voice_name} ({detail})",
+            fg=color,
+        )
+
+    enroller = BatchEnroller(
+        output_dir=voices_dir,
+        password=password,
+        binary=binary,
+        batch_size=batch_size,
+        decode_workers=decode_workers,
+        encrypt_workers=encrypt_workers or None,
+        overwrite=overwrite,
+        on_progress=_progress,
+    )
+    started_at = time.perf_counter()
+    results = enroller.run(jobs)
+    summary = summarize(results, time.perf_counter() - started_at)
+
+    typer.echo(
+        f"Created {summary['created']}, skipped {summary['skipped']}, "
+        f"failed {summary['failed']} in {summary['wall_seconds']:.1f}s "
+        f"({summary['files_per_second']} files/s; decode {summary['decode_seconds']:.1f}s, "
+        f"embed {summary['embed_seconds']:.1f}s, encrypt {summary['encrypt_seconds']:.1f}s)"
+    )
+    if summary_json:
+        Path(summary_json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        typer.echo(f"Timing summary: {summary_json}")
+    if summary["failed"]:
+        raise typer.Exit(code=1)
+
+
+@app.command("render-batch")
+def render_batch(
+    input_dir: str = typer.Argument(..., help="Directory of WAV files to render"),
+    output_dir: str = typer.Option(..., help="Directory for processed WAV files"),
+    password: str = typer.Option(..., prompt=True, hide_input=True),
+    dna_path: str = typer.Option("myai.voicedna.enc", help="Encrypted VoiceDNA path"),
+    executor: str = typer.Option(
+        "process", help="Pool type: process (all cores) or thread"
+    ),
+    workers: int = typer.Option(0, min=0, help="Pool size (0 = one per CPU)"),
+    chunk_size: int = typer.Option(
+        64, min=1, help="Clips held in memory per batch"
+    ),
+    summary_json: str = typer.Option(
+        "", help="Optional path for the throughput summary"
+    ),
+):
+    from voicedna.framework import BatchProcessPool, VoiceDNAProcessor
+
+    if executor not in {"process", "thread"}:
+        typer.secho("--executor must be 'process' or 'thread'", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    sources = sorted(Path(input_dir).glob("*.wav"))
+    if not sources:
+        typer.secho(f"No WAV files found in {input_dir}", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    dna = _load_encrypted_or_exit(password=password, dna_path=_resolve_dna_path(dna_path))
+    destination = Path(output_dir)
+    destination.mkdir(parents=True, exist_ok=True)
+    processor = VoiceDNAProcessor()
+    totals = {"items": 0, "errors": 0, "audio_seconds": 0.0}
+    started_at = time.perf_counter()
+
+    # One pool for the whole run so workers stay warm across chunks.
+    pool = (
+        BatchProcessPool([dna], max_workers=workers or None)
+        if executor == "process"
+        else ThreadPoolExecutor(max_workers=workers or None)
+    )
+    with pool:
+        for offset in range(0, len(sources), chunk_size):
+            chunk = sources[offset : offset + chunk_size]
+            batch = processor.process_many(
+                [source.read_bytes() for source in chunk], dna, executor=pool
+            )
+            for source, result in zip(chunk, batch.results):
+                if result.report.get("status") == "error":
+                    typer.secho(
+                        f"failed  {source.name}: {result.report.get('error')}",
+                        fg=typer.colors.RED,
+                    )
+                    continue
+                (destination / source.name).write_bytes(result.audio)
+            for key in totals:
+                totals[key] += batch.stats[key]
+            typer.echo(
+                f"[{offset + len(chunk)}/{len(sources)}] "
+                f"{batch.stats['items_per_second']} clips/s, "
+                f"{batch.stats['realtime_factor']}x realtime"
+            )
+
+    wall_seconds = time.perf_counter() - started_at
+    summary = {
+        **totals,
+        "audio_seconds": round(totals["audio_seconds"], 3),
+        "wall_seconds": round(wall_seconds, 3),
+        "items_per_second": round(totals["items"] / wall_seconds, 2),
+        "realtime_factor": round(totals["audio_seconds"] / wall_seconds, 2),
+        "executor": executor,
+    }
+    typer.echo(
+        f"Rendered {summary['items'] - summary['errors']}/{summary['items']} clips "
+        f"in {summary['wall_seconds']:.1f}s ({summary['realtime_factor']}x realtime)"
+    )
+    if summary_json:
+        Path(summary_json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    if summary["errors"]:
+        raise typer.Exit(code=1)
+
+
+@app.command("watermark-scan")
+def watermark_scan(
+    input_dir: str = typer.Argument(..., help="Directory of WAV files to audit"),
+    candidates: str = typer.Option(
+        "", help="File of candidate voice_fingerprint_ids (one per line or a JSON list)"
+    ),
+    fingerprint: list[str] = typer.Option(
+        [], "--fingerprint", help="Candidate voice_fingerprint_id (repeatable)"
+    ),
+    index: str = typer.Option(
+        "", help="Saved watermark index directory (see watermark-index)"
+    ),
+    min_score: float = typer.Option(
+        5.0,
+        help="Single-candidate z-score threshold; raised automatically for the "
+        "number of candidates",
+    ),
+    executor: str = typer.Option(
+        "process", help="Pool type: process (all cores) or thread"
+    ),
+    workers: int = typer.Option(0, min=0, help="Pool size (0 = one per CPU)"),
+    chunk_size: int = typer.Option(256, min=1, help="Files per worker task"),
+    output_jsonl: str = typer.Option(
+        "", help="Optional path for one JSON result per file"
+    ),
+):
+    from voicedna.watermark import scan_watermarks
+
+    if executor not in {"process", "thread"}:
+        typer.secho("--executor must be 'process' or 'thread'", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    candidate_ids = list(fingerprint)
+    if candidates:
+        candidate_ids.extend(_read_fingerprint_ids_or_exit(candidates))
+    sources = sorted(Path(input_dir).rglob("*.wav"))
+    if not sources:
+        typer.secho(f"No WAV files found in {input_dir}", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    counts = {"files": 0, "detected": 0, "errors": 0}
+    matches: dict[str, int] = {}
+    started_at = time.perf_counter()
+    output = open(output_jsonl, "w", encoding="utf-8") if output_jsonl else None
+    try:
+        for path, detection, error in scan_watermarks(
+            sources,
+            candidate_ids or None,
+            min_score=min_score,
+            executor=executor,
+            max_workers=workers or None,
+            chunk_size=chunk_size,
+            index_dir=index or None,
+        ):
+            counts["files"] += 1
+            if error is not None:
+                counts["errors"] += 1
+                record = {"path": path, "error": error}
+            else:
+                record = {"path": path, **detection.to_dict()}
+                if detection.detected:
+                    counts["detected"] += 1
+                    key = detection.voice_fingerprint_id or "(unattributed)"
+                    matches[key] = matches.get(key, 0) + 1
+            if output is not None:
+                output.write(json.dumps(record) + "\n")
+            if counts["files"] % 1000 == 0:
+                typer.echo(f"[{counts['files']}/{len(sources)}] scanned")
+    finally:
+        if output is not None:
+            output.close()
+
+    wall_seconds = time.perf_counter() - started_at
+    typer.echo(
+        f"Scanned {counts['files']} clips in {wall_seconds:.1f}s "
+        f"({counts['files'] / wall_seconds:.0f} clips/s): "
+        f"{counts['detected']} watermarked, {counts['errors']} unreadable"
+    )
+    for fingerprint_id, count in sorted(matches.items(), key=lambda item: -item[1]):
+        typer.echo(f"{count:>8}  {fingerprint_id}")
+    if counts["errors"]:
+        raise typer.Exit(code=1)
+
+
+@app.command("watermark-index")
+def watermark_index(
+    output_dir: str = typer.Argument(..., help="Directory to write the index to"),
+    candidates: str = typer.Option(
+        "", help="File of voice_fingerprint_ids (one per line or a JSON list)"
+    ),
+    store_dir: str = typer.Option(
+        "", help="Index every voice in this VoiceDNA store directory instead"
+    ),
+    password: str = typer.Option("", help="Store password (with --store-dir)"),
+):
+    from voicedna.watermark_index import WatermarkIndex
+
+    started_at = time.perf_counter()
+    if store_dir:
+        from voicedna.store import VoiceDNAStore
+
+        index = WatermarkIndex.from_store(VoiceDNAStore(store_dir, password=password))
+    elif candidates:
+        index = WatermarkIndex()
+        index.add_many(_read_fingerprint_ids_or_exit(candidates))
+    else:
+        typer.secho("Pass --candidates or --store-dir", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    index.save(output_dir)
+    typer.echo(
+        f"Indexed {len(index)} fingerprints into {output_dir} "
+        f"in {time.perf_counter() - started_at:.1f}s"
+    )
+
+
+@app.command("consistency-matrix")
+def consistency_matrix(
+    input_dir: str = typer.Argument(..., help="Directory of rendered WAV clips"),
+    store_dir: str = typer.Option(..., help="VoiceDNA store directory to score against"),
+    password: str = typer.Option("", help="Store password"),
+    expected: str = typer.Option(
+        "",
+        help=(
+            "JSON object mapping clip paths (relative to INPUT_DIR) to voice names; "
+            "by default a clip belongs to the voice named like its parent directory"
+        ),
+    ),
+    threshold: float = typer.Option(0.92, help="Consistency threshold"),
+    top_k: int = typer.Option(3, min=1, help="Best voices reported per clip"),
+    workers: int = typer.Option(4, min=1, help="Extraction threads"),
+    batch_size: int = typer.Option(32, min=1, help="Clips per extraction batch"),
+    output_jsonl: str = typer.Option("", help="Optional path for one JSON record per clip"),
+    summary_json: str = typer.Option("", help="Optional path for per-voice statistics"),
+    backend: str = typer.Option(
+        "auto", help="Clip embedding backend (auto, resemblyzer, speechbrain, numpy)"
+    ),
+    voices_backend: str = typer.Option(
+        "auto",
+        help=(
+            "Backend the stored voices were enrolled with; auto assumes the one "
+            "this host extracts with. Must match the clip backend"
+        ),
+    ),
+):
+    from voicedna.consistency import VoiceConsistencyEngine
+    from voicedna.consistency_matrix import embed_wav_files, score_matrix
+    from voicedna.encoders import BACKENDS, get_encoder_pool
+    from voicedna.store import VoiceDNAStore
+
+    engine = VoiceConsistencyEngine()
+    choices = {"auto", "numpy", *BACKENDS}
+    for option, value in (("--backend", backend), ("--voices-backend", voices_backend)):
+        if value not in choices:
+            typer.secho(
+                f"{option} must be one of {', '.join(sorted(choices))}",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(code=2)
+    preferred = engine.preferred_backend()
+    backend = preferred if backend == "auto" else backend
+    voices_backend = preferred if voices_backend == "auto" else voices_backend
+    if backend != voices_backend:
+        typer.secho(
+            f"Clips would be embedded with {backend} but the voices were enrolled "
+            f"with {voices_backend}; their scores are not comparable",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(code=2)
+    if backend != "numpy":
+        try:
+            get_encoder_pool().acquire(backend)
+        except RuntimeError as error:
+            typer.secho(f"Backend {backend} unavailable: {error}", fg=typer.colors.RED)
+            raise typer.Exit(code=2)
+
+    root = Path(input_dir)
+    sources = sorted(root.rglob("*.wav"))
+    if not sources:
+        typer.secho(f"No WAV files found in {input_dir}", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+    store = VoiceDNAStore(store_dir, password=password or None)
+    voice_names = store.names()
+    if not voice_names:
+        typer.secho(f"No voices found in {store_dir}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    voices = [store.get(name).core_embedding for name in voice_names]
+    if expected:
+        try:
+            owners = json.loads(Path(expected).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as error:
+            typer.secho(f"Could not read {expected}: {error}", fg=typer.colors.RED)
+            raise typer.Exit(code=2)
+        expected_by_path = {str(root / clip): voice for clip, voice in owners.items()}
+    else:
+        expected_by_path = {str(path): path.parent.name for path in sources}
+
+    started_at = time.perf_counter()
+    clips = embed_wav_files(
+        sources, engine, batch_size=batch_size, workers=workers, backend=backend
+    )
+    matrix = score_matrix(
+        clips.matrix, voices, clips.ids, voice_names, threshold=threshold
+    )
+    checks = {check["clip"]: check for check in matrix.verify(expected_by_path)}
+    wall_seconds = time.perf_counter() - started_at
+
+    if output_jsonl:
+        with open(output_jsonl, "w", encoding="utf-8") as output:
+            for clip_id, hits in zip(matrix.clip_ids, matrix.top_k(top_k)):
+                record = {
+                    "path": clip_id,
+                    "top": [[voice, round(score, 4)] for voice, score in hits],
+                    **{
+                        key: value
+                        for key, value in checks.get(clip_id, {}).items()
+                        if key != "clip"
+                    },
+                }
+                output.write(json.dumps(record) + "\n")
+            for path, error in clips.errors.items():
+                output.write(json.dumps({"path": path, "error": error}) + "\n")
+    summary = matrix.voice_summary()
+    if summary_json:
+        Path(summary_json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    failed = [check for check in checks.values() if not check["passed"]]
+    typer.echo(
+        f"Scored {len(matrix.clip_ids)} clips x {len(voice_names)} voices in "
+        f"{wall_seconds:.1f}s with {clips.backend}: "
+        f"{len(checks) - len(failed)}/{len(checks)} owned clips passed, "
+        f"{len(clips.errors)} unreadable"
+    )
+    for name, stats in summary.items():
+        typer.echo(
+            f"{name:>24}  mean {stats.get('mean', 0.0):.3f}  "
+            f"p05 {stats.get('p05', 0.0):.3f}  accepted {stats.get('accepted', 0)}"
+        )
+    for check in failed:
+        typer.secho(
+            f"FAIL {check['clip']}: {check['voice']} {check['score']:.3f} "
+            f"(best impostor {check['best_impostor']} {check['impostor_score']})",
+            fg=typer.colors.RED,
+        )
+    if failed or clips.errors:
+        raise typer.Exit(code=1)
+
+
 @app.command("speak")
 def speak(
     text: str = typer.Option(
@@ -463,5 +874,96 @@ def verify_password(
     typer.echo(f"Path: {resolved_path}")
 
 
+@app.command("convert-voices")
+def convert_voices(
+    voices_dir: str = typer.Option(
+        str(VOICES_DIR), help="Directory of .voicedna.enc/.json files to migrate"
+    ),
+    password: str = typer.Option(
+        "", help="Password for encrypted voices (prompts when needed)"
+    ),
+    encrypt: bool = typer.Option(
+        True, "--encrypt/--plain", help="Encrypt the binary output"
+    ),
+    remove_source: bool = typer.Option(
+        False, "--remove-source", help="Delete each source file after conversion"
+    ),
+):
+    directory = Path(voices_dir)
+    sources = sorted(
+        {
+            path
+            for pattern in ("*.voicedna.enc", "*.json")
+            for path in directory.glob(pattern)
+        }
+    )
+    if not sources:
+        typer.secho(f"No VoiceDNA files found in {directory}", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    needs_password = encrypt or any(
+        path.name.endswith(".voicedna.enc") for path in sources
+    )
+    if needs_password and not password:
+        password = typer.prompt("VoiceDNA password", hide_input=True)
+
+    converted = 0
+    for source in sources:
+        try:
+            target = convert_to_binary(
+                str(source),
+                password=password or None,
+                encrypt=encrypt,
+                remove_source=remove_source,
+            )
+        except (InvalidToken, ValueError, TypeError) as error:
+            typer.secho(f"Skipped {source}: {error}", fg=typer.colors.YELLOW)
+            continue
+        converted += 1
+        typer.echo(
+            f"{source.name} ({source.stat().st_size if source.exists() else '-'} B) -> "
+            f"{target.name} ({target.stat().st_size} B)"
+        )
+
+    typer.secho(
+        f"Converted {converted}/{len(sources)} voices to {BINARY_SUFFIX}",
+        fg=typer.colors.GREEN,
+    )
+
+
+@app.command("plugins")
+def plugins_command():
+    from voicedna.plugins.registry import PLUGIN_GROUPS, get_plugin_registry
+
+    registry = get_plugin_registry()
+    specs = [spec for group in PLUGIN_GROUPS for spec in registry.specs(group)]
+    if not specs:
+        typer.echo("No VoiceDNA plugins installed.")
+        raise typer.Exit(code=0)
+
+    for spec in specs:
+        try:
+            registry.load(spec)
+        except Exception:
+            pass
+    for entry in sorted(
+        registry.stats(), key=lambda item: item["import_ms"] or 0.0, reverse=True
+    ):
+        status = "ok" if entry["loaded"] else f"failed ({entry['error']})"
+        typer.echo(
+            f"{entry['import_ms'] or 0.0:>9.2f} ms  {entry['group']:<17} "
+            f"{entry['name']:<22} {entry['value']}  {status}"
+        )
+
+
+@app.command("forget-keys")
+def forget_keys():
+    VoiceDNA.clear_key_cache(include_session=True)
+    typer.secho(
+        "Cleared cached VoiceDNA keys (memory and session token).",
+        fg=typer.colors.GREEN,
+    )
+
+
 if __name__ == "__main__":
     app()
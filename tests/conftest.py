@@ -1,10 +1,15 @@
 import io
 import math
+import os
 import struct
+import tempfile
 import wave
 
 import pytest
 
+# Keep the on-disk embedding cache out of the developer's ~/.cache.
+os.environ.setdefault("VOICEDNA_CACHE_DIR", tempfile.mkdtemp(prefix="voicedna-test-"))
+
 
 @pytest.fixture()
 def wav_fixture_bytes() -> bytes:
@@ -0,0 +1,86 @@
+import asyncio
+import sys
+import time
+
+from voice_dna import VoiceDNA
+from voicedna.aio import AsyncProcessor
+from voicedna.providers import async_exec
+from voicedna.synthesis import synthesize_and_process_async
+
+
+class _SlowAsyncProvider:
+    def __init__(self, wav_bytes):
+        self.wav_bytes = wav_bytes
+        self.active = 0
+        self.max_active = 0
+
+    async def synthesize_async(self, text):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return self.wav_bytes
+
+
+def test_concurrency_is_bounded_by_semaphore(wav_fixture_bytes):
+    runtime = AsyncProcessor(max_concurrency=3)
+    provider = _SlowAsyncProvider(wav_fixture_bytes)
+    dna = VoiceDNA.create_new("Async", "async")
+
+    async def _main():
+        return await asyncio.gather(
+            *(
+                runtime.synthesize_and_process(f"line {index}", dna, provider)
+                for index in range(12)
+            )
+        )
+
+    results = asyncio.run(_main())
+
+    assert provider.max_active == 3
+    assert all(result.audio for result in results)
+    assert results[0].params["tts.backend"] == "_SlowAsyncProvider"
+
+
+def test_cancellation_kills_subprocess(monkeypatch):
+    spawned = []
+    original = asyncio.create_subprocess_exec
+
+    async def _tracking_exec(*args, **kwargs):
+        process = await original(*args, **kwargs)
+        spawned.append(process)
+        return process
+
+    monkeypatch.setattr(async_exec.asyncio, "create_subprocess_exec", _tracking_exec)
+
+    async def _main():
+        task = asyncio.create_task(
+            async_exec.run_command_async(
+                [sys.executable, "-c", "import time; time.sleep(30)"]
+            )
+        )
+        await asyncio.sleep(0.3)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    started_at = time.perf_counter()
+    assert asyncio.run(_main())
+    assert time.perf_counter() - started_at < 10
+    assert spawned and spawned[0].returncode is not None
+
+
+def test_synthesize_and_process_async_simple_backend():
+    dna = VoiceDNA.create_new("AsyncSimple", "async_simple")
+
+    audio, report, backend = asyncio.run(
+        synthesize_and_process_async("Hello from the event loop.", dna, backend="simple")
+    )
+
+    assert backend == "simple"
+    assert audio[:4] == b"RIFF"
+    assert report["resolved_backend"] == "simple"
+    assert report["filters"]
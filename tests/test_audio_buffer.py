@@ -0,0 +1,84 @@
+import io
+import wave
+
+import numpy as np
+
+from voice_dna import VoiceDNA
+from voicedna.audio import AudioBuffer
+from voicedna.filters import AgeMaturationFilter, ImprintConverterFilter
+from voicedna.framework import VoiceDNAProcessor
+from voicedna.plugins.base import IVoiceDNAFilter
+
+
+class _BytesOnlyFilter(IVoiceDNAFilter):
+    def __init__(self):
+        self.seen = []
+
+    def name(self) -> str:
+        return "bytes_only"
+
+    def priority(self) -> int:
+        return 15
+
+    def process(self, audio_bytes, dna, params):
+        self.seen.append(type(audio_bytes))
+        return audio_bytes
+
+
+def _stereo_wav(frames=800, sample_rate=8000):
+    left = (np.sin(np.arange(frames) / 5) * 8000).astype("<i2")
+    right = (left // 2).astype("<i2")
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wave_file:
+        wave_file.setnchannels(2)
+        wave_file.setsampwidth(2)
+        wave_file.setframerate(sample_rate)
+        wave_file.writeframes(np.stack([left, right], axis=1).tobytes())
+    return output.getvalue()
+
+
+def test_buffer_round_trip_keeps_layout():
+    audio = _stereo_wav()
+    buffer = AudioBuffer.from_bytes(audio)
+
+    assert (buffer.frames, buffer.channels, buffer.sample_rate) == (800, 2, 8000)
+    assert buffer.samples.dtype == np.float32
+    assert buffer.mono().shape == (800,)
+    assert buffer.to_bytes() == audio
+
+
+def test_processor_decodes_and_encodes_once(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    output = processor.process(
+        wav_fixture_bytes, VoiceDNA.create_new("Buffer", "buffer"), {"force_age": 15}
+    )
+
+    assert processor.get_last_report()["audio_pipeline"] == {"decodes": 1, "encodes": 1}
+    assert all(item["status"] == "ok" for item in processor.get_last_report()["filters"])
+    assert AudioBuffer.from_bytes(output).frames > 0
+
+
+def test_legacy_filters_receive_bytes_between_buffer_filters(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    legacy = _BytesOnlyFilter()
+    processor.register_filter(legacy)
+
+    processor.process(wav_fixture_bytes, VoiceDNA.create_new("Mixed", "mixed"), {})
+
+    assert legacy.seen == [bytes]
+    assert processor.get_last_report()["audio_pipeline"] == {"decodes": 2, "encodes": 2}
+
+
+def test_buffer_filters_match_bytes_path(wav_fixture_bytes):
+    dna = VoiceDNA.create_new("Parity", "parity")
+    params = {"force_age": 20, "imprint_converter.consistency_enabled": False}
+    for filter_obj in (AgeMaturationFilter(), ImprintConverterFilter()):
+        via_bytes = AudioBuffer.from_bytes(
+            filter_obj.process(wav_fixture_bytes, dna, dict(params))
+        )
+        via_buffer = filter_obj.process_buffer(
+            AudioBuffer.from_bytes(wav_fixture_bytes), dna, dict(params)
+        )
+
+        assert via_buffer.frames == via_bytes.frames
+        assert np.max(np.abs(via_buffer.samples - via_bytes.samples)) < 1e-3
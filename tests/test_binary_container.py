@@ -0,0 +1,94 @@
+import json
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+from cryptography.fernet import Fernet
+from typer.testing import CliRunner
+
+import cli
+from voice_dna import BINARY_MAGIC, VoiceDNA, convert_to_binary, load_embedding_array
+
+
+def test_binary_roundtrip_plain_and_smaller_than_json(tmp_path):
+    dna = VoiceDNA.create_new("Binary voice", "binary")
+    json_path = tmp_path / "voice.voicedna.json"
+    bin_path = tmp_path / "voice.voicedna.bin"
+    dna.save(str(json_path))
+    dna.save_binary(str(bin_path))
+
+    loaded = VoiceDNA.load_binary(str(bin_path))
+
+    assert bin_path.read_bytes().startswith(BINARY_MAGIC)
+    assert bin_path.stat().st_size < json_path.stat().st_size
+    assert loaded.voice_fingerprint_id == dna.voice_fingerprint_id
+    assert np.allclose(loaded.core_embedding, dna.core_embedding, atol=1e-6)
+    assert VoiceDNA.load(str(bin_path)) == loaded
+
+
+def test_encrypted_binary_loads_through_load_encrypted(tmp_path):
+    dna = VoiceDNA.create_new("Binary voice", "binary")
+    path = tmp_path / "voice.voicedna.bin"
+    dna.save_binary(str(path), password="pw")
+
+    loaded = VoiceDNA.load_encrypted("pw", str(path))
+    embedding = load_embedding_array(str(path), password="pw")
+
+    assert loaded.voice_fingerprint_id == dna.voice_fingerprint_id
+    assert embedding.dtype == np.dtype("<f4")
+    assert np.allclose(embedding, dna.core_embedding, atol=1e-6)
+    with pytest.raises(ValueError):
+        VoiceDNA.load_binary(str(path))
+
+
+def test_plain_embedding_is_memory_mapped(tmp_path):
+    dna = VoiceDNA.create_new("Binary voice", "binary")
+    path = tmp_path / "voice.voicedna.bin"
+    dna.save_binary(str(path))
+
+    embedding = load_embedding_array(str(path))
+
+    assert isinstance(embedding, np.memmap)
+    assert embedding.shape == (len(dna.core_embedding),)
+
+
+def test_convert_voices_command_migrates_directory(tmp_path):
+    dna = VoiceDNA.create_new("Binary voice", "binary")
+    dna.save_encrypted("pw", str(tmp_path / "a.voicedna.enc"))
+    dna.save(str(tmp_path / "b.voicedna.json"))
+
+    result = CliRunner().invoke(
+        cli.app,
+        ["convert-voices", "--voices-dir", str(tmp_path), "--password", "pw"],
+    )
+
+    assert result.exit_code == 0, result.output
+    for name in ("a", "b"):
+        loaded = VoiceDNA.load_encrypted("pw", str(tmp_path / f"{name}.voicedna.bin"))
+        assert loaded.voice_fingerprint_id == dna.voice_fingerprint_id
+
+
+def test_convert_plain_json_without_password(tmp_path):
+    source = tmp_path / "c.json"
+    source.write_text(json.dumps(asdict(VoiceDNA.create_new("x", "y"))))
+
+    target = convert_to_binary(str(source), encrypt=False, remove_source=True)
+
+    assert target.name == "c.voicedna.bin"
+    assert not source.exists()
+    assert VoiceDNA.load(str(target)).imprint_source == "x"
+
+
+@pytest.mark.parametrize(
+    "salt", [b"{" + b"\x00" * 15, BINARY_MAGIC + bytes([1, 1, 0, 0]) + b"\x00" * 8]
+)
+def test_legacy_files_are_not_sniffed_from_their_salt(tmp_path, salt):
+    dna = VoiceDNA.create_new("Salted voice", "salt")
+    key, _ = VoiceDNA._derive_key("pw", salt)
+    source = tmp_path / "salted.voicedna.enc"
+    source.write_bytes(salt + Fernet(key).encrypt(json.dumps(asdict(dna)).encode()))
+
+    assert VoiceDNA.load_encrypted("pw", str(source)) == dna
+    target = convert_to_binary(str(source), password="pw")
+    converted = VoiceDNA.load_encrypted("pw", str(target))
+    assert converted.voice_fingerprint_id == dna.voice_fingerprint_id
@@ -0,0 +1,151 @@
+import json
+
+import numpy as np
+from typer.testing import CliRunner
+
+import cli
+from voice_dna import VoiceDNA
+from voicedna.consistency import (
+    VoiceConsistencyEngine,
+    _encode_wav_bytes,
+    cosine_similarity,
+)
+from voicedna.consistency_matrix import embed_wav_files, score_matrix
+
+VOWELS = [(730, 1090, 2440), (270, 2290, 3010), (300, 870, 2240), (530, 1840, 2480)]
+
+
+def _speak(f0, formant_scale, seed, seconds=1.5, sample_rate=16000):
+    rng = np.random.default_rng(seed)
+    segment = int(0.25 * sample_rate)
+    t = np.arange(segment) / sample_rate
+    harmonics = np.arange(1, int(4000 / f0))
+    pieces = []
+    for _ in range(int(seconds / 0.25)):
+        formants = np.array(VOWELS[rng.integers(len(VOWELS))]) * formant_scale
+        frequencies = harmonics * f0 * rng.uniform(0.95, 1.05)
+        gains = np.exp(
+            -(((frequencies[:, None] - formants[None, :]) / 120.0) ** 2)
+        ).sum(axis=1) / harmonics
+        pieces.append(gains @ np.sin(2 * np.pi * frequencies[:, None] * t[None, :]))
+    voice = np.concatenate(pieces)
+    return _encode_wav_bytes(sample_rate, 0.3 * voice / np.abs(voice).max() * 32767)
+
+
+def test_matrix_matches_pairwise_cosine_with_topk_and_checks():
+    rng = np.random.default_rng(4)
+    clips = rng.standard_normal((5, 256)).astype(np.float32)
+    voices = rng.standard_normal((3, 256)).astype(np.float32)
+    clips[0] = voices[1] + 0.01 * rng.standard_normal(256)
+
+    matrix = score_matrix(
+        clips, voices, [f"c{i}" for i in range(5)], ["a", "b", "c"], threshold=0.9
+    )
+
+    expected = [[cosine_similarity(clip, voice) for voice in voices] for clip in clips]
+    np.testing.assert_allclose(matrix.scores, expected, atol=1e-5)
+    assert matrix.top_k(2)[0][0][0] == "b"
+    assert matrix.above().sum() == 1 and matrix.above()[0, 1]
+    assert matrix.voice_summary()["b"]["accepted"] == 1
+    checks = {check["clip"]: check for check in matrix.verify({"c0": "b", "c1": "a"})}
+    assert checks["c0"]["passed"] and checks["c0"]["best_impostor"] in {"a", "c"}
+    assert not checks["c1"]["passed"]
+    assert score_matrix(clips, voices[:, :128]).scores.shape == (5, 3)
+
+
+def test_file_embeddings_are_batched_and_shared_with_the_engine(tmp_path):
+    paths = []
+    for index in range(5):
+        path = tmp_path / f"clip{index}.wav"
+        path.write_bytes(_speak(100 + 20 * index, 1.0, seed=index))
+        paths.append(path)
+    (tmp_path / "broken.wav").write_bytes(b"not audio")
+
+    clips = embed_wav_files(
+        [*paths, tmp_path / "broken.wav"], batch_size=2, workers=3
+    )
+
+    engine = VoiceConsistencyEngine()
+    assert clips.ids == [str(path) for path in paths]
+    assert list(clips.errors) == [str(tmp_path / "broken.wav")]
+    assert clips.backend == "numpy"
+    for row, path in enumerate(paths):
+        np.testing.assert_allclose(
+            clips.matrix[row],
+            engine.extract_embedding_from_audio(path.read_bytes()),
+            atol=1e-5,
+        )
+
+
+def test_cli_flags_clips_closer_to_an_impostor(tmp_path):
+    engine = VoiceConsistencyEngine()
+    store = tmp_path / "voices"
+    store.mkdir()
+    renders = tmp_path / "renders"
+    speakers = {"low": (110, 1.0), "high": (200, 1.15)}
+    for name, (f0, scale) in speakers.items():
+        reference = engine.extract_embedding_from_audio(_speak(f0, scale, seed=99))
+        dna = VoiceDNA.create_new(f"{name} imprint", name, core_embedding=reference)
+        dna.save_encrypted("pw", str(store / f"{name}.voicedna.enc"))
+        (renders / name).mkdir(parents=True)
+        for take in range(2):
+            (renders / name / f"{take}.wav").write_bytes(_speak(f0, scale, seed=take))
+    # Rendered as "low" but it sounds like "high".
+    (renders / "low" / "drifted.wav").write_bytes(_speak(200, 1.15, seed=7))
+    results = tmp_path / "matrix.jsonl"
+
+    outcome = CliRunner().invoke(
+        cli.app,
+        [
+            "consistency-matrix",
+            str(renders),
+            "--store-dir",
+            str(store),
+            "--password",
+            "pw",
+            "--threshold",
+            "0.6",
+            "--output-jsonl",
+            str(results),
+        ],
+    )
+
+    assert outcome.exit_code == 1, outcome.output
+    assert "4/5 owned clips passed" in outcome.output
+    records = {
+        json.loads(line)["path"]: json.loads(line)
+        for line in results.read_text(encoding="utf-8").splitlines()
+    }
+    drifted = records[str(renders / "low" / "drifted.wav")]
+    assert not drifted["passed"]
+    assert drifted["best_impostor"] == "high"
+    assert drifted["top"][0][0] == "high"
+
+
+def test_cli_refuses_clips_and_voices_from_different_backends(tmp_path):
+    store = tmp_path / "voices"
+    store.mkdir()
+    VoiceDNA.create_new("Voice imprint", "voice").save_encrypted(
+        "pw", str(store / "voice.voicedna.enc")
+    )
+    (tmp_path / "renders").mkdir()
+    (tmp_path / "renders" / "clip.wav").write_bytes(_speak(120, 1.0, seed=1))
+
+    outcome = CliRunner().invoke(
+        cli.app,
+        [
+            "consistency-matrix",
+            str(tmp_path / "renders"),
+            "--store-dir",
+            str(store),
+            "--password",
+            "pw",
+            "--backend",
+            "numpy",
+            "--voices-backend",
+            "speechbrain",
+        ],
+    )
+
+    assert outcome.exit_code == 2
+    assert "not comparable" in outcome.output
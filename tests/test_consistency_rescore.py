@@ -0,0 +1,121 @@
+import numpy as np
+
+import voicedna.consistency as consistency
+from voicedna.audio import AudioBuffer
+from voicedna.consistency import VoiceConsistencyEngine, _encode_wav_bytes
+from voicedna.embedding_cache import EmbeddingCache
+from voicedna.encoders import SpeakerEncoderPool
+
+
+def _tone(seconds=0.5, sample_rate=16000, amplitude=0.3, frequency=180):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    voice = amplitude * np.sin(2 * np.pi * frequency * t)
+    voice += 0.05 * np.sin(2 * np.pi * 900 * t)
+    return _encode_wav_bytes(sample_rate, (voice * 32767).astype(np.int16))
+
+
+def _voice(seconds=1.0, sample_rate=16000, pitch=150):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    voice = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 30))
+    voice = 0.1 * voice / np.abs(voice).max()
+    return _encode_wav_bytes(sample_rate, (voice * 32767).astype(np.int16))
+
+
+def _model_backend(monkeypatch, embedding):
+    calls = []
+
+    class _Encoder:
+        def embed_utterance(self, waveform):
+            calls.append(waveform.size)
+            return np.asarray(embedding, dtype=np.float32)
+
+    pool = SpeakerEncoderPool()
+    pool._loaders = {
+        "resemblyzer": lambda device: (_Encoder(), lambda wav, source_sr=None: wav),
+        "speechbrain": lambda device: (_ for _ in ()).throw(ImportError("missing")),
+    }
+    pool.warmup()
+    monkeypatch.setattr(consistency, "get_encoder_pool", lambda: pool)
+    monkeypatch.setattr(consistency, "get_embedding_cache", lambda: EmbeddingCache())
+    return calls
+
+
+def test_numpy_backend_rescores_corrected_audio_exactly(monkeypatch):
+    engine = VoiceConsistencyEngine(threshold=0.99)
+    core = engine.extract_embedding_from_imprint("rescore imprint", dims=256)
+    numpy_calls = []
+    embed = engine._embed_numpy
+
+    def _counting(waveform, sample_rate, dims):
+        numpy_calls.append(waveform.size)
+        return embed(waveform, sample_rate, dims)
+
+    monkeypatch.setattr(engine, "_embed_numpy", _counting)
+    monkeypatch.setattr(consistency, "get_embedding_cache", lambda: EmbeddingCache())
+    details = {}
+
+    output, score, _, corrected = engine.enforce_consistency(
+        _tone(), core, "vdna_rescore", details=details
+    )
+
+    assert corrected
+    assert details["rescore"] == "numpy"
+    assert details["proxy_drift"] is None
+    assert len(numpy_calls) == 2
+    assert score >= consistency.cosine_similarity(
+        embed(consistency._read_wav_bytes(_tone())[1] / 32768.0, 16000, 256), core
+    )
+    assert output[:4] == b"RIFF"
+
+
+def test_model_backend_skips_second_extraction_when_bound_is_conclusive(monkeypatch):
+    direction = np.zeros(256, dtype=np.float32)
+    direction[0] = 1.0
+    calls = _model_backend(monkeypatch, direction)
+    core = [0.0, 1.0] + [0.0] * 254
+    details = {}
+
+    _, score, rvc_ready, corrected = VoiceConsistencyEngine(
+        proxy_margin=2.0
+    ).enforce_consistency(_voice(), core, "vdna_proxy", details=details)
+
+    assert corrected and not rvc_ready
+    assert score == 0.0
+    assert details["rescore"] == "proxy"
+    assert details["proxy_drift"] < 0.1
+    assert len(calls) == 1
+
+
+def test_model_backend_always_extracts_again_without_proxy_margin(monkeypatch):
+    direction = np.zeros(256, dtype=np.float32)
+    direction[0] = 1.0
+    calls = _model_backend(monkeypatch, direction)
+    details = {}
+
+    VoiceConsistencyEngine().enforce_consistency(
+        _voice(), [0.0, 1.0] + [0.0] * 254, "vdna_exact", details=details
+    )
+
+    assert details["rescore"] == "full"
+    assert details["proxy_drift"] is None
+    assert len(calls) == 2
+
+
+def test_model_backend_extracts_again_when_bound_is_ambiguous(monkeypatch):
+    direction = np.zeros(256, dtype=np.float32)
+    direction[:2] = [0.9, np.sqrt(1 - 0.81)]
+    calls = _model_backend(monkeypatch, direction)
+    core = [1.0] + [0.0] * 255
+    engine = VoiceConsistencyEngine(threshold=0.92, proxy_margin=10.0)
+    details = {}
+
+    buffer = AudioBuffer.from_bytes(_tone(amplitude=0.9, frequency=100))
+    _, score, _, corrected = engine.enforce_consistency_buffer(
+        buffer, core, "vdna_full", details=details
+    )
+
+    assert corrected
+    assert abs(score - 0.9) < 1e-6
+    assert details["rescore"] == "full"
+    assert details["proxy_drift"] > 0.002
+    assert len(calls) == 2
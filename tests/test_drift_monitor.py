@@ -0,0 +1,118 @@
+import json
+
+from voice_dna import VoiceDNA
+from voicedna.drift import DriftMonitor, get_drift_monitor
+from voicedna.framework import VoiceDNAProcessor
+
+
+def test_callbacks_fire_on_state_changes_only():
+    monitor = DriftMonitor(alpha=0.5, window=4, warmup=3, drop_threshold=0.05)
+    events = []
+    monitor.on_drift(events.append)
+
+    for score in (0.97, 0.96, 0.98, 0.97, 0.97):
+        monitor.observe("vdna_a", score, threshold=0.9)
+    assert monitor.stats("vdna_a")["state"] == "stable"
+    assert monitor.stats("vdna_a")["baseline"] == 0.97
+
+    for score in (0.91, 0.91, 0.91):
+        monitor.observe("vdna_a", score, threshold=0.9)
+    for score in (0.8, 0.8):
+        monitor.observe("vdna_a", score, threshold=0.9)
+    for score in (0.97,) * 6:
+        monitor.observe("vdna_a", score, threshold=0.9)
+
+    assert [(event.previous, event.state) for event in events] == [
+        ("stable", "drifting"),
+        ("drifting", "below_threshold"),
+        ("below_threshold", "drifting"),
+        ("drifting", "stable"),
+    ]
+    stats = monitor.stats("vdna_a")
+    assert stats["count"] == 16 and stats["window_mean"] == 0.97
+    assert len(monitor._voices["vdna_a"].recent) == 4
+    assert monitor.stats("vdna_missing") is None
+
+
+def test_state_file_round_trips(tmp_path):
+    path = tmp_path / "drift.json"
+    monitor = DriftMonitor(warmup=2, state_path=path, save_interval=3600)
+    for score in (0.95, 0.93, 0.94):
+        monitor.observe("vdna_b", score, threshold=0.9)
+    monitor.save()
+
+    restored = DriftMonitor(warmup=2, state_path=path)
+
+    assert restored.snapshot() == monitor.snapshot()
+    assert json.loads(path.read_text())["voices"]["vdna_b"]["count"] == 3
+    restored.observe("vdna_b", 0.95)
+    assert restored.stats("vdna_b")["count"] == 4
+    path.write_text("not json")
+    assert DriftMonitor(state_path=path).snapshot() == {}
+
+
+def test_processor_reports_rolling_drift(wav_fixture_bytes):
+    dna = VoiceDNA.create_new("Drift imprint", "drift")
+    processor = VoiceDNAProcessor()
+    get_drift_monitor().reset(dna.voice_fingerprint_id)
+
+    for _ in range(2):
+        processor.process(wav_fixture_bytes, dna, {})
+    drift = processor.get_last_report()["imprint_converter"]["identity_drift"]
+
+    assert drift["count"] == 2 and drift["state"] == "warming"
+    assert drift["threshold"] == 0.92
+    processor.process(
+        wav_fixture_bytes, dna, {"imprint_converter.drift_monitor": False}
+    )
+    assert processor.get_last_report()["imprint_converter"]["identity_drift"] is None
+    assert get_drift_monitor().stats(dna.voice_fingerprint_id)["count"] == 2
+
+
+def test_writers_sharing_a_state_file_keep_each_others_voices(tmp_path):
+    path = tmp_path / "drift.json"
+    first = DriftMonitor(warmup=2, state_path=path, save_interval=3600)
+    second = DriftMonitor(warmup=2, state_path=path, save_interval=3600)
+    first.observe("vdna_first", 0.95)
+    second.observe("vdna_second", 0.94)
+    assert not path.exists()
+
+    assert first.save() and second.save()
+    second.observe("vdna_first", 0.5)
+    first.reset("vdna_second")
+    second.save()
+    first.save()
+
+    voices = json.loads(path.read_text())["voices"]
+    assert set(voices) == {"vdna_first"}
+    assert voices["vdna_first"]["count"] == 2
+    assert first.stats("vdna_first")["last"] == 0.5
+
+
+def test_writers_observing_the_same_voice_combine_their_scores(tmp_path):
+    path = tmp_path / "drift.json"
+    first = DriftMonitor(alpha=0.5, warmup=2, state_path=path, save_interval=3600)
+    second = DriftMonitor(alpha=0.5, warmup=2, state_path=path, save_interval=3600)
+    for score in (0.95, 0.96, 0.95):
+        first.observe("vdna_shared", score, threshold=0.9)
+    for score in (0.7, 0.7):
+        second.observe("vdna_shared", score, threshold=0.9)
+
+    first.save()
+    second.save()
+    first.observe("vdna_shared", 0.7)
+    first.save()
+
+    stats = first.stats("vdna_shared")
+    assert stats["count"] == 6
+    assert stats["min"] == 0.7 and stats["baseline"] == 0.955
+    assert stats["state"] == "below_threshold"
+    assert json.loads(path.read_text())["voices"]["vdna_shared"]["count"] == 6
+    assert second.stats("vdna_shared")["count"] == 5
+
+
+def test_default_monitor_keeps_state_in_memory(monkeypatch):
+    monkeypatch.delenv("VOICEDNA_DRIFT_MONITOR", raising=False)
+    assert DriftMonitor.from_env().state_path is None
+    monkeypatch.setenv("VOICEDNA_DRIFT_MONITOR", "disk")
+    assert DriftMonitor.from_env().state_path is not None
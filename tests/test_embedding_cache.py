@@ -0,0 +1,82 @@
+import voicedna.consistency as consistency
+import voicedna.encoders as encoders
+from voice_dna import VoiceDNA
+from voicedna.consistency import VoiceConsistencyEngine
+from voicedna.embedding_cache import EmbeddingCache, audio_content_hash
+from voicedna.encoders import SpeakerEncoderPool
+from voicedna.framework import VoiceDNAProcessor
+
+
+def test_memory_and_disk_tiers(tmp_path):
+    key = EmbeddingCache.make_key("abc", "resemblyzer", "v1", 4)
+    first = EmbeddingCache(disk_dir=tmp_path)
+    first.put(key, [0.5, 0.25, 0.0, -1.0], backend="resemblyzer")
+
+    assert first.get(key) == [0.5, 0.25, 0.0, -1.0]
+    assert first.stats()["memory_hits"] == 1
+
+    second = EmbeddingCache(disk_dir=tmp_path)
+    assert second.get(key) == [0.5, 0.25, 0.0, -1.0]
+    assert second.stats()["disk_hits"] == 1
+    assert second.get(EmbeddingCache.make_key("abc", "resemblyzer", "v1", 8)) is None
+    assert second.stats()["misses"] == 1
+
+
+def test_bounded_eviction(tmp_path):
+    cache = EmbeddingCache(max_entries=2, disk_dir=tmp_path, max_disk_bytes=40)
+    keys = [EmbeddingCache.make_key(str(index), "speechbrain", "v", 4) for index in range(4)]
+    for key in keys:
+        cache.put(key, [1.0, 2.0, 3.0, 4.0], backend="speechbrain")
+
+    assert cache.stats()["entries"] == 2
+    assert len(list(tmp_path.rglob("*.f32"))) <= 2
+    assert cache.get(keys[-1]) is not None
+
+
+def test_engine_reuses_cached_embedding(monkeypatch, wav_fixture_bytes):
+    cache = EmbeddingCache()
+    calls = []
+    monkeypatch.setattr(consistency, "get_embedding_cache", lambda: cache)
+    engine = VoiceConsistencyEngine()
+    original = engine._extract_with_numpy
+
+    def _counting(audio_bytes, dims):
+        calls.append(audio_content_hash(audio_bytes))
+        return original(audio_bytes, dims)
+
+    monkeypatch.setattr(engine, "_extract_with_numpy", _counting)
+
+    first = engine.extract_embedding_from_audio(wav_fixture_bytes)
+    second = engine.extract_embedding_from_audio(wav_fixture_bytes)
+
+    assert first == second
+    assert len(calls) == 1
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_processor_report_exposes_cache_counters(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    processor.process(wav_fixture_bytes, VoiceDNA.create_new("Cache", "cache"), {})
+
+    stats = processor.get_last_report()["embedding_cache"]
+    assert {"memory_hits", "disk_hits", "misses", "hit_ratio"} <= set(stats)
+
+
+def test_overwrites_and_version_lookups_are_cheap(tmp_path, monkeypatch):
+    cache = EmbeddingCache(disk_dir=tmp_path)
+    key = EmbeddingCache.make_key("abc", "speechbrain", "v1", 4)
+    for _ in range(3):
+        cache.put(key, [1.0, 2.0, 3.0, 4.0], backend="speechbrain")
+    assert cache.stats()["disk_bytes"] == 16
+
+    lookups = []
+    monkeypatch.setattr(
+        encoders.metadata, "version", lambda package: lookups.append(package) or "1"
+    )
+    encoders._package_version.cache_clear()
+    pool = SpeakerEncoderPool()
+    versions = {pool.model_version("resemblyzer") for _ in range(5)}
+    encoders._package_version.cache_clear()
+
+    assert versions == {"resemblyzer@1"}
+    assert lookups == ["resemblyzer"]
@@ -0,0 +1,76 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import voicedna.consistency as consistency
+from voicedna.consistency import VoiceConsistencyEngine
+from voicedna.encoders import SpeakerEncoderPool
+
+
+class _FakeEncoder:
+    def embed_utterance(self, waveform):
+        return np.ones(256, dtype=np.float32)
+
+
+def _fake_pool(load_calls, idle_seconds=0.0):
+    pool = SpeakerEncoderPool(idle_seconds=idle_seconds)
+
+    def _load(device):
+        load_calls.append(device)
+        time.sleep(0.01)
+        return _FakeEncoder(), lambda waveform, source_sr=None: waveform
+
+    def _missing(device):
+        raise ImportError("speechbrain not installed")
+
+    pool._loaders = {"resemblyzer": _load, "speechbrain": _missing}
+    return pool
+
+
+def test_pool_loads_each_backend_once_across_threads():
+    calls = []
+    pool = _fake_pool(calls)
+
+    threads = [threading.Thread(target=pool.resemblyzer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["cpu"]
+    assert pool.stats()["loaded"] == ["resemblyzer"]
+
+
+def test_pool_remembers_unavailable_backends():
+    pool = _fake_pool([])
+
+    assert pool.warmup() == {"resemblyzer": True, "speechbrain": False}
+    assert not pool.is_available("speechbrain")
+    with pytest.raises(RuntimeError):
+        pool.speechbrain()
+    assert pool.available_backends() == ["resemblyzer"]
+
+
+def test_pool_unloads_idle_models():
+    calls = []
+    pool = _fake_pool(calls, idle_seconds=5.0)
+    pool.resemblyzer()
+
+    assert pool.unload_idle(now=time.monotonic() + 10.0) == ["resemblyzer"]
+    pool.resemblyzer()
+    assert len(calls) == 2
+
+
+def test_consistency_engine_uses_shared_pool(monkeypatch, wav_fixture_bytes):
+    calls = []
+    pool = _fake_pool(calls)
+    monkeypatch.setattr(consistency, "get_encoder_pool", lambda: pool)
+
+    engine = VoiceConsistencyEngine()
+    for _ in range(3):
+        embedding = engine.extract_embedding_from_audio(wav_fixture_bytes)
+
+    assert calls == ["cpu"]
+    assert embedding == [1.0] * 256
@@ -0,0 +1,55 @@
+import numpy as np
+
+from voice_dna import VoiceDNA
+from voicedna.consistency import ConsistencyEnginePool, _encode_wav_bytes
+from voicedna.filters import ImprintConverterFilter
+from voicedna.watermark import get_watermark_cache
+
+
+def _clip(seconds=0.5, sample_rate=16000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return _encode_wav_bytes(sample_rate, 0.3 * np.sin(2 * np.pi * 180 * t) * 32767)
+
+
+def test_filter_reuses_one_engine_per_configuration():
+    dna = VoiceDNA.create_new("Pooled", "pooled")
+    converter = ImprintConverterFilter()
+
+    for _ in range(3):
+        converter.process(_clip(), dna, {})
+    converter.process(_clip(), dna, {"imprint_converter.consistency_threshold": 0.8})
+    converter.process(_clip(), dna, {"imprint_converter.watermark_depth": 0.004})
+
+    assert converter.engines.stats() == {"engines": 3, "hits": 2, "misses": 3}
+    assert converter.engines.get(threshold=0.8).threshold == 0.8
+    assert converter.engines.get(watermark_depth=0.004).watermark_depth == 0.004
+
+
+def test_warmup_pins_carriers_past_cache_eviction():
+    converter = ImprintConverterFilter()
+    warmed = converter.warmup(
+        voice_fingerprint_ids=["vdna_agent_a", "vdna_agent_b"],
+        sample_rates=(16000, 22050),
+        encoders=False,
+    )
+    engine = converter.engines.get()
+    pinned = engine.watermark_pattern("vdna_agent_a", 22050)
+    get_watermark_cache().clear()
+
+    assert warmed == {"encoders": {}, "pinned_carriers": 4}
+    assert engine.watermark_pattern("vdna_agent_a", 22050) is pinned
+    assert get_watermark_cache().stats()["misses"] == 0
+
+
+def test_pool_evicts_least_recently_used_engine():
+    pool = ConsistencyEnginePool(max_engines=2)
+
+    first = pool.get(threshold=0.9)
+    pool.get(threshold=0.8)
+    assert pool.get(threshold=0.9) is first
+    pool.get(threshold=0.7)
+
+    assert pool.get(threshold=0.9) is first
+    assert pool.stats() == {"engines": 2, "hits": 2, "misses": 3}
+    pool.get(threshold=0.8)
+    assert pool.stats()["misses"] == 4
@@ -0,0 +1,165 @@
+import json
+import wave
+
+import numpy as np
+from typer.testing import CliRunner
+
+import cli
+from voice_dna import VoiceDNA
+from voicedna.enrollment import BatchEnroller, load_jobs
+
+
+def _write_wav(path, frequency, seconds=0.5, sample_rate=16000):
+    times = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = 0.3 * np.sin(2 * np.pi * frequency * times)
+    with wave.open(str(path), "wb") as wave_file:
+        wave_file.setnchannels(1)
+        wave_file.setsampwidth(2)
+        wave_file.setframerate(sample_rate)
+        wave_file.writeframes((samples * 32767).astype("<i2").tobytes())
+    return path
+
+
+def test_manifest_formats_resolve_relative_paths(tmp_path):
+    (tmp_path / "clips").mkdir()
+    _write_wav(tmp_path / "clips" / "ada.wav", 200)
+    (tmp_path / "voices.csv").write_text("audio,voice_name,user\nclips/ada.wav,Ada Voice,ada\n")
+    (tmp_path / "voices.jsonl").write_text(json.dumps({"audio": "clips/ada.wav"}) + "\n")
+
+    csv_jobs = load_jobs(tmp_path / "voices.csv")
+    jsonl_jobs = load_jobs(tmp_path / "voices.jsonl")
+
+    assert csv_jobs[0].audio_path == tmp_path / "clips" / "ada.wav"
+    assert (csv_jobs[0].voice_name, csv_jobs[0].user) == ("Ada Voice", "ada")
+    assert jsonl_jobs[0].voice_name == "ada"
+    assert [job.voice_name for job in load_jobs(tmp_path / "clips")] == ["ada"]
+
+
+def test_batch_enrollment_creates_and_resumes(tmp_path):
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    for index, frequency in enumerate((150, 220, 330)):
+        _write_wav(clips / f"speaker_{index}.wav", frequency)
+    progress = []
+    enroller = BatchEnroller(
+        output_dir=tmp_path / "voices",
+        password="pw",
+        batch_size=2,
+        encrypt_workers=0,
+        on_progress=lambda result, done, total: progress.append((done, total)),
+    )
+
+    results = enroller.run(load_jobs(clips))
+
+    assert [result.status for result in results] == ["created"] * 3
+    assert progress[-1] == (3, 3)
+    loaded = VoiceDNA.load_encrypted("pw", results[0].output_path)
+    assert loaded.voice_fingerprint_id == results[0].fingerprint
+    assert len(loaded.core_embedding) == 256
+
+    (tmp_path / "voices" / "speaker_1.voicedna.enc").unlink()
+    rerun = enroller.run(load_jobs(clips))
+    assert sorted(result.status for result in rerun) == ["created", "skipped", "skipped"]
+
+
+def test_enroll_batch_cli_uses_process_pool(tmp_path):
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    _write_wav(clips / "one.wav", 180)
+    _write_wav(clips / "two.wav", 260)
+    summary_path = tmp_path / "summary.json"
+
+    result = CliRunner().invoke(
+        cli.app,
+        [
+            "enroll-batch",
+            str(clips),
+            "--password",
+            "pw",
+            "--voices-dir",
+            str(tmp_path / "voices"),
+            "--binary",
+            "--encrypt-workers",
+            "2",
+            "--summary-json",
+            str(summary_path),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(summary_path.read_text())
+    assert summary["created"] == 2
+    assert all(entry["encrypt_seconds"] > 0 for entry in summary["files"])
+    VoiceDNA.load_binary(str(tmp_path / "voices" / "two.voicedna.bin"), password="pw")
+
+
+def test_batches_go_through_pooled_encoder_and_cache(tmp_path, monkeypatch):
+    import voicedna.consistency as consistency
+    import voicedna.enrollment as enrollment
+    from voicedna.embedding_cache import EmbeddingCache, file_content_hash
+    from voicedna.encoders import SpeakerEncoderPool
+
+    calls = []
+
+    class _Encoder:
+        def embed_utterance(self, waveform):
+            calls.append(waveform.size)
+            return np.full(256, float(np.std(waveform)), dtype=np.float32)
+
+    pool = SpeakerEncoderPool()
+    pool._loaders = {
+        "resemblyzer": lambda device: (_Encoder(), lambda wav, source_sr=None: wav),
+        "speechbrain": lambda device: (_ for _ in ()).throw(ImportError("missing")),
+    }
+    pool.warmup()
+    cache = EmbeddingCache()
+    monkeypatch.setattr(consistency, "get_encoder_pool", lambda: pool)
+    monkeypatch.setattr(enrollment, "get_encoder_pool", lambda: pool)
+    monkeypatch.setattr(enrollment, "get_embedding_cache", lambda: cache)
+
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    for index in range(3):
+        _write_wav(clips / f"v{index}.wav", 100 + 50 * index)
+
+    first = BatchEnroller(tmp_path / "a", password="pw", encrypt_workers=0)
+    assert {result.backend for result in first.run(load_jobs(clips))} == {"resemblyzer"}
+    second = BatchEnroller(tmp_path / "b", password="pw", encrypt_workers=0)
+    second.run(load_jobs(clips))
+
+    assert len(calls) == 3
+    assert cache.stats()["memory_hits"] == 3
+    # Imprint extraction decodes differently, so it must not reuse these.
+    imprint_key = cache.make_key(
+        file_content_hash(clips / "v0.wav"),
+        "imprint:resemblyzer",
+        pool.model_version("resemblyzer"),
+        256,
+    )
+    assert cache.get(imprint_key) is None
+
+
+def test_streamed_recordings_are_hashed_without_reading_them_whole(
+    tmp_path, monkeypatch
+):
+    import pathlib
+
+    import voicedna.enrollment as enrollment
+    from voicedna.embedding_cache import audio_content_hash
+
+    clip = _write_wav(tmp_path / "long.wav", 150)
+    expected = audio_content_hash(clip.read_bytes())
+    read_bytes = pathlib.Path.read_bytes
+
+    def _guarded(path):
+        assert path != clip, "streamed recording read into memory"
+        return read_bytes(path)
+
+    monkeypatch.setattr(enrollment, "should_stream", lambda path: True)
+    monkeypatch.setattr(pathlib.Path, "read_bytes", _guarded)
+    job = load_jobs(tmp_path)[0]
+
+    decoded = BatchEnroller(tmp_path / "out", password="pw")._decode(job)
+
+    assert decoded.error == "" and decoded.waveform is None
+    assert decoded.content_hash == expected
@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+from cryptography.fernet import InvalidToken
+
+import voice_dna
+from voice_dna import DerivedKeyCache, VoiceDNA
+
+
+@pytest.fixture()
+def counted_kdf(monkeypatch):
+    calls = {"count": 0}
+    original = VoiceDNA._derive_key
+
+    def _counting(password, salt=None):
+        calls["count"] += 1
+        return original(password, salt)
+
+    monkeypatch.setattr(VoiceDNA, "_derive_key", staticmethod(_counting))
+    monkeypatch.setattr(voice_dna, "KEY_CACHE", DerivedKeyCache())
+    return calls
+
+
+def test_repeated_load_skips_kdf(tmp_path, counted_kdf):
+    path = tmp_path / "voice.voicedna.enc"
+    VoiceDNA.create_new("Cached voice", "cache").save_encrypted("pw", str(path))
+    voice_dna.KEY_CACHE.wipe()
+    counted_kdf["count"] = 0
+
+    first = VoiceDNA.load_encrypted("pw", str(path))
+    second = VoiceDNA.load_encrypted("pw", str(path))
+
+    assert first == second
+    assert counted_kdf["count"] == 1
+    assert voice_dna.KEY_CACHE.stats()["hits"] == 1
+
+
+def test_wrong_password_is_not_cached(tmp_path, counted_kdf):
+    path = tmp_path / "voice.voicedna.enc"
+    VoiceDNA.create_new("Cached voice", "cache").save_encrypted("pw", str(path))
+    counted_kdf["count"] = 0
+
+    for _ in range(2):
+        with pytest.raises(InvalidToken):
+            VoiceDNA.load_encrypted("wrong", str(path))
+    assert counted_kdf["count"] == 2
+
+
+def test_wipe_forces_rederive(tmp_path, counted_kdf):
+    path = tmp_path / "voice.voicedna.enc"
+    VoiceDNA.create_new("Cached voice", "cache").save_encrypted("pw", str(path))
+    counted_kdf["count"] = 0
+
+    VoiceDNA.load_encrypted("pw", str(path))
+    VoiceDNA.clear_key_cache()
+    VoiceDNA.load_encrypted("pw", str(path))
+
+    assert counted_kdf["count"] == 1
+    assert voice_dna.KEY_CACHE.stats()["entries"] == 1
+
+
+def test_session_token_shared_between_caches(tmp_path):
+    session = tmp_path / "session.json"
+    salt = b"0" * 16
+    key, _ = VoiceDNA._derive_key("pw", salt)
+
+    DerivedKeyCache(session_path=str(session)).put("pw", salt, key)
+    fresh = DerivedKeyCache(session_path=str(session))
+
+    assert session.stat().st_mode & 0o077 == 0
+    assert fresh.get("pw", salt) == key
+    assert fresh.get("other", salt) is None
+
+    fresh.wipe()
+    assert not session.exists()
+
+
+def test_expired_entries_are_evicted():
+    cache = DerivedKeyCache(max_entries=1, ttl_seconds=-1.0)
+    assert not cache.enabled
+
+    cache = DerivedKeyCache(max_entries=1)
+    cache.put("a", b"1" * 16, b"k" * 44)
+    cache.put("b", b"2" * 16, b"k" * 44)
+    assert cache.get("a", b"1" * 16) is None
+    assert cache.get("b", b"2" * 16) == b"k" * 44
+
+
+def test_session_writes_merge_across_writers(tmp_path):
+    session = tmp_path / "session.json"
+    salts = [bytes([index]) * 16 for index in range(8)]
+    key, _ = VoiceDNA._derive_key("pw", salts[0])
+    writers = [DerivedKeyCache(session_path=str(session)) for _ in salts]
+
+    threads = [
+        threading.Thread(target=writer.put, args=("pw", salt, key))
+        for writer, salt in zip(writers, salts)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    written = session.stat().st_mtime_ns
+    writers[0].put("pw", salts[0], key)
+
+    fresh = DerivedKeyCache(session_path=str(session))
+    assert all(fresh.get("pw", salt) == key for salt in salts)
+    assert session.stat().st_mtime_ns == written
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,73 @@
+from voice_dna import VoiceDNA
+from voicedna.framework import VoiceDNAProcessor
+from voicedna.plugins.base import IVoiceDNAFilter
+
+
+class _SlowOptionalFilter(IVoiceDNAFilter):
+    thread_safe = True
+    optional = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def name(self) -> str:
+        return "slow_optional"
+
+    def priority(self) -> int:
+        return 30
+
+    def process(self, audio_bytes, dna, params):
+        self.calls += 1
+        return audio_bytes
+
+    def estimate_cost_ms(self, params, audio_seconds):
+        return 5000.0
+
+
+def test_tight_budget_degrades_consistency_but_keeps_watermark(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Budget", "budget")
+
+    result = processor.process_with_report(wav_fixture_bytes, dna, {}, budget_ms=0.01)
+
+    budget = result.report["budget"]
+    assert budget["degraded"] == [
+        "ImprintConverter.parametric_correction",
+        "ImprintConverter.consistency_scoring",
+    ]
+    assert budget["skipped"] == []
+    assert result.report["consistency_score"] is None
+    assert result.report["imprint_converter"]["watermark_applied"]
+    assert [entry["status"] for entry in result.report["filters"]] == ["ok", "ok"]
+
+
+def test_optional_filter_is_skipped_only_when_over_budget(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    slow = _SlowOptionalFilter()
+    processor.register_filter(slow)
+    dna = VoiceDNA.create_new("Optional", "optional")
+
+    unbounded = processor.process_with_report(wav_fixture_bytes, dna, {})
+    bounded = processor.process_with_report(
+        wav_fixture_bytes, dna, {"latency_budget_ms": 300}
+    )
+
+    assert unbounded.report["budget"] is None
+    assert slow.calls == 1
+    assert bounded.report["budget"]["skipped"] == ["slow_optional"]
+    skipped = [e for e in bounded.report["filters"] if e["name"] == "slow_optional"]
+    assert skipped[0]["status"] == "skipped"
+    assert skipped[0]["reason"] == "latency_budget"
+
+
+def test_rvc_is_downgraded_to_simple_mix(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Rvc", "rvc")
+
+    result = processor.process_with_report(
+        wav_fixture_bytes, dna, {"imprint_converter.mode": "rvc"}, budget_ms=20
+    )
+
+    assert result.report["budget"]["degraded"][0] == "ImprintConverter.rvc"
+    assert result.report["imprint_converter"]["mode"] == "simple"
+    assert result.report["audio_pipeline"]["decodes"] == 1
@@ -0,0 +1,75 @@
+import numpy as np
+
+from voicedna.consistency import VoiceConsistencyEngine, cosine_similarity
+from voicedna.features import (
+    EMBEDDING_DIMS,
+    dct_matrix,
+    mel_filterbank,
+    speaker_embedding,
+    speaker_embeddings,
+)
+
+VOWELS = [(730, 1090, 2440), (270, 2290, 3010), (300, 870, 2240), (530, 1840, 2480)]
+
+
+def _speak(f0, formant_scale, seed, seconds=2.0, sample_rate=16000):
+    """Harmonic source shaped by a vowel's formants, changing vowel every 250 ms."""
+    rng = np.random.default_rng(seed)
+    segment = int(0.25 * sample_rate)
+    t = np.arange(segment) / sample_rate
+    harmonics = np.arange(1, int(4000 / f0))
+    pieces = []
+    for _ in range(int(seconds / 0.25)):
+        formants = np.array(VOWELS[rng.integers(len(VOWELS))]) * formant_scale
+        pitch = f0 * rng.uniform(0.95, 1.05)
+        frequencies = harmonics * pitch
+        gains = np.exp(
+            -(((frequencies[:, None] - formants[None, :]) / 120.0) ** 2)
+        ).sum(axis=1) / harmonics
+        pieces.append(gains @ np.sin(2 * np.pi * frequencies[:, None] * t[None, :]))
+    voice = np.concatenate(pieces)
+    voice = 0.3 * voice / np.abs(voice).max()
+    return (voice + 0.001 * rng.standard_normal(voice.size)).astype(np.float32)
+
+
+def test_filterbank_and_dct_are_cached_read_only():
+    bank = mel_filterbank(16000, 512)
+    dct = dct_matrix()
+
+    assert mel_filterbank(16000, 512) is bank
+    assert bank.shape == (257, 80) and not bank.flags.writeable
+    assert np.all(bank.sum(axis=0) > 0)
+    np.testing.assert_allclose(dct.T @ dct, np.eye(32), atol=1e-5)
+
+
+def test_batch_matches_single_clips_and_ignores_level():
+    voice = _speak(120, 1.0, seed=1)
+    clips = [(voice, 16000), (voice[::2].copy(), 8000), (voice * 0.1, 16000)]
+
+    batch = speaker_embeddings(clips)
+    single = [speaker_embedding(waveform, rate) for waveform, rate in clips]
+
+    np.testing.assert_allclose(batch, single, atol=1e-4)
+    assert len(batch[0]) == EMBEDDING_DIMS
+    assert cosine_similarity(batch[0], batch[2]) > 0.99
+    assert speaker_embeddings([(np.zeros(0), 16000)], dims=64) == [[0.0] * 64]
+
+
+def test_same_voice_scores_above_other_voices():
+    engine = VoiceConsistencyEngine()
+    voices = [(110, 1.0), (190, 1.15), (150, 0.9)]
+    embeddings = {
+        (index, take): engine.embed_waveform(
+            _speak(f0, scale, seed=10 * index + take), 16000
+        )
+        for index, (f0, scale) in enumerate(voices)
+        for take in range(2)
+    }
+
+    for index in range(len(voices)):
+        same = cosine_similarity(embeddings[(index, 0)], embeddings[(index, 1)])
+        for other in range(len(voices)):
+            if other != index:
+                assert same > cosine_similarity(
+                    embeddings[(index, 0)], embeddings[(other, 1)]
+                ) + 0.1
@@ -0,0 +1,102 @@
+import threading
+import time
+from importlib import metadata
+
+from typer.testing import CliRunner
+
+import cli
+import voicedna.plugins.registry as registry_module
+from voicedna.framework import VoiceDNAProcessor
+from voicedna.plugins.registry import PluginRegistry
+
+
+def _fake_entry_points(calls):
+    def _entry_points(group=None):
+        calls.append(group)
+        if group != "voicedna.plugins":
+            return []
+        return [
+            metadata.EntryPoint(
+                name="prompt_tag",
+                value="voicedna.plugins.builtin:PromptTagFilter",
+                group=group,
+            ),
+            metadata.EntryPoint(
+                name="broken", value="voicedna_missing_module:Filter", group=group
+            ),
+        ]
+
+    return _entry_points
+
+
+def test_discovery_is_cached_and_imports_are_lazy(monkeypatch):
+    calls = []
+    registry = PluginRegistry()
+    monkeypatch.setattr(registry_module.metadata, "entry_points", _fake_entry_points(calls))
+    monkeypatch.setattr(registry_module, "PLUGIN_REGISTRY", registry)
+
+    first = VoiceDNAProcessor()
+    second = VoiceDNAProcessor()
+
+    assert len(calls) == 2
+    assert not any(entry["loaded"] for entry in registry.stats())
+
+    assert "prompt_tag" in second.get_filter_names()
+    assert "prompt_tag" in first.get_filter_names()
+    stats = {entry["name"]: entry for entry in registry.stats()}
+    assert stats["prompt_tag"]["loaded"] and stats["prompt_tag"]["import_ms"] >= 0
+    assert stats["broken"]["error"].startswith("ModuleNotFoundError")
+
+
+def test_environment_change_triggers_rediscovery(monkeypatch):
+    calls = []
+    registry = PluginRegistry()
+    environment = [(("site-packages", 1),)]
+    monkeypatch.setattr(registry_module.metadata, "entry_points", _fake_entry_points(calls))
+    monkeypatch.setattr(registry_module, "_environment_key", lambda: environment[0])
+
+    registry.specs("voicedna.plugins")
+    registry.specs("voicedna.plugins")
+    environment[0] = (("site-packages", 2),)
+    registry.specs("voicedna.plugins")
+
+    assert registry.discoveries == 2
+
+
+def test_plugins_command_lists_import_times(monkeypatch):
+    registry = PluginRegistry()
+    monkeypatch.setattr(registry_module.metadata, "entry_points", _fake_entry_points([]))
+    monkeypatch.setattr(registry_module, "PLUGIN_REGISTRY", registry)
+
+    result = CliRunner().invoke(cli.app, ["plugins"])
+
+    assert result.exit_code == 0, result.output
+    assert "prompt_tag" in result.output
+    assert "failed (ModuleNotFoundError" in result.output
+
+
+def test_concurrent_first_use_waits_for_plugins(monkeypatch):
+    registry = PluginRegistry()
+    monkeypatch.setattr(registry_module.metadata, "entry_points", _fake_entry_points([]))
+    monkeypatch.setattr(registry_module, "PLUGIN_REGISTRY", registry)
+    loading = threading.Event()
+    original_load = registry.load
+
+    def _slow_load(spec):
+        loading.set()
+        time.sleep(0.2)
+        return original_load(spec)
+
+    monkeypatch.setattr(registry, "load", _slow_load)
+    processor = VoiceDNAProcessor()
+    names = {}
+    first = threading.Thread(
+        target=lambda: names.setdefault("first", processor.get_filter_names())
+    )
+    first.start()
+    loading.wait(timeout=5)
+    names["second"] = processor.get_filter_names()
+    first.join()
+
+    assert "prompt_tag" in names["first"]
+    assert "prompt_tag" in names["second"]
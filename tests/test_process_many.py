@@ -0,0 +1,88 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from voice_dna import VoiceDNA
+from voicedna.framework import BatchProcessPool, BatchResult, VoiceDNAProcessor
+
+
+def test_thread_batch_keeps_order_and_per_item_params(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Batch", "batch")
+    ages = [6, 12, 18, 24]
+
+    batch = processor.process_many(
+        [wav_fixture_bytes] * len(ages),
+        dna,
+        params=[{"force_age": age} for age in ages],
+        max_workers=3,
+    )
+
+    assert isinstance(batch, BatchResult)
+    for age, result in zip(ages, batch.results):
+        expected = max(0.5, min(1.25, 1.0 - (age - 5) * 0.015))
+        assert result.params["age_maturation.pitch_factor"] == expected
+        assert result.audio
+    assert batch.stats["items"] == 4
+    assert batch.stats["errors"] == 0
+    assert batch.stats["audio_seconds"] > 0
+    assert batch.stats["items_per_second"] > 0
+
+
+def test_failed_items_are_reported_in_place(wav_fixture_bytes, monkeypatch):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Broken", "broken")
+    original = processor.process_with_report
+
+    def _flaky(audio_bytes, dna, params=None, result=None):
+        if params.get("explode"):
+            raise RuntimeError("boom")
+        return original(audio_bytes, dna, params, result)
+
+    monkeypatch.setattr(processor, "process_with_report", _flaky)
+    batch = processor.process_many(
+        [wav_fixture_bytes] * 3, dna, params=[{}, {"explode": True}, {}]
+    )
+
+    assert [bool(result.audio) for result in batch.results] == [True, False, True]
+    assert batch.results[1].report == {"status": "error", "error": "boom"}
+    assert batch.stats["errors"] == 1
+
+
+def test_process_pool_matches_in_process_output(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    first = VoiceDNA.create_new("First", "first")
+    second = VoiceDNA.create_new("Second", "second")
+    params = {"force_age": 10}
+
+    batch = processor.process_many(
+        [wav_fixture_bytes, wav_fixture_bytes],
+        [first, second],
+        params=params,
+        executor="process",
+        max_workers=2,
+    )
+
+    assert batch.stats["errors"] == 0
+    assert batch.audio[0] == processor.process(wav_fixture_bytes, first, dict(params))
+    assert batch.audio[1] == processor.process(wav_fixture_bytes, second, dict(params))
+
+
+def test_prebuilt_process_pools_must_be_initialised(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Pooled", "pooled")
+    stranger = VoiceDNA.create_new("Stranger", "stranger")
+
+    with ProcessPoolExecutor(max_workers=1) as plain:
+        with pytest.raises(ValueError, match="BatchProcessPool"):
+            processor.process_many([wav_fixture_bytes], dna, executor=plain)
+
+    with BatchProcessPool([dna], max_workers=1) as pool:
+        outputs = [
+            processor.process_many([wav_fixture_bytes], dna, executor=pool).audio[0]
+            for _ in range(2)
+        ]
+        with pytest.raises(ValueError, match="not loaded"):
+            processor.process_many([wav_fixture_bytes], stranger, executor=pool)
+
+    assert outputs[0] == outputs[1] == processor.process(wav_fixture_bytes, dna, {})
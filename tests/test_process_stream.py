@@ -0,0 +1,167 @@
+import numpy as np
+
+from voice_dna import VoiceDNA
+from voicedna.audio import AudioBuffer
+from voicedna.framework import ProcessResult, VoiceDNAProcessor
+from voicedna.plugins.base import IVoiceDNAFilter
+from voicedna.plugins.builtin import PromptTagFilter
+
+
+def _blocks(samples, size):
+    return [samples[start : start + size] for start in range(0, len(samples), size)]
+
+
+class _GainBytesFilter(IVoiceDNAFilter):
+    thread_safe = True
+
+    def name(self) -> str:
+        return "bytes_gain"
+
+    def priority(self) -> int:
+        return 15
+
+    def process(self, audio_bytes, dna, params):
+        buffer = AudioBuffer.from_bytes(audio_bytes)
+        return buffer.replace(buffer.samples * 0.5).to_bytes()
+
+
+def test_stream_matches_whole_utterance_processing(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Stream", "stream")
+    source = AudioBuffer.from_bytes(wav_fixture_bytes)
+    params = {"force_age": 12, "imprint_converter.consistency_enabled": False}
+
+    whole = processor.process(
+        wav_fixture_bytes, dna, dict(params)
+    )
+    expected = AudioBuffer.from_bytes(whole).samples
+    streamed = np.concatenate(
+        list(
+            processor.process_stream(
+                _blocks(source.samples, 333),
+                dna,
+                dict(params),
+                sample_rate=source.sample_rate,
+            )
+        )
+    )
+
+    assert streamed.shape == expected.shape
+    assert np.max(np.abs(streamed - expected)) < 2 / 32768
+
+
+def test_stream_watermark_carries_offset_across_blocks(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Mark", "mark")
+    source = AudioBuffer.from_bytes(wav_fixture_bytes)
+    params = {"force_age": 5}
+
+    one_block = np.concatenate(
+        list(
+            processor.process_stream(
+                [source.samples], dna, dict(params), sample_rate=source.sample_rate
+            )
+        )
+    )
+    many_blocks = np.concatenate(
+        list(
+            processor.process_stream(
+                _blocks(source.samples, 160),
+                dna,
+                dict(params),
+                sample_rate=source.sample_rate,
+            )
+        )
+    )
+
+    np.testing.assert_allclose(many_blocks, one_block, atol=1e-6)
+    assert processor.get_last_report()["imprint_converter"]["watermark_applied"]
+
+
+def test_pcm_bytes_stream_yields_early_and_reports(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Pcm", "pcm")
+    source = AudioBuffer.from_bytes(wav_fixture_bytes)
+    pcm = AudioBuffer(samples=source.samples, sample_rate=source.sample_rate)
+    raw = pcm.to_bytes()[44:]
+    result = ProcessResult()
+
+    stream = processor.process_stream(
+        [raw[start : start + 1001] for start in range(0, len(raw), 1001)],
+        dna,
+        sample_rate=source.sample_rate,
+        result=result,
+    )
+    first = next(stream)
+    rest = list(stream)
+
+    assert isinstance(first, bytes) and len(first) % 2 == 0
+    stream_report = result.report["stream"]
+    assert stream_report["blocks_out"] == 1 + len(rest)
+    assert stream_report["buffered"] == []
+    assert stream_report["first_block_ms"] is not None
+    assert [entry["status"] for entry in result.report["filters"]] == ["ok", "ok"]
+    assert stream_report["dropped_bytes"] == 0
+
+
+def test_pcm_stream_reports_a_trailing_partial_frame(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Partial", "partial")
+    raw = AudioBuffer.from_bytes(wav_fixture_bytes).to_bytes()[44:]
+    result = ProcessResult()
+
+    list(processor.process_stream([raw[:1001], raw[1001:2001]], dna, result=result))
+
+    stream_report = result.report["stream"]
+    assert stream_report["frames_in"] == 1000
+    assert stream_report["dropped_bytes"] == 1
+
+
+def test_non_streaming_filter_is_buffered(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    processor.register_filter(_GainBytesFilter())
+    dna = VoiceDNA.create_new("Buffered", "buffered")
+    source = AudioBuffer.from_bytes(wav_fixture_bytes)
+    result = ProcessResult()
+
+    outputs = list(
+        processor.process_stream(
+            _blocks(source.samples, 400),
+            dna,
+            {"imprint_converter.consistency_enabled": False},
+            sample_rate=source.sample_rate,
+            result=result,
+        )
+    )
+
+    assert len(outputs) == 1
+    assert result.report["stream"]["buffered"] == ["bytes_gain"]
+    assert result.report["stream"]["frames_out"] == outputs[0].shape[0]
+
+
+def test_failing_buffered_filter_passes_audio_through(wav_fixture_bytes):
+    dna = VoiceDNA.create_new("Tagged", "tagged")
+    source = AudioBuffer.from_bytes(wav_fixture_bytes)
+    params = {"prepend_style_tag": True, "imprint_converter.consistency_enabled": False}
+    tagged = VoiceDNAProcessor()
+    tagged.register_filter(PromptTagFilter())
+    result = ProcessResult()
+
+    outputs = [
+        np.concatenate(
+            list(
+                processor.process_stream(
+                    _blocks(source.samples, 500),
+                    dna,
+                    dict(params),
+                    sample_rate=source.sample_rate,
+                    result=report,
+                )
+            )
+        )
+        for processor, report in ((tagged, result), (VoiceDNAProcessor(), None))
+    ]
+
+    statuses = {entry["name"]: entry["status"] for entry in result.report["filters"]}
+    assert statuses["prompt_tag"] == "error"
+    np.testing.assert_array_equal(outputs[0], outputs[1])
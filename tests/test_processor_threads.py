@@ -0,0 +1,73 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from voice_dna import VoiceDNA
+from voicedna.framework import ProcessResult, VoiceDNAProcessor
+from voicedna.plugins.base import IVoiceDNAFilter
+
+
+class _StatefulFilter(IVoiceDNAFilter):
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._guard = threading.Lock()
+
+    def name(self) -> str:
+        return "stateful"
+
+    def priority(self) -> int:
+        return 40
+
+    def process(self, audio_bytes, dna, params):
+        with self._guard:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._guard:
+            self.active -= 1
+        return audio_bytes
+
+
+def test_concurrent_calls_get_their_own_reports(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    dna = VoiceDNA.create_new("Shared", "shared")
+
+    def _run(age):
+        result = processor.process_with_report(wav_fixture_bytes, dna, {"force_age": age})
+        own_report = processor.get_last_report()
+        return age, result, own_report
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        outcomes = list(pool.map(_run, range(6, 30, 2)))
+
+    for age, result, own_report in outcomes:
+        expected = max(0.5, min(1.25, 1.0 - (age - 5) * 0.015))
+        assert result.params["age_maturation.pitch_factor"] == expected
+        assert own_report is result.report
+        assert isinstance(result.audio, bytes) and result.audio
+
+
+def test_unsafe_filters_are_serialised(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    stateful = _StatefulFilter()
+    processor.register_filter(stateful)
+    dna = VoiceDNA.create_new("Serial", "serial")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: processor.process(wav_fixture_bytes, dna, {}), range(8)))
+
+    assert stateful.max_active == 1
+
+
+def test_process_fills_caller_result(wav_fixture_bytes):
+    processor = VoiceDNAProcessor()
+    result = ProcessResult()
+
+    audio = processor.process(
+        wav_fixture_bytes, VoiceDNA.create_new("Out", "out"), {}, result=result
+    )
+
+    assert audio is result.audio
+    assert result.report["filter_count"] == len(processor.filters)
+    assert set(result.metrics) <= set(processor.get_filter_names())
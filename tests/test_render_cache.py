@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+from voice_dna import VoiceDNA
+from voicedna.aio import AsyncProcessor
+from voicedna.framework import VoiceDNAProcessor
+from voicedna.render_cache import RenderCache, RenderEntry
+
+
+class _CountingTTS:
+    def __init__(self, wav_bytes, delay=0.0):
+        self.wav_bytes = wav_bytes
+        self.delay = delay
+        self.texts = []
+
+    def synthesize(self, text: str) -> bytes:
+        self.texts.append(text)
+        time.sleep(self.delay)
+        return self.wav_bytes
+
+
+def _isolated_cache(monkeypatch, tmp_path, **kwargs):
+    cache = RenderCache(disk_dir=tmp_path / "renders", **kwargs)
+    monkeypatch.setattr("voicedna.render_cache.RENDER_CACHE", cache)
+    return cache
+
+
+def test_repeat_render_is_served_from_memory_then_disk(
+    monkeypatch, tmp_path, wav_fixture_bytes
+):
+    cache = _isolated_cache(monkeypatch, tmp_path)
+    processor = VoiceDNAProcessor()
+    tts = _CountingTTS(wav_fixture_bytes)
+    dna = VoiceDNA.create_new("Render", "render")
+
+    first = processor.synthesize_and_process("Hello  there", dna, tts)
+    second = processor.synthesize_and_process("Hello there", dna, tts)
+
+    assert len(tts.texts) == 1
+    assert second == first
+    assert processor.get_last_report()["render_cache"]["tier"] == "memory"
+    assert processor.get_last_report()["render_cache"]["hit_ratio"] == 0.5
+
+    cache.clear()
+    third = processor.synthesize_and_process("Hello there", dna, tts)
+    assert third == first
+    assert processor.get_last_report()["render_cache"]["tier"] == "disk"
+    assert list((tmp_path / "renders").rglob("*.vdr"))
+
+    processor.synthesize_and_process(
+        "Hello there", dna, tts, params={"render_cache": False}
+    )
+    processor.synthesize_and_process("Hello there", dna, tts, params={"pitch": 2})
+    assert len(tts.texts) == 3
+
+
+def test_memory_tier_respects_byte_limit(tmp_path):
+    cache = RenderCache(max_memory_bytes=250, disk_dir=None)
+
+    for index in range(3):
+        cache.put(f"key-{index}", bytes(100), {"index": index})
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["memory_bytes"] == 200
+    assert cache.get("key-0") == (None, "miss")
+    entry, tier = cache.get("key-2")
+    assert tier == "memory"
+    assert entry.report == {"index": 2}
+
+
+def test_concurrent_identical_requests_render_once(monkeypatch, tmp_path):
+    cache = _isolated_cache(monkeypatch, tmp_path)
+    renders = []
+
+    def render():
+        renders.append(1)
+        time.sleep(0.1)
+        return RenderEntry(audio=b"pcm", report={"ok": True}), True
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_render("k", render)))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(renders) == 1
+    assert sorted(tier for _, tier in results).count("miss") == 1
+    assert all(entry.audio == b"pcm" for entry, _ in results)
+    assert cache.stats()["coalesced"] + cache.stats()["memory_hits"] == 5
+
+
+def test_async_followers_share_the_leaders_render(
+    monkeypatch, tmp_path, wav_fixture_bytes
+):
+    _isolated_cache(monkeypatch, tmp_path)
+    runner = AsyncProcessor(VoiceDNAProcessor())
+    tts = _CountingTTS(wav_fixture_bytes, delay=0.05)
+    dna = VoiceDNA.create_new("AsyncRender", "async-render")
+
+    async def main():
+        return await asyncio.gather(
+            *(runner.synthesize_and_process("Same line", dna, tts) for _ in range(4))
+        )
+
+    results = asyncio.run(main())
+
+    assert len(tts.texts) == 1
+    assert len({result.audio for result in results}) == 1
+    tiers = sorted(result.report["render_cache"]["tier"] for result in results)
+    assert tiers == ["coalesced", "coalesced", "coalesced", "miss"]
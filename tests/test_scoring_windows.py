@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from voice_dna import VoiceDNA
+from voicedna import features
+from voicedna.consistency import VoiceConsistencyEngine, _encode_wav_bytes
+from voicedna.framework import VoiceDNAProcessor
+from voicedna.vad import select_scoring_windows
+
+
+def _narration(seconds, sample_rate=16000, pause_every=4, seed=0):
+    """Tone bursts separated by one-second pauses, with a little noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    voice = 0.3 * np.sin(2 * np.pi * 180 * t)
+    voice[(t.astype(int) % pause_every) == pause_every - 1] = 0.0
+    return (voice + 0.002 * rng.standard_normal(t.size)).astype(np.float32)
+
+
+def test_window_selection_strategies():
+    waveform = _narration(20.0)
+    window = 16000
+
+    vad = select_scoring_windows(waveform, 16000, 4, 1.0, "vad")
+    uniform = select_scoring_windows(waveform, 16000, 4, 1.0, "uniform")
+    loud = waveform.copy()
+    loud[5 * window : 6 * window] *= 2.0
+    energy = select_scoring_windows(loud, 16000, 1, 1.0, "energy")
+
+    assert vad.size == 4
+    assert all((start // window) % 4 != 3 for start in vad)
+    assert vad[-1] - vad[0] >= 12 * window
+    assert uniform.tolist() == [0, 6 * window, 13 * window, 19 * window]
+    assert energy.tolist() == [5 * window]
+    assert select_scoring_windows(waveform[: 3 * window], 16000, 4, 1.0) is None
+    with pytest.raises(ValueError):
+        select_scoring_windows(waveform, 16000, 4, 1.0, "loudest")
+
+
+def test_windowed_scoring_cost_does_not_grow_with_clip_length(monkeypatch):
+    engine = VoiceConsistencyEngine(scoring_windows=3, scoring_window_seconds=1.0)
+    core = engine.extract_embedding_from_imprint("windowed imprint", dims=256)
+    embedded = []
+    frame_signal = features.frame_signal
+
+    def _counting(waveform, sample_rate):
+        embedded.append(waveform.size)
+        return frame_signal(waveform, sample_rate)
+
+    monkeypatch.setattr(features, "frame_signal", _counting)
+    sizes = {}
+    for seconds in (30.0, 120.0):
+        embedded.clear()
+        details = {}
+        clip = _encode_wav_bytes(16000, _narration(seconds) * 32767)
+        engine.enforce_consistency(
+            clip, core, "vdna_windows", correction=False, details=details
+        )
+        sizes[seconds] = list(embedded)
+        assert details["windows"] == 3
+
+    assert sizes[30.0] == sizes[120.0] == [16000] * 3
+
+
+def test_processor_reads_window_params():
+    dna = VoiceDNA.create_new("Narrator", "narrator")
+    clip = _encode_wav_bytes(16000, _narration(12.0) * 32767)
+    processor = VoiceDNAProcessor()
+
+    processor.process(
+        clip,
+        dna,
+        {
+            "imprint_converter.scoring_windows": 2,
+            "imprint_converter.scoring_strategy": "energy",
+        },
+    )
+    windowed = processor.get_last_report()["imprint_converter"]
+    processor.process(clip, dna, {})
+    whole = processor.get_last_report()["imprint_converter"]
+
+    assert windowed["consistency_windows"] == 2
+    assert whole["consistency_windows"] == 0
@@ -0,0 +1,90 @@
+import numpy as np
+
+from voice_dna import VoiceDNA
+from voicedna.speaker_index import SpeakerIndex
+from voicedna.store import VoiceDNAStore
+
+
+def _random_voices(count: int, dims: int = 256, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    return [f"vdna_{index}" for index in range(count)], rng.normal(
+        size=(count, dims)
+    ).astype(np.float32)
+
+
+def test_brute_force_search_matches_python_cosine():
+    ids, vectors = _random_voices(50)
+    index = SpeakerIndex()
+    index.add_many(ids, vectors)
+
+    query = vectors[17] + 0.05
+    hits = index.search(query, k=3)
+
+    expected = max(
+        range(len(ids)),
+        key=lambda row: float(
+            np.dot(vectors[row], query)
+            / (np.linalg.norm(vectors[row]) * np.linalg.norm(query))
+        ),
+    )
+    assert hits[0][0] == ids[expected]
+    assert len(hits) == 3
+    assert hits[0][1] >= hits[1][1] >= hits[2][1]
+
+
+def test_remove_and_readd_updates_results():
+    ids, vectors = _random_voices(10)
+    index = SpeakerIndex()
+    index.add_many(ids, vectors)
+
+    assert index.remove("vdna_3")
+    assert "vdna_3" not in index
+    assert all(hit[0] != "vdna_3" for hit in index.search(vectors[3], k=10))
+
+    index.add("vdna_3", vectors[3])
+    assert index.search(vectors[3], k=1)[0][0] == "vdna_3"
+    assert len(index) == 10
+
+
+def test_duplicate_ids_in_one_batch_keep_the_last_vector():
+    index = SpeakerIndex(dims=4)
+    index.add_many(["a", "b", "a"], [[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0]])
+
+    assert len(index) == 2 and index.ids() == ["b", "a"]
+    assert index.search([0, 1, 0, 0], k=1)[0] == ("a", 1.0)
+    assert index.remove("a")
+    assert [hit[0] for hit in index.search([1, 0, 0, 0], k=5)] == ["b"]
+
+
+def test_ivf_pq_search_recovers_exact_neighbour_and_persists(tmp_path):
+    ids, vectors = _random_voices(600)
+    index = SpeakerIndex(nprobe=6, rerank=32)
+    index.add_many(ids, vectors)
+    index.train(lists=16, subspaces=16, iterations=6)
+
+    index.add("late", vectors[5] * 2.0)
+    for row in (0, 123, 599):
+        assert index.search(vectors[row], k=1)[0][0] == ids[row]
+
+    index.save(tmp_path / "idx")
+    loaded = SpeakerIndex.load(tmp_path / "idx")
+    assert loaded.trained
+    assert loaded.search(vectors[123], k=1)[0][0] == ids[123]
+    assert {hit[0] for hit in loaded.search(vectors[5], k=2)} == {"vdna_5", "late"}
+
+
+def test_find_duplicates_and_from_store(tmp_path):
+    dna = VoiceDNA.create_new("Duplicate voice", "dup")
+    dna.save(str(tmp_path / "a.voicedna.json"))
+    twin = VoiceDNA.create_new("Duplicate voice", "dup2")
+    twin.save(str(tmp_path / "b.voicedna.json"))
+    VoiceDNA.create_new("Other voice", "other").save(str(tmp_path / "c.voicedna.json"))
+
+    index = SpeakerIndex.from_store(VoiceDNAStore(tmp_path))
+    duplicates = index.find_duplicates(threshold=0.999)
+
+    assert len(index) == 3
+    assert [(pair[0], pair[1]) for pair in duplicates] in (
+        [(dna.voice_fingerprint_id, twin.voice_fingerprint_id)],
+        [(twin.voice_fingerprint_id, dna.voice_fingerprint_id)],
+    )
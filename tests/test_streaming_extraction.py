@@ -0,0 +1,98 @@
+import wave
+
+import numpy as np
+
+from voice_dna import VoiceDNA
+from voicedna.consistency import cosine_similarity
+from voicedna.embedding_cache import EmbeddingCache
+from voicedna.streaming import (
+    StreamingEmbeddingExtractor,
+    iter_wav_windows,
+    should_stream,
+)
+import voicedna.streaming as streaming
+
+
+def _write_wav(path, seconds, sample_rate=16000, silence_seconds=0.0):
+    rng = np.random.default_rng(7)
+    times = np.arange(int(seconds * sample_rate)) / sample_rate
+    voiced = 0.3 * np.sin(2 * np.pi * 180 * times) + 0.02 * rng.standard_normal(times.size)
+    silence = np.zeros(int(silence_seconds * sample_rate))
+    samples = np.concatenate([silence, voiced])
+    with wave.open(str(path), "wb") as wave_file:
+        wave_file.setnchannels(1)
+        wave_file.setsampwidth(2)
+        wave_file.setframerate(sample_rate)
+        wave_file.writeframes((samples * 32767).astype("<i2").tobytes())
+    return path
+
+
+def test_windows_are_bounded(tmp_path):
+    path = _write_wav(tmp_path / "long.wav", seconds=5.5)
+    sizes = [window.size for _, window in iter_wav_windows(path, window_seconds=2.0)]
+
+    assert sizes == [32000, 32000, 24000]
+
+
+def test_running_centroid_stops_early_once_converged(tmp_path, monkeypatch):
+    monkeypatch.setattr(streaming, "get_embedding_cache", lambda: EmbeddingCache(enabled=False))
+    path = _write_wav(tmp_path / "imprint.wav", seconds=40, silence_seconds=2.0)
+    extractor = StreamingEmbeddingExtractor(window_seconds=1.0, backend="numpy")
+
+    result = extractor.extract(path, dims=64)
+
+    assert result.converged
+    assert result.seconds_processed < 42
+    assert result.skipped_windows == 2
+    assert len(result.embedding) == 64
+    assert np.isclose(np.linalg.norm(result.embedding), 1.0, atol=1e-3)
+
+    full = StreamingEmbeddingExtractor(
+        window_seconds=1.0, backend="numpy", early_stop=False
+    ).extract(path, dims=64)
+    assert full.seconds_processed == 42
+    assert not full.converged
+
+
+def test_streamed_result_is_cached(tmp_path, monkeypatch):
+    cache = EmbeddingCache()
+    monkeypatch.setattr(streaming, "get_embedding_cache", lambda: cache)
+    path = _write_wav(tmp_path / "imprint.wav", seconds=6)
+    extractor = StreamingEmbeddingExtractor(window_seconds=1.0, backend="numpy")
+
+    first = extractor.extract(path, dims=32)
+    second = extractor.extract(path, dims=32)
+
+    assert not first.cached and second.cached
+    assert second.embedding == first.embedding
+
+
+def test_long_imprints_stream_through_create_new(tmp_path, monkeypatch):
+    path = _write_wav(tmp_path / "imprint.wav", seconds=3)
+    monkeypatch.setenv("VOICEDNA_STREAMING_MIN_SECONDS", "2")
+    calls = []
+    original = StreamingEmbeddingExtractor.extract
+
+    def _tracking(self, audio_path, dims=256):
+        calls.append(audio_path)
+        return original(self, audio_path, dims)
+
+    monkeypatch.setattr(StreamingEmbeddingExtractor, "extract", _tracking)
+
+    assert should_stream(path)
+    dna = VoiceDNA.create_new(str(path), "streamer")
+
+    assert calls and len(dna.core_embedding) == 256
+
+
+def test_short_and_streamed_imprints_share_one_embedding_space(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOICEDNA_STREAMING_MIN_SECONDS", "10")
+    short = _write_wav(tmp_path / "short.wav", seconds=4)
+    long = _write_wav(tmp_path / "long.wav", seconds=12)
+
+    short_embedding = VoiceDNA._extract_core_embedding(str(short))
+    long_embedding = VoiceDNA._extract_core_embedding(str(long))
+
+    assert not should_stream(short) and should_stream(long)
+    assert short_embedding != VoiceDNA._legacy_core_embedding(str(short))
+    assert cosine_similarity(short_embedding, long_embedding) > 0.9
@@ -0,0 +1,108 @@
+import json
+import os
+from dataclasses import asdict
+
+import pytest
+from cryptography.fernet import Fernet
+
+from voice_dna import VoiceDNA
+from voicedna.store import LOAD_LOCK_STRIPES, VoiceDNAStore
+
+
+def _write_voices(directory, count=3, password="pw"):
+    voices = []
+    for index in range(count):
+        dna = VoiceDNA.create_new(f"Store voice {index}", f"agent{index}")
+        dna.save_encrypted(password, str(directory / f"agent{index}.voicedna.enc"))
+        voices.append(dna)
+    return voices
+
+
+def test_store_indexes_and_lazily_decrypts(tmp_path):
+    voices = _write_voices(tmp_path)
+    (tmp_path / "notes.txt").write_text("ignored")
+    store = VoiceDNAStore(tmp_path, password="pw")
+
+    assert store.names() == ["agent0", "agent1", "agent2"]
+    assert store.stats()["loaded"] == 0
+
+    first = store.get("agent1")
+    second = store.get("agent1")
+
+    assert first is second
+    assert first.voice_fingerprint_id == voices[1].voice_fingerprint_id
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 1
+    assert store.get_by_fingerprint(voices[2].voice_fingerprint_id) is store.get(
+        "agent2"
+    )
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    _write_voices(tmp_path)
+    store = VoiceDNAStore(tmp_path, password="pw", max_entries=2)
+
+    store.get("agent0")
+    store.get("agent1")
+    store.get("agent0")
+    store.get("agent2")
+
+    stats = store.stats()
+    assert stats["loaded"] == 2
+    assert stats["evictions"] == 1
+    assert stats["loaded_bytes"] > 0
+
+
+def test_store_reloads_changed_file(tmp_path):
+    _write_voices(tmp_path, count=1)
+    store = VoiceDNAStore(tmp_path, password="pw")
+    original = store.get("agent0")
+
+    replacement = VoiceDNA.create_new("Replacement", "agent0")
+    path = tmp_path / "agent0.voicedna.enc"
+    replacement.save_encrypted("pw", str(path))
+    os.utime(path, ns=(1, 1))
+
+    reloaded = store.get("agent0")
+    assert reloaded is not original
+    assert reloaded.voice_fingerprint_id == replacement.voice_fingerprint_id
+    assert store.stats()["reloads"] == 1
+
+
+def test_store_copy_and_missing_voice(tmp_path):
+    _write_voices(tmp_path, count=1)
+    store = VoiceDNAStore(tmp_path, password_resolver=lambda name, path: "pw")
+
+    copied = store.get("agent0", copy=True)
+    copied.imprint_strength = 0.1
+    assert store.get("agent0").imprint_strength != 0.1
+
+    with pytest.raises(KeyError):
+        store.get("missing")
+
+
+def test_store_does_not_sniff_json_from_encrypted_salt(tmp_path):
+    dna = VoiceDNA.create_new("Brace salt", "brace")
+    salt = b"{" + os.urandom(15)
+    key, _ = VoiceDNA._derive_key("pw", salt)
+    payload = Fernet(key).encrypt(json.dumps(asdict(dna)).encode("utf-8"))
+    (tmp_path / "brace.voicedna.enc").write_bytes(salt + payload)
+
+    store = VoiceDNAStore(tmp_path, password="pw")
+
+    assert store.get("brace") == dna
+
+
+def test_store_load_locks_stay_bounded_as_voices_churn(tmp_path):
+    store = VoiceDNAStore(tmp_path, max_entries=4)
+    dna = VoiceDNA.create_new("Churn voice", "churn")
+    for index in range(LOAD_LOCK_STRIPES + 16):
+        path = tmp_path / f"churn{index}.voicedna.json"
+        dna.save(str(path))
+        loaded = store.get(f"churn{index}")
+        assert loaded.voice_fingerprint_id == dna.voice_fingerprint_id
+        path.unlink()
+        store.refresh()
+
+    assert len(store) == 0
+    assert len(store._load_locks) == LOAD_LOCK_STRIPES
@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+
+from voicedna.consistency import (
+    VoiceConsistencyEngine,
+    _decode_wav_bytes,
+    _encode_wav_bytes,
+)
+from voicedna.watermark import (
+    WatermarkCache,
+    bit_window,
+    build_watermark_pattern,
+    fingerprint_bits,
+)
+
+
+def _reference_pattern(bits, sample_rate, amplitude):
+    window = bit_window(sample_rate)
+    indices = np.arange(len(bits) * window, dtype=np.float32)
+    signal = np.zeros(indices.size, dtype=np.float32)
+    frequency = min(7800.0, sample_rate * 0.42)
+    for bit_index, bit in enumerate(bits):
+        start, end = bit_index * window, (bit_index + 1) * window
+        phase = math.pi / 3 if bit else -math.pi / 3
+        signal[start:end] += np.sin(
+            (2.0 * math.pi * frequency * indices[start:end] / sample_rate) + phase
+        )
+    return signal * amplitude
+
+
+def test_vectorized_pattern_matches_per_bit_reference():
+    bits = fingerprint_bits("vdna_reference")
+
+    for sample_rate in (8000, 16000, 44100):
+        np.testing.assert_array_equal(
+            build_watermark_pattern(bits, sample_rate, 65.536),
+            _reference_pattern(bits, sample_rate, 65.536),
+        )
+
+
+def test_cache_reuses_read_only_patterns():
+    cache = WatermarkCache(max_entries=2)
+
+    first = cache.pattern("vdna_a", 16000, 0.002)
+    again = cache.pattern("vdna_a", 16000, 0.002)
+    cache.pattern("vdna_b", 16000, 0.002)
+    cache.pattern("vdna_a", 22050, 0.002)
+
+    assert again is first
+    assert not first.flags.writeable
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+    assert cache.stats()["entries"] == 2
+
+
+def test_batch_and_blocks_match_single_clip_watermarking():
+    engine = VoiceConsistencyEngine()
+    rng = np.random.default_rng(7)
+    clips = [
+        _encode_wav_bytes(16000, (rng.standard_normal(frames) * 2000).astype(np.int16))
+        for frames in (1600, 16000, 80000)
+    ]
+
+    batch = engine.apply_sonic_watermark_batch(clips, "vdna_batch")
+    assert batch == [engine.apply_sonic_watermark(clip, "vdna_batch") for clip in clips]
+
+    _, long_samples = _decode_wav_bytes(clips[-1])
+    floats = long_samples.astype(np.float32) / 32768.0
+    blocks = [
+        engine.apply_sonic_watermark_block(
+            floats[start : start + 1000], 16000, "vdna_batch", start
+        )
+        for start in range(0, floats.size, 1000)
+    ]
+    whole = engine.apply_sonic_watermark_block(floats, 16000, "vdna_batch")
+    np.testing.assert_array_equal(np.concatenate(blocks), whole)
+    # The watermark ends after 256 bit windows; later audio is untouched.
+    tail = 256 * bit_window(16000)
+    np.testing.assert_array_equal(whole[tail:], floats[tail:])
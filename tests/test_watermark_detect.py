@@ -0,0 +1,139 @@
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from typer.testing import CliRunner
+
+import cli
+from voice_dna import VoiceDNA
+from voicedna.consistency import VoiceConsistencyEngine, _encode_wav_bytes
+from voicedna.framework import VoiceDNAProcessor
+from voicedna.watermark import (
+    CandidateSet,
+    detect_sonic_watermark,
+    detection_threshold,
+    fingerprint_bits,
+    scan_watermarks,
+)
+
+
+def _speech_like_wav(seconds=4.0, sample_rate=16000, seed=3):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    voice = (
+        0.3 * np.sin(2 * np.pi * 180 * t)
+        + 0.1 * np.sin(2 * np.pi * 2100 * t)
+        + 0.005 * rng.standard_normal(t.size)
+    )
+    return _encode_wav_bytes(sample_rate, (voice * 32767).astype(np.int16))
+
+
+def test_detects_bits_and_best_candidate():
+    clip = _speech_like_wav()
+    marked = VoiceConsistencyEngine().apply_sonic_watermark(clip, "vdna_owner")
+    candidates = CandidateSet(
+        ["vdna_other", "vdna_owner"] + [f"vdna_{index}" for index in range(200)]
+    )
+
+    detection = detect_sonic_watermark(marked, candidates)
+    clean = detect_sonic_watermark(clip, candidates)
+
+    assert detection.detected
+    assert detection.voice_fingerprint_id == "vdna_owner"
+    assert detection.confidence > 0.999
+    expected = fingerprint_bits("vdna_owner")[: detection.bits.size]
+    assert np.mean(detection.bits == expected) > 0.95
+    assert not clean.detected
+    assert clean.voice_fingerprint_id is None
+    assert detect_sonic_watermark(marked).detected
+    assert not detect_sonic_watermark(clip).detected
+
+
+def test_processor_output_is_attributed_to_its_dna():
+    dna = VoiceDNA.create_new("Provenance", "provenance")
+    other = VoiceDNA.create_new("Other", "other")
+    rendered = VoiceDNAProcessor().process(_speech_like_wav(seed=5), dna, {})
+
+    detection = detect_sonic_watermark(
+        rendered, [other.voice_fingerprint_id, dna.voice_fingerprint_id]
+    )
+
+    assert detection.voice_fingerprint_id == dna.voice_fingerprint_id
+
+
+def test_watermark_scan_cli_reports_matches(tmp_path):
+    engine = VoiceConsistencyEngine()
+    clips = tmp_path / "archive"
+    (clips / "nested").mkdir(parents=True)
+    (clips / "a.wav").write_bytes(
+        engine.apply_sonic_watermark(_speech_like_wav(), "vdna_a")
+    )
+    (clips / "nested" / "b.wav").write_bytes(_speech_like_wav(seed=9))
+    candidates = tmp_path / "candidates.txt"
+    candidates.write_text("vdna_a\nvdna_b\n", encoding="utf-8")
+    results = tmp_path / "scan.jsonl"
+
+    outcome = CliRunner().invoke(
+        cli.app,
+        [
+            "watermark-scan",
+            str(clips),
+            "--candidates",
+            str(candidates),
+            "--executor",
+            "thread",
+            "--output-jsonl",
+            str(results),
+        ],
+    )
+
+    assert outcome.exit_code == 0, outcome.output
+    records = {
+        json.loads(line)["path"]: json.loads(line)
+        for line in results.read_text(encoding="utf-8").splitlines()
+    }
+    assert records[str(clips / "a.wav")]["voice_fingerprint_id"] == "vdna_a"
+    assert not records[str(clips / "nested" / "b.wav")]["detected"]
+    assert "1 watermarked" in outcome.output
+
+
+def test_scans_carry_their_own_candidates(tmp_path):
+    engine = VoiceConsistencyEngine()
+    marked = tmp_path / "marked.wav"
+    marked.write_bytes(engine.apply_sonic_watermark(_speech_like_wav(), "vdna_a"))
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        [(_, pooled, error)] = scan_watermarks(
+            [marked], ["vdna_a", "vdna_b"], executor=pool
+        )
+    first = scan_watermarks([marked] * 4, ["vdna_a"], executor="thread")
+    second = scan_watermarks([marked] * 4, ["vdna_b", "vdna_c"], executor="thread")
+    interleaved = list(zip(first, second))
+
+    assert error is None and pooled.voice_fingerprint_id == "vdna_a"
+    assert all(a[1].voice_fingerprint_id == "vdna_a" for a, _ in interleaved)
+    assert all(not b[1].detected for _, b in interleaved)
+
+
+def test_threshold_and_confidence_account_for_candidate_count():
+    clip = VoiceConsistencyEngine().apply_sonic_watermark(_speech_like_wav(), "vdna_a")
+
+    class _Crowd:
+        def __len__(self):
+            return 300_000
+
+        def best_match(self, soft_bits):
+            return "vdna_lucky", 5.0
+
+    crowd = detect_sonic_watermark(clip, _Crowd())
+    single = detect_sonic_watermark(clip, ["vdna_a"])
+
+    assert detection_threshold(5.0, 1) == 5.0
+    assert 6.9 < crowd.threshold < 7.3
+    assert not crowd.detected and crowd.voice_fingerprint_id is None
+    assert crowd.confidence < 0.95
+    assert single.detected and single.threshold == 5.0
+    assert single.to_dict()["candidates"] == 1
@@ -0,0 +1,86 @@
+import json
+
+import numpy as np
+from typer.testing import CliRunner
+
+import cli
+from voicedna.consistency import VoiceConsistencyEngine, _encode_wav_bytes
+from voicedna.watermark import detect_sonic_watermark
+from voicedna.watermark_index import WatermarkIndex
+
+
+def _marked_clip(fingerprint_id, seconds=4.0, noise=0.01, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * 16000)) / 16000
+    voice = 0.3 * np.sin(2 * np.pi * 180 * t) + noise * rng.standard_normal(t.size)
+    clip = _encode_wav_bytes(16000, (voice * 32767).astype(np.int16))
+    return VoiceConsistencyEngine().apply_sonic_watermark(clip, fingerprint_id)
+
+
+def test_noisy_and_partial_clips_resolve_through_buckets():
+    fingerprint_ids = [f"vdna_{number:05d}" for number in range(20000)]
+    index = WatermarkIndex()
+    index.add_many(fingerprint_ids)
+
+    for seed, (fingerprint_id, seconds) in enumerate(
+        [("vdna_00042", 4.0), ("vdna_19999", 2.0), ("vdna_07000", 1.5)]
+    ):
+        detection = detect_sonic_watermark(
+            _marked_clip(fingerprint_id, seconds=seconds, noise=0.015, seed=seed), index
+        )
+        assert detection.voice_fingerprint_id == fingerprint_id
+        assert index.candidate_rows(detection.soft_bits).size < len(index) // 10
+
+    unmarked = _encode_wav_bytes(16000, np.zeros(64000, dtype=np.int16))
+    assert index.identify(unmarked).voice_fingerprint_id is None
+
+
+def test_save_load_memory_maps_and_remove(tmp_path):
+    index = WatermarkIndex()
+    index.add_many(["vdna_a", "vdna_b", "vdna_c"])
+    index.save(tmp_path / "wm")
+
+    loaded = WatermarkIndex.load(tmp_path / "wm")
+    clip = _marked_clip("vdna_b")
+
+    assert isinstance(loaded._order, np.memmap)
+    assert loaded.identify(clip).voice_fingerprint_id == "vdna_b"
+    assert loaded.remove("vdna_b")
+    assert "vdna_b" not in loaded
+    assert loaded.identify(clip).voice_fingerprint_id is None
+    assert loaded.ids() == ["vdna_a", "vdna_c"]
+
+
+def test_scan_cli_uses_saved_index(tmp_path):
+    candidates = tmp_path / "ids.json"
+    candidates.write_text(
+        json.dumps([f"vdna_{number}" for number in range(500)]), encoding="utf-8"
+    )
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    (archive / "clip.wav").write_bytes(_marked_clip("vdna_321"))
+    results = tmp_path / "scan.jsonl"
+
+    built = CliRunner().invoke(
+        cli.app,
+        ["watermark-index", str(tmp_path / "wm"), "--candidates", str(candidates)],
+    )
+    scanned = CliRunner().invoke(
+        cli.app,
+        [
+            "watermark-scan",
+            str(archive),
+            "--index",
+            str(tmp_path / "wm"),
+            "--executor",
+            "thread",
+            "--output-jsonl",
+            str(results),
+        ],
+    )
+
+    assert built.exit_code == 0, built.output
+    assert "Indexed 500 fingerprints" in built.output
+    assert scanned.exit_code == 0, scanned.output
+    record = json.loads(results.read_text(encoding="utf-8"))
+    assert record["voice_fingerprint_id"] == "vdna_321"
@@ -8,15 +8,366 @@ import uuid
 import base64
 import os
 import hashlib
+import hmac
+import struct
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import Iterator, List, Dict, Any, Tuple
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, writes stay atomic
+    fcntl = None
+
+
+KDF_ITERATIONS = 480000
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``<path>.lock`` across processes."""
+    lock_path = path.with_name(path.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(descriptor)
+
+
+class DerivedKeyCache:
+    """Process-wide cache of PBKDF2-derived Fernet keys.
+
+    Entries are keyed by an HMAC of (salt, password) under a per-process
+    secret, so neither the password nor a cheap unsalted digest of it is kept
+    in memory. Only keys that successfully decrypted (or encrypted) a file
+    are cached, so a wrong password always pays the full KDF cost.
+
+    The optional session token persists keys to a 0600 file so short-lived
+    processes (daemons restarting, ``bridge_runtime.py process``) can skip the
+    KDF too. Anyone who can read that file can decrypt the cached voices, so
+    it is opt-in and entries expire after ``session_ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        ttl_seconds: float = 900.0,
+        session_path: str | None = None,
+        session_ttl_seconds: float = 8 * 3600.0,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.session_path = Path(session_path).expanduser() if session_path else None
+        self.session_ttl_seconds = session_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[float, bytearray]]" = OrderedDict()
+        self._secret = os.urandom(32)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_env() -> "DerivedKeyCache":
+        return DerivedKeyCache(
+            max_entries=int(os.getenv("VOICEDNA_KEY_CACHE_SIZE", "32")),
+            ttl_seconds=float(os.getenv("VOICEDNA_KEY_CACHE_TTL", "900")),
+            session_path=os.getenv("VOICEDNA_KEY_SESSION_FILE") or None,
+            session_ttl_seconds=float(
+                os.getenv("VOICEDNA_KEY_SESSION_TTL", str(8 * 3600))
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, password: str, salt: bytes) -> bytes | None:
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        lookup_id = self._lookup_id(self._secret, password, salt)
+        with self._lock:
+            entry = self._entries.get(lookup_id)
+            if entry is not None:
+                expires_at, key = entry
+                if expires_at > now:
+                    self._entries.move_to_end(lookup_id)
+                    self.hits += 1
+                    return bytes(key)
+                self._drop(lookup_id)
+
+        session_key = self._read_session_key(password, salt)
+        if session_key is not None:
+            self._remember(lookup_id, session_key)
+            with self._lock:
+                self.hits += 1
+            return session_key
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, password: str, salt: bytes, key: bytes) -> None:
+        if not self.enabled:
+            return
+        self._remember(self._lookup_id(self._secret, password, salt), key)
+        self._write_session_key(password, salt, key)
+
+    def wipe(self, include_session: bool = True) -> None:
+        with self._lock:
+            for lookup_id in list(self._entries):
+                self._drop(lookup_id)
+            self.hits = 0
+            self.misses = 0
+        if include_session and self.session_path and self.session_path.exists():
+            self.session_path.unlink()
+
+    def enable_session(
+        self, session_path: str, session_ttl_seconds: float | None = None
+    ) -> None:
+        self.session_path = Path(session_path).expanduser()
+        if session_ttl_seconds is not None:
+            self.session_ttl_seconds = session_ttl_seconds
+
+    def disable_session(self, wipe: bool = True) -> None:
+        if wipe and self.session_path and self.session_path.exists():
+            self.session_path.unlink()
+        self.session_path = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "session_enabled": self.session_path is not None,
+            }
+
+    @staticmethod
+    def _lookup_id(secret: bytes, password: str, salt: bytes) -> bytes:
+        password_digest = hashlib.sha256(password.encode("utf-8")).digest()
+        return hmac.new(secret, salt + password_digest, hashlib.sha256).digest()
+
+    def _remember(self, lookup_id: bytes, key: bytes) -> None:
+        with self._lock:
+            if lookup_id in self._entries:
+                self._drop(lookup_id)
+            self._entries[lookup_id] = (
+                time.monotonic() + self.ttl_seconds,
+                bytearray(key),
+            )
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, lookup_id: bytes) -> None:
+        _, key = self._entries.pop(lookup_id)
+        key[:] = b"\x00" * len(key)
+
+    def _load_session(self) -> Dict[str, Any] | None:
+        if self.session_path is None or not self.session_path.exists():
+            return None
+        try:
+            session = json.loads(self.session_path.read_text(encoding="utf-8"))
+            base64.b64decode(session["secret"])
+            return session
+        except Exception:
+            return None
+
+    def _read_session_key(self, password: str, salt: bytes) -> bytes | None:
+        session = self._load_session()
+        if session is None:
+            return None
+        secret = base64.b64decode(session["secret"])
+        entry = session.get("entries", {}).get(
+            self._lookup_id(secret, password, salt).hex()
+        )
+        if not entry or float(entry.get("expires", 0)) <= time.time():
+            return None
+        return entry["key"].encode("ascii")
+
+    def _write_session_key(self, password: str, salt: bytes, key: bytes) -> None:
+        if self.session_path is None:
+            return
+        # Other processes (batch enroll workers, daemons) share this file, so
+        # read-merge-write happens under a lock and through a private temp file.
+        with file_lock(self.session_path):
+            session = self._load_session() or {
+                "version": 1,
+                "secret": base64.b64encode(os.urandom(32)).decode("ascii"),
+                "entries": {},
+            }
+            now = time.time()
+            secret = base64.b64decode(session["secret"])
+            lookup_hex = self._lookup_id(secret, password, salt).hex()
+            current = session.get("entries", {}).get(lookup_hex)
+            if (
+                current
+                and current.get("key") == key.decode("ascii")
+                and float(current.get("expires", 0)) > now
+            ):
+                return
+            entries = {
+                entry_hex: entry
+                for entry_hex, entry in session.get("entries", {}).items()
+                if float(entry.get("expires", 0)) > now
+            }
+            entries[lookup_hex] = {
+                "key": key.decode("ascii"),
+                "expires": now + self.session_ttl_seconds,
+            }
+            session["entries"] = entries
+
+            temp_path = self.session_path.with_name(
+                f"{self.session_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            try:
+                descriptor = os.open(
+                    temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+                )
+                with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                    json.dump(session, handle)
+                os.replace(temp_path, self.session_path)
+            except OSError:
+                temp_path.unlink(missing_ok=True)
+                raise
+
+
+KEY_CACHE = DerivedKeyCache.from_env()
+
+# Binary container: 16-byte header, compact JSON metadata (every field except
+# core_embedding), zero padding to a 16-byte boundary, then the embedding as
+# raw little-endian float32. Encrypted containers keep the header in clear
+# (flags bit 0 set, metadata length 0) followed by salt + Fernet(plain container).
+BINARY_MAGIC = b"VDNB"
+BINARY_VERSION = 1
+BINARY_FLAG_ENCRYPTED = 0x01
+BINARY_HEADER = struct.Struct("<4sBBHII")
+BINARY_SUFFIX = ".voicedna.bin"
+# Every Fernet token starts with version byte 0x80 and a big-endian timestamp
+# whose high bytes are zero, i.e. base64 "gAAAAA".
+FERNET_TOKEN_PREFIX = b"gAAAAA"
+
+
+def _binary_embedding_offset(metadata_length: int) -> int:
+    unaligned = BINARY_HEADER.size + metadata_length
+    return (unaligned + 15) // 16 * 16
+
+
+def _parse_binary_header(blob: bytes) -> Tuple[int, int, int, int]:
+    if len(blob) < BINARY_HEADER.size:
+        raise ValueError("Binary VoiceDNA file is invalid or truncated")
+    magic, version, flags, _, dims, metadata_length = BINARY_HEADER.unpack_from(blob)
+    if magic != BINARY_MAGIC:
+        raise ValueError("Not a binary VoiceDNA container")
+    if version > BINARY_VERSION:
+        raise ValueError(f"Unsupported binary VoiceDNA version: {version}")
+    return version, flags, dims, metadata_length
+
+
+def is_binary_container(blob: bytes) -> bool:
+    """True if ``blob`` is a binary container rather than a legacy ``.enc`` file.
+
+    Legacy encrypted files start with a random salt, so the magic alone could
+    match one by chance; the layout after the header must match too. Legacy
+    files always carry a Fernet token at offset 16, plain containers their
+    JSON metadata and encrypted containers salt + token (at offset 32).
+    """
+    if not blob.startswith(BINARY_MAGIC):
+        return False
+    try:
+        _, flags, _, metadata_length = _parse_binary_header(blob)
+    except ValueError:
+        return False
+    body = blob[BINARY_HEADER.size :]
+    if flags & BINARY_FLAG_ENCRYPTED:
+        return metadata_length == 0 and body[16:].startswith(FERNET_TOKEN_PREFIX)
+    return body.startswith(b"{")
+
+
+def _open_binary_container(blob: bytes, password: str | None = None) -> bytes:
+    flags = _parse_binary_header(blob)[1]
+    if not flags & BINARY_FLAG_ENCRYPTED:
+        return blob
+    if not password:
+        raise ValueError("Binary VoiceDNA file is encrypted; a password is required")
+    plain = VoiceDNA._decrypt_payload(password, blob[BINARY_HEADER.size :])
+    if _parse_binary_header(plain)[1] & BINARY_FLAG_ENCRYPTED:
+        raise ValueError("Binary VoiceDNA payload is invalid")
+    return plain
+
+
+def load_embedding_array(filepath: str, password: str | None = None) -> Any:
+    """Return ``core_embedding`` of a binary container as a float32 array.
+
+    Plain containers are memory-mapped, encrypted ones are viewed directly in
+    the decrypted buffer; neither path copies the embedding.
+    """
+    import numpy as np
+
+    with open(filepath, "rb") as file_handle:
+        head = file_handle.read(BINARY_HEADER.size)
+        _, flags, dims, metadata_length = _parse_binary_header(head)
+        if flags & BINARY_FLAG_ENCRYPTED:
+            plain = _open_binary_container(head + file_handle.read(), password)
+            dims, metadata_length = _parse_binary_header(plain)[2:]
+            return np.frombuffer(
+                plain,
+                dtype="<f4",
+                count=dims,
+                offset=_binary_embedding_offset(metadata_length),
+            )
+
+    return np.memmap(
+        filepath,
+        dtype="<f4",
+        mode="r",
+        offset=_binary_embedding_offset(metadata_length),
+        shape=(dims,),
+    )
+
+
+def convert_to_binary(
+    source_path: str,
+    password: str | None = None,
+    encrypt: bool = True,
+    remove_source: bool = False,
+) -> Path:
+    source = Path(source_path)
+    with open(source, "rb") as file_handle:
+        blob = file_handle.read()
+
+    if is_binary_container(blob):
+        dna = VoiceDNA.from_binary(blob, password=password)
+    elif source.name.endswith(".json"):
+        dna = VoiceDNA(**json.loads(blob.decode("utf-8")))
+    else:
+        if not password:
+            raise ValueError(f"{source} is encrypted; a password is required")
+        dna = VoiceDNA.load_encrypted(password=password, filepath=str(source))
+
+    name = source.name
+    for suffix in (".voicedna.enc", ".voicedna.json", ".json", ".enc", BINARY_SUFFIX):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    target = source.with_name(name + BINARY_SUFFIX)
+    dna.save_binary(str(target), password=password if encrypt else None)
+    if remove_source and target != source:
+        source.unlink()
+    return target
+
 
 @dataclass
 class VoiceDNA:
@@ -37,15 +388,19 @@ class VoiceDNA:
 
     @staticmethod
     def create_new(
-        imprint_audio_description: str, user_name: str = "user"
+        imprint_audio_description: str,
+        user_name: str = "user",
+        core_embedding: List[float] | None = None,
     ) -> "VoiceDNA":
         now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        if core_embedding is None:
+            core_embedding = VoiceDNA._extract_core_embedding(
+                imprint_audio_description, dims=256
+            )
         return VoiceDNA(
             voice_fingerprint_id=f"vdna_{user_name}_{datetime.now(timezone.utc).strftime('%Y%m%d')}_{uuid.uuid4().hex[:8]}",
             imprint_source=imprint_audio_description,
-            core_embedding=VoiceDNA._extract_core_embedding(
-                imprint_audio_description, dims=256
-            ),
+            core_embedding=list(core_embedding),
             unique_traits=[
                 "gentle_rising_on_questions",
                 "warm_hum_before_big_ideas",
@@ -66,23 +421,60 @@ class VoiceDNA:
     def _extract_core_embedding(imprint_source: str, dims: int = 256) -> List[float]:
         path = Path(imprint_source)
         if path.exists() and path.is_file():
-            try:
-                return VoiceDNA._extract_with_resemblyzer(path, dims=dims)
-            except Exception:
-                pass
-            try:
-                return VoiceDNA._extract_with_speechbrain(path, dims=dims)
-            except Exception:
-                pass
+            from voicedna.consistency import NUMPY_EXTRACTOR_VERSION
+            from voicedna.embedding_cache import file_content_hash, get_embedding_cache
+            from voicedna.encoders import get_encoder_pool
+            from voicedna.streaming import StreamingEmbeddingExtractor, should_stream
+
+            # Duration only decides whether the decode is streamed; both paths
+            # try the same backends in the same order, so embeddings of short
+            # and long imprints stay comparable.
+            if should_stream(path):
+                try:
+                    return StreamingEmbeddingExtractor().extract(path, dims).embedding
+                except Exception:
+                    pass
+
+            cache = get_embedding_cache()
+            pool = get_encoder_pool()
+            content_hash = file_content_hash(path) if cache.enabled else ""
+            for backend, extractor in (
+                ("resemblyzer", VoiceDNA._extract_with_resemblyzer),
+                ("speechbrain", VoiceDNA._extract_with_speechbrain),
+                ("numpy", VoiceDNA._extract_with_numpy),
+            ):
+                if backend != "numpy" and not pool.is_available(backend):
+                    continue
+                cache_key = None
+                if cache.enabled:
+                    cache_key = cache.make_key(
+                        content_hash,
+                        f"imprint:{backend}",
+                        NUMPY_EXTRACTOR_VERSION
+                        if backend == "numpy"
+                        else pool.model_version(backend),
+                        dims,
+                    )
+                    cached = cache.get(cache_key)
+                    if cached is not None:
+                        return cached
+                try:
+                    embedding = extractor(path, dims=dims)
+                except Exception:
+                    continue
+                if cache_key is not None:
+                    cache.put(cache_key, embedding, backend=backend)
+                return embedding
 
         return VoiceDNA._legacy_core_embedding(imprint_source, dims=dims)
 
     @staticmethod
     def _extract_with_resemblyzer(audio_path: Path, dims: int = 256) -> List[float]:
         import numpy as np
-        from resemblyzer import VoiceEncoder, preprocess_wav
+        from voicedna.encoders import get_encoder_pool
 
-        embedding = VoiceEncoder().embed_utterance(preprocess_wav(str(audio_path)))
+        encoder, preprocess_wav = get_encoder_pool().resemblyzer()
+        embedding = encoder.embed_utterance(preprocess_wav(str(audio_path)))
         return VoiceDNA._fit_embedding_dims(
             np.asarray(embedding, dtype=np.float32), dims=dims
         )
@@ -90,9 +482,12 @@ class VoiceDNA:
     @staticmethod
     def _extract_with_speechbrain(audio_path: Path, dims: int = 256) -> List[float]:
         import numpy as np
+        from voicedna.encoders import get_encoder_pool
+
+        classifier = get_encoder_pool().speechbrain()
+
         import torch
         import torchaudio
-        from speechbrain.pretrained import EncoderClassifier
 
         waveform, sample_rate = torchaudio.load(str(audio_path))
         if waveform.shape[0] > 1:
@@ -100,9 +495,6 @@ class VoiceDNA:
         if sample_rate != 16000:
             waveform = torchaudio.functional.resample(waveform, sample_rate, 16000)
 
-        classifier = EncoderClassifier.from_hparams(
-            source="speechbrain/spkrec-ecapa-voxceleb"
-        )
         embedding = (
             classifier.encode_batch(waveform.to(torch.float32))
             .detach()
@@ -114,6 +506,15 @@ class VoiceDNA:
             np.asarray(embedding, dtype=np.float32), dims=dims
         )
 
+    @staticmethod
+    def _extract_with_numpy(audio_path: Path, dims: int = 256) -> List[float]:
+        from voicedna.consistency import VoiceConsistencyEngine, _read_wav_bytes
+
+        sample_rate, mono = _read_wav_bytes(audio_path.read_bytes())
+        return VoiceConsistencyEngine().embed_waveform(
+            mono / 32768.0, sample_rate, "numpy", dims
+        )
+
     @staticmethod
     def _legacy_core_embedding(imprint_source: str, dims: int = 256) -> List[float]:
         chunks: List[float] = []
@@ -153,26 +554,82 @@ class VoiceDNA:
             algorithm=hashes.SHA256(),
             length=32,
             salt=resolved_salt,
-            iterations=480000,
+            iterations=KDF_ITERATIONS,
         )
         key = base64.urlsafe_b64encode(kdf.derive(password.encode("utf-8")))
         return key, resolved_salt
 
+    @staticmethod
+    def clear_key_cache(include_session: bool = True) -> None:
+        KEY_CACHE.wipe(include_session=include_session)
+
     def save(self, filepath: str = "myai.voicedna.json"):
         with open(filepath, "w") as f:
             json.dump(asdict(self), f, indent=2)
 
     def save_encrypted(self, password: str, filepath: str = "myai.voicedna.enc"):
         payload = json.dumps(asdict(self)).encode("utf-8")
-        key, salt = self._derive_key(password)
-        encrypted = Fernet(key).encrypt(payload)
         with open(filepath, "wb") as file_handle:
-            file_handle.write(salt + encrypted)
+            file_handle.write(VoiceDNA._encrypt_payload(password, payload))
+
+    def to_binary(self, password: str | None = None) -> bytes:
+        metadata = asdict(self)
+        embedding = metadata.pop("core_embedding")
+        metadata_bytes = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+        embedding_bytes = struct.pack(f"<{len(embedding)}f", *embedding)
+        padding = b"\x00" * (
+            _binary_embedding_offset(len(metadata_bytes))
+            - BINARY_HEADER.size
+            - len(metadata_bytes)
+        )
+        plain = (
+            BINARY_HEADER.pack(
+                BINARY_MAGIC, BINARY_VERSION, 0, 0, len(embedding), len(metadata_bytes)
+            )
+            + metadata_bytes
+            + padding
+            + embedding_bytes
+        )
+        if password is None:
+            return plain
+
+        return BINARY_HEADER.pack(
+            BINARY_MAGIC, BINARY_VERSION, BINARY_FLAG_ENCRYPTED, 0, len(embedding), 0
+        ) + VoiceDNA._encrypt_payload(password, plain)
+
+    def save_binary(
+        self, filepath: str = "myai.voicedna.bin", password: str | None = None
+    ):
+        with open(filepath, "wb") as file_handle:
+            file_handle.write(self.to_binary(password=password))
+
+    @staticmethod
+    def from_binary(blob: bytes, password: str | None = None) -> "VoiceDNA":
+        plain = _open_binary_container(blob, password)
+        dims, metadata_length = _parse_binary_header(plain)[2:]
+        metadata = json.loads(
+            bytes(plain[BINARY_HEADER.size : BINARY_HEADER.size + metadata_length])
+        )
+        offset = _binary_embedding_offset(metadata_length)
+        metadata["core_embedding"] = list(
+            struct.unpack_from(f"<{dims}f", plain, offset)
+        )
+        return VoiceDNA(**metadata)
+
+    @staticmethod
+    def load_binary(
+        filepath: str = "myai.voicedna.bin", password: str | None = None
+    ) -> "VoiceDNA":
+        with open(filepath, "rb") as file_handle:
+            return VoiceDNA.from_binary(file_handle.read(), password=password)
 
     @staticmethod
     def load(filepath: str = "myai.voicedna.json") -> "VoiceDNA":
-        with open(filepath) as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            blob = f.read()
+        if blob.startswith(BINARY_MAGIC):
+            return VoiceDNA.from_binary(blob)
+        data = json.loads(blob.decode("utf-8"))
         return VoiceDNA(**data)
 
     @staticmethod
@@ -182,14 +639,33 @@ class VoiceDNA:
         with open(filepath, "rb") as file_handle:
             blob = file_handle.read()
 
+        if is_binary_container(blob):
+            return VoiceDNA.from_binary(blob, password=password)
+
+        decrypted = VoiceDNA._decrypt_payload(password, blob).decode("utf-8")
+        return VoiceDNA(**json.loads(decrypted))
+
+    @staticmethod
+    def _encrypt_payload(password: str, payload: bytes) -> bytes:
+        key, salt = VoiceDNA._derive_key(password)
+        KEY_CACHE.put(password, salt, key)
+        return salt + Fernet(key).encrypt(payload)
+
+    @staticmethod
+    def _decrypt_payload(password: str, blob: bytes) -> bytes:
         if len(blob) <= 16:
             raise ValueError("Encrypted file is invalid or truncated")
 
         salt = blob[:16]
         ciphertext = blob[16:]
-        key, _ = VoiceDNA._derive_key(password, salt)
-        decrypted = Fernet(key).decrypt(ciphertext).decode("utf-8")
-        return VoiceDNA(**json.loads(decrypted))
+        key = KEY_CACHE.get(password, salt) if password else None
+        cached = key is not None
+        if key is None:
+            key, _ = VoiceDNA._derive_key(password, salt)
+        decrypted = Fernet(key).decrypt(ciphertext)
+        if not cached:
+            KEY_CACHE.put(password, salt, key)
+        return decrypted
 
     def get_current_age(self) -> float:
         now = datetime.now(timezone.utc)
@@ -8,8 +8,17 @@ from __future__ import annotations
 
 try:
     from .voice_dna import VoiceDNA  # noqa: F401
-    from .consistency import VoiceConsistencyEngine  # noqa: F401
-    from .framework import VoiceDNAProcessor  # noqa: F401
+    from .audio import AudioBuffer  # noqa: F401
+    from .aio import AsyncProcessor, get_async_processor  # noqa: F401
+    from .consistency import ConsistencyEnginePool, VoiceConsistencyEngine  # noqa: F401
+    from .consistency_matrix import ConsistencyMatrix, score_matrix  # noqa: F401
+    from .drift import DriftMonitor, get_drift_monitor  # noqa: F401
+    from .encoders import SpeakerEncoderPool, get_encoder_pool  # noqa: F401
+    from .framework import BatchProcessPool, VoiceDNAProcessor  # noqa: F401
+    from .render_cache import RenderCache, get_render_cache  # noqa: F401
+    from .watermark import WatermarkDetection, detect_sonic_watermark  # noqa: F401
+    from .watermark_index import WatermarkIndex  # noqa: F401
+    from .store import VoiceDNAStore  # noqa: F401
     from .filters import AgeMaturationFilter, ImprintConverterFilter  # noqa: F401
     from .providers import PersonaPlexTTS, PiperTTS  # noqa: F401
     from .synthesis import (  # noqa: F401
@@ -17,9 +26,13 @@ try:
         play_wav_bytes,
         select_natural_backend,
         synthesize_and_process,
+        synthesize_and_process_async,
     )
     from .plugins import (  # noqa: F401
         Base64PassThroughFilter,
+        FilterStream,
+        IAudioBufferFilter,
+        IStreamingFilter,
         IVoiceDNAFilter,
         PluginManager,
         PromptTagFilter,
@@ -0,0 +1,198 @@
+"""asyncio front end for synthesis and the VoiceDNA filter chain."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from typing import Any, Callable, Dict
+
+from voice_dna import VoiceDNA
+
+from .budget import BUDGET_PARAM, remaining_budget_ms
+from .framework import ProcessResult, VoiceDNAProcessor, _cacheable
+from .render_cache import RENDER_CACHE_PARAM, RenderEntry, get_render_cache
+
+
+DEFAULT_CONCURRENCY = 16
+
+
+class AsyncProcessor:
+    """Drive a shared :class:`VoiceDNAProcessor` from an event loop.
+
+    At most ``max_concurrency`` utterances are in flight per event loop
+    (``VOICEDNA_ASYNC_CONCURRENCY``, default 16); further callers wait for a
+    slot. Filter chains and providers without ``synthesize_async`` run on
+    ``executor`` (the loop's default executor when ``None``). Cancelling a
+    task kills its synthesis subprocess and drops executor work that has not
+    started; a filter chain already running on a thread finishes in the
+    background and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        processor: VoiceDNAProcessor | None = None,
+        max_concurrency: int | None = None,
+        executor: Executor | None = None,
+    ):
+        self.processor = processor or VoiceDNAProcessor()
+        self.max_concurrency = max(1, max_concurrency or _default_concurrency())
+        self.executor = executor
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def slot(self) -> asyncio.Semaphore:
+        """The running loop's concurrency semaphore (use with ``async with``)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    async def run_blocking(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def process(
+        self,
+        audio_bytes: bytes,
+        dna: VoiceDNA,
+        params: Dict | None = None,
+        acquire: bool = True,
+        budget_ms: float | None = None,
+    ) -> ProcessResult:
+        """Process off-loop; ``budget_ms`` includes time spent waiting for a slot."""
+        started_at = time.perf_counter()
+        async with self._maybe_slot(acquire):
+            return await self.run_blocking(
+                self.processor.process_with_report,
+                audio_bytes,
+                dna,
+                params,
+                budget_ms=remaining_budget_ms(budget_ms, started_at),
+            )
+
+    async def synthesize(
+        self, tts_provider: Any, text: str, acquire: bool = True
+    ) -> bytes:
+        async with self._maybe_slot(acquire):
+            return await self._synthesize(tts_provider, text)
+
+    async def synthesize_and_process(
+        self,
+        text: str,
+        dna: VoiceDNA,
+        tts_provider: Any,
+        params: Dict | None = None,
+        acquire: bool = True,
+        budget_ms: float | None = None,
+    ) -> ProcessResult:
+        started_at = time.perf_counter()
+        async with self._maybe_slot(acquire):
+            process_params = dict(params or {})
+            process_params["tts.backend"] = tts_provider.__class__.__name__
+            if budget_ms is None:
+                budget_ms = process_params.pop(BUDGET_PARAM, None)
+            cache = get_render_cache()
+            if not (process_params.pop(RENDER_CACHE_PARAM, True) and cache.enabled):
+                return await self._render(
+                    text, dna, tts_provider, process_params, budget_ms, started_at
+                )
+
+            key = self.processor.render_key(text, dna, tts_provider, process_params)
+            entry, tier = cache.get(key)
+            result = None
+            if entry is None:
+                future, leader = cache.claim(key)
+                if leader:
+                    try:
+                        result = await self._render(
+                            text, dna, tts_provider, process_params, budget_ms, started_at
+                        )
+                    except Exception as error:
+                        cache.release(key, future, error=error)
+                        raise
+                    except BaseException:
+                        cache.release(
+                            key, future, error=RuntimeError("render was cancelled")
+                        )
+                        raise
+                    cache.release(
+                        key,
+                        future,
+                        entry=RenderEntry(result.audio, result.report),
+                        cacheable=_cacheable(result.report),
+                    )
+                else:
+                    # Shield so a cancelled follower does not cancel the leader's future.
+                    entry = (await asyncio.shield(asyncio.wrap_future(future))).copy()
+                    tier = "coalesced"
+            if result is None:
+                result = ProcessResult(
+                    audio=entry.audio, report=entry.report, params=process_params
+                )
+            result.report[RENDER_CACHE_PARAM] = {
+                **cache.stats(),
+                "hit": tier != "miss",
+                "tier": tier,
+            }
+            return result
+
+    async def _render(
+        self,
+        text: str,
+        dna: VoiceDNA,
+        tts_provider: Any,
+        params: Dict,
+        budget_ms: float | None,
+        started_at: float,
+    ) -> ProcessResult:
+        raw_audio = await self._synthesize(tts_provider, text)
+        return await self.run_blocking(
+            self.processor.process_with_report,
+            raw_audio,
+            dna,
+            params,
+            budget_ms=remaining_budget_ms(budget_ms, started_at),
+        )
+
+    async def _synthesize(self, tts_provider: Any, text: str) -> bytes:
+        synthesize_async = getattr(tts_provider, "synthesize_async", None)
+        if synthesize_async is not None:
+            return await synthesize_async(text)
+        if not hasattr(tts_provider, "synthesize"):
+            raise ValueError(
+                "tts_provider must implement synthesize(text) -> wav bytes"
+            )
+        return await self.run_blocking(tts_provider.synthesize, text)
+
+    def _maybe_slot(self, acquire: bool):
+        return self.slot() if acquire else nullcontext()
+
+
+def _default_concurrency() -> int:
+    try:
+        return int(os.getenv("VOICEDNA_ASYNC_CONCURRENCY", str(DEFAULT_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_CONCURRENCY
+
+
+_ASYNC_PROCESSOR: AsyncProcessor | None = None
+_ASYNC_PROCESSOR_LOCK = threading.Lock()
+
+
+def get_async_processor() -> AsyncProcessor:
+    global _ASYNC_PROCESSOR
+    with _ASYNC_PROCESSOR_LOCK:
+        if _ASYNC_PROCESSOR is None:
+            _ASYNC_PROCESSOR = AsyncProcessor()
+        return _ASYNC_PROCESSOR
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import wave
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class AudioBuffer:
+    """Decoded audio shared between filters in one processing pass.
+
+    ``samples`` is float32 in [-1, 1] with shape ``(frames,)`` for mono or
+    ``(frames, channels)`` otherwise. Filters treat buffers as immutable and
+    return a new one via :meth:`replace`.
+    """
+
+    samples: np.ndarray
+    sample_rate: int
+    audio_format: str = "wav"
+
+    @property
+    def channels(self) -> int:
+        return 1 if self.samples.ndim == 1 else int(self.samples.shape[1])
+
+    @property
+    def frames(self) -> int:
+        return int(self.samples.shape[0])
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    def mono(self) -> np.ndarray:
+        if self.samples.ndim == 1:
+            return self.samples
+        return self.samples.mean(axis=1, dtype=np.float32)
+
+    def replace(self, samples: np.ndarray) -> "AudioBuffer":
+        return AudioBuffer(
+            samples=np.asarray(samples, dtype=np.float32),
+            sample_rate=self.sample_rate,
+            audio_format=self.audio_format,
+        )
+
+    @staticmethod
+    def from_bytes(audio_bytes: bytes, audio_format: str = "wav") -> "AudioBuffer":
+        if audio_format == "wav":
+            sample_rate, samples = _decode_pcm16_wav(audio_bytes)
+        else:
+            sample_rate, samples = _decode_with_pydub(audio_bytes, audio_format)
+        return AudioBuffer(
+            samples=samples, sample_rate=sample_rate, audio_format=audio_format
+        )
+
+    def to_bytes(self) -> bytes:
+        pcm = np.clip(np.round(self.samples * 32768.0), -32768, 32767).astype("<i2")
+        output = io.BytesIO()
+        with wave.open(output, "wb") as wave_file:
+            wave_file.setnchannels(self.channels)
+            wave_file.setsampwidth(2)
+            wave_file.setframerate(self.sample_rate)
+            wave_file.writeframes(pcm.tobytes())
+        if self.audio_format == "wav":
+            return output.getvalue()
+
+        from pydub import AudioSegment
+
+        segment = AudioSegment.from_file(io.BytesIO(output.getvalue()), format="wav")
+        encoded = io.BytesIO()
+        segment.export(encoded, format=self.audio_format)
+        return encoded.getvalue()
+
+
+def _decode_pcm16_wav(audio_bytes: bytes) -> tuple[int, np.ndarray]:
+    with wave.open(io.BytesIO(audio_bytes), "rb") as wave_file:
+        channels = wave_file.getnchannels()
+        sample_width = wave_file.getsampwidth()
+        sample_rate = wave_file.getframerate()
+        raw_frames = wave_file.readframes(wave_file.getnframes())
+
+    if sample_width != 2:
+        raise ValueError("Only 16-bit PCM WAV is supported by AudioBuffer")
+
+    samples = np.frombuffer(raw_frames, dtype="<i2").astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    return sample_rate, samples
+
+
+def _decode_with_pydub(audio_bytes: bytes, audio_format: str) -> tuple[int, np.ndarray]:
+    from pydub import AudioSegment
+
+    segment = AudioSegment.from_file(io.BytesIO(audio_bytes), format=audio_format)
+    segment = segment.set_sample_width(2)
+    samples = np.asarray(segment.get_array_of_samples(), dtype=np.float32) / 32768.0
+    if segment.channels > 1:
+        samples = samples.reshape(-1, segment.channels)
+    return segment.frame_rate, samples
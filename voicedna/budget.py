@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List
+
+BUDGET_PARAM = "latency_budget_ms"
+
+
+def remaining_budget_ms(budget_ms: float | None, started_at: float) -> float | None:
+    """What is left of ``budget_ms`` since ``started_at``; None means unbounded."""
+    if budget_ms is None:
+        return None
+    return budget_ms - (time.perf_counter() - started_at) * 1000
+
+
+class StageCosts:
+    """Self-calibrating per-audio-second cost estimates for named stages.
+
+    ``defaults`` seed each stage until it has been timed once; after that the
+    estimate is an exponentially weighted average of observed costs.
+    """
+
+    def __init__(self, defaults: Dict[str, float], alpha: float = 0.2):
+        self.defaults = dict(defaults)
+        self.alpha = alpha
+        self._observed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def estimate_ms(self, stage: str, audio_seconds: float) -> float:
+        with self._lock:
+            per_second = self._observed.get(stage, self.defaults.get(stage, 0.0))
+        return per_second * max(audio_seconds, 0.1)
+
+    def observe(self, stage: str, elapsed_seconds: float, audio_seconds: float) -> None:
+        per_second = elapsed_seconds * 1000 / max(audio_seconds, 0.1)
+        with self._lock:
+            previous = self._observed.get(stage)
+            self._observed[stage] = (
+                per_second
+                if previous is None
+                else previous + self.alpha * (per_second - previous)
+            )
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            merged = {**self.defaults, **self._observed}
+        return {stage: round(value, 3) for stage, value in merged.items()}
+
+
+class LatencyBudget:
+    """Deadline for one processor call and the record of what it cost.
+
+    Before each filter the processor calls :meth:`admit`. A filter whose
+    estimate exceeds the remaining budget is first asked to ``degrade``
+    itself (drop expensive stages); an ``optional`` filter that still does not
+    fit is skipped. Required filters always run.
+    """
+
+    def __init__(self, budget_ms: float, started_at: float | None = None):
+        self.budget_ms = float(budget_ms)
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.skipped: List[str] = []
+        self.degraded: List[str] = []
+
+    @classmethod
+    def from_params(
+        cls, budget_ms: float | None, params: Dict[str, Any]
+    ) -> "LatencyBudget | None":
+        if budget_ms is None:
+            budget_ms = params.get(BUDGET_PARAM)
+        if budget_ms is None:
+            return None
+        params[BUDGET_PARAM] = float(budget_ms)
+        return cls(float(budget_ms))
+
+    def remaining_ms(self) -> float:
+        return remaining_budget_ms(self.budget_ms, self.started_at)
+
+    def admit(self, filter_obj: Any, params: Dict[str, Any], audio_seconds: float) -> bool:
+        remaining = self.remaining_ms()
+        estimate = getattr(filter_obj, "estimate_cost_ms", None)
+        if estimate is None or estimate(params, audio_seconds) <= remaining:
+            return True
+
+        degrade = getattr(filter_obj, "degrade", None)
+        if degrade is not None:
+            for stage in degrade(params, remaining, audio_seconds):
+                self.degraded.append(f"{filter_obj.name()}.{stage}")
+        if (
+            getattr(filter_obj, "optional", False)
+            and estimate(params, audio_seconds) > remaining
+        ):
+            self.skipped.append(filter_obj.name())
+            return False
+        return True
+
+    def report(self) -> Dict[str, Any]:
+        remaining = self.remaining_ms()
+        return {
+            "budget_ms": round(self.budget_ms, 3),
+            "remaining_ms": round(remaining, 3),
+            "exceeded": remaining < 0,
+            "skipped": list(self.skipped),
+            "degraded": list(self.degraded),
+        }
@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import hashlib
 import io
-import math
+import threading
 import wave
+from collections import OrderedDict
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
 
 import numpy as np
 
+from .audio import AudioBuffer
+from .embedding_cache import audio_content_hash, get_embedding_cache
+from .encoders import BACKENDS, get_encoder_pool
+from .vad import WINDOW_STRATEGIES, select_scoring_windows
+from .watermark import add_watermark, get_watermark_cache
+
+NUMPY_EXTRACTOR_VERSION = "numpy-mfcc-v2"
+
 
 def cosine_similarity(left: Sequence[float], right: Sequence[float]) -> float:
     left_array = np.asarray(left, dtype=np.float32)
@@ -27,6 +36,33 @@ def cosine_similarity(left: Sequence[float], right: Sequence[float]) -> float:
     return float(np.dot(left_array, right_array) / (left_norm * right_norm))
 
 
+def _mean_direction(vectors: Sequence[Sequence[float]], dims: int) -> list[float]:
+    """Unit-length mean of the L2-normalised ``vectors``."""
+    total = np.zeros(dims, dtype=np.float64)
+    for vector in vectors:
+        fitted = np.asarray(_fit_embedding_dims(vector, dims=dims), dtype=np.float64)
+        norm = float(np.linalg.norm(fitted))
+        if norm > 0.0:
+            total += fitted / norm
+    norm = float(np.linalg.norm(total))
+    if norm == 0.0:
+        return [0.0] * dims
+    return (total / norm).astype(np.float32).tolist()
+
+
+def _unit_distance(first: Sequence[float], second: Sequence[float]) -> float:
+    """Euclidean distance between the unit vectors, i.e. ``sqrt(2 - 2 cos)``.
+
+    Computed in float64 so small drifts do not round to zero.
+    """
+    a = np.asarray(first, dtype=np.float64)
+    b = np.asarray(second, dtype=np.float64)
+    norm_a, norm_b = np.linalg.norm(a), np.linalg.norm(b)
+    if norm_a == 0.0 or norm_b == 0.0 or a.shape != b.shape:
+        return 2.0
+    return float(np.linalg.norm(a / norm_a - b / norm_b))
+
+
 def _fit_embedding_dims(values: Iterable[float], dims: int = 256) -> list[float]:
     array = np.asarray(list(values), dtype=np.float32)
     if array.size == 0:
@@ -72,6 +108,17 @@ def _read_wav_bytes(audio_bytes: bytes) -> tuple[int, np.ndarray]:
     return sample_rate, samples
 
 
+def _resample_linear(
+    waveform: np.ndarray, sample_rate: int, target_rate: int
+) -> np.ndarray:
+    if sample_rate == target_rate or waveform.size <= 1:
+        return waveform
+    source = np.linspace(0.0, 1.0, waveform.size, dtype=np.float32)
+    target_length = int(waveform.size * (target_rate / sample_rate))
+    target = np.linspace(0.0, 1.0, max(target_length, 1), dtype=np.float32)
+    return np.interp(target, source, waveform)
+
+
 def _decode_wav_bytes(audio_bytes: bytes) -> tuple[int, np.ndarray]:
     sample_rate, mono = _read_wav_bytes(audio_bytes)
     return sample_rate, mono.astype(np.int16)
@@ -98,16 +145,58 @@ class VoiceConsistencyEngine:
         threshold: float = 0.92,
         correction_strength: float = 0.10,
         watermark_depth: float = 0.002,
+        proxy_margin: float | None = None,
+        scoring_windows: int = 0,
+        scoring_window_seconds: float = 1.5,
+        scoring_strategy: str = "vad",
     ):
+        if scoring_strategy not in WINDOW_STRATEGIES:
+            raise ValueError(
+                f"Unknown scoring strategy '{scoring_strategy}'; "
+                f"expected one of {WINDOW_STRATEGIES}"
+            )
         self.threshold = threshold
         self.correction_strength = correction_strength
         self.watermark_depth = watermark_depth
+        # Opt-in heuristic in _rescore_corrected: None always re-extracts.
+        self.proxy_margin = proxy_margin
+        # Consistency scoring embeds at most ``scoring_windows`` windows
+        # (0 scores the whole clip); see _scoring_embedder.
+        self.scoring_windows = scoring_windows
+        self.scoring_window_seconds = scoring_window_seconds
+        self.scoring_strategy = scoring_strategy
+        # Carriers pinned by warmup(), immune to watermark-cache eviction.
+        self._pinned: Dict[Tuple[str, int], np.ndarray] = {}
+
+    def warmup(
+        self,
+        voice_fingerprint_ids: Iterable[str] = (),
+        sample_rates: Iterable[int] = (16000, 22050, 24000),
+        encoders: bool = True,
+    ) -> Dict[str, Any]:
+        """Load speaker encoders and pin watermark carriers ahead of traffic."""
+        loaded = get_encoder_pool().warmup() if encoders else {}
+        for voice_fingerprint_id in voice_fingerprint_ids:
+            for sample_rate in sample_rates:
+                key = (voice_fingerprint_id, int(sample_rate))
+                self._pinned[key] = get_watermark_cache().pattern(
+                    voice_fingerprint_id, int(sample_rate), self.watermark_depth
+                )
+        return {"encoders": loaded, "pinned_carriers": len(self._pinned)}
 
     def extract_embedding_from_imprint(
         self, imprint_source: str, dims: int = 256
     ) -> list[float]:
         path = Path(imprint_source)
         if path.exists() and path.is_file():
+            from .streaming import StreamingEmbeddingExtractor, should_stream
+
+            if should_stream(path):
+                try:
+                    extractor = StreamingEmbeddingExtractor(engine=self)
+                    return extractor.extract(path, dims=dims).embedding
+                except Exception:
+                    pass
             try:
                 return self.extract_embedding_from_audio(path.read_bytes(), dims=dims)
             except Exception:
@@ -117,51 +206,355 @@ class VoiceConsistencyEngine:
     def extract_embedding_from_audio(
         self, audio_bytes: bytes, dims: int = 256
     ) -> list[float]:
-        for extractor in (
-            self._extract_with_resemblyzer,
-            self._extract_with_speechbrain,
-            self._extract_with_numpy,
-        ):
+        return self._extract_cached(
+            lambda: audio_content_hash(audio_bytes),
+            lambda backend: getattr(self, f"_extract_with_{backend}")(
+                audio_bytes, dims
+            ),
+            dims,
+        )
+
+    def extract_embedding_from_buffer(
+        self, buffer: AudioBuffer, dims: int = 256
+    ) -> list[float]:
+        mono = buffer.mono()
+        return self._extract_cached(
+            lambda: audio_content_hash(
+                buffer.sample_rate.to_bytes(4, "little") + mono.tobytes()
+            ),
+            lambda backend: self.embed_waveform(mono, buffer.sample_rate, backend, dims),
+            dims,
+        )
+
+    def _extract_cached(
+        self,
+        content_hash: Callable[[], str],
+        extract: Callable[[str], list[float]],
+        dims: int,
+    ) -> list[float]:
+        return self._extract_cached_with_backend(content_hash, extract, dims)[0]
+
+    def _extract_cached_with_backend(
+        self,
+        content_hash: Callable[[], str],
+        extract: Callable[[str], list[float]],
+        dims: int,
+    ) -> tuple[list[float], str | None]:
+        cache = get_embedding_cache()
+        pool = get_encoder_pool()
+        digest = content_hash() if cache.enabled else ""
+
+        for backend in ("resemblyzer", "speechbrain", "numpy"):
+            if backend != "numpy" and not pool.is_available(backend):
+                continue
+            cache_key = None
+            if cache.enabled:
+                cache_key = cache.make_key(
+                    digest, backend, self.model_version(backend), dims
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached, backend
             try:
-                embedding = extractor(audio_bytes, dims)
+                embedding = extract(backend)
                 if embedding and len(embedding) > 0:
-                    return _fit_embedding_dims(embedding, dims=dims)
+                    fitted = _fit_embedding_dims(embedding, dims=dims)
+                    if cache_key is not None:
+                        cache.put(cache_key, fitted, backend=backend)
+                    return fitted, backend
             except Exception:
                 continue
-        return [0.0] * dims
+        return [0.0] * dims, None
+
+    def model_version(self, backend: str) -> str:
+        """Version tag of ``backend``'s extractor, part of every cache key."""
+        if backend == "numpy":
+            return NUMPY_EXTRACTOR_VERSION
+        return get_encoder_pool().model_version(backend)
+
+    def preferred_backend(self) -> str:
+        """First backend that loads here, in extraction order; numpy if none do."""
+        pool = get_encoder_pool()
+        for backend in BACKENDS:
+            if not pool.is_available(backend):
+                continue
+            try:
+                pool.acquire(backend)
+            except Exception:
+                continue
+            return backend
+        return "numpy"
 
     def enforce_consistency(
         self,
         audio_bytes: bytes,
         core_embedding: Sequence[float],
         voice_fingerprint_id: str,
+        correction: bool = True,
+        details: dict | None = None,
     ) -> tuple[bytes, float, bool, bool]:
-        current_embedding = self.extract_embedding_from_audio(
-            audio_bytes, dims=len(core_embedding) or 256
+        """Score, correct if needed and watermark one WAV in a single decode.
+
+        ``details`` (optional) receives how the corrected audio was re-scored;
+        see :meth:`_rescore_corrected`.
+        """
+        dims = len(core_embedding) or 256
+        try:
+            sample_rate, mono = _read_wav_bytes(audio_bytes)
+        except Exception:
+            score = cosine_similarity(
+                self.extract_embedding_from_audio(audio_bytes, dims=dims),
+                core_embedding,
+            )
+            return audio_bytes, score, score >= self.threshold, False
+
+        waveform = mono / 32768.0
+        embed, tag = self._scoring_embedder(waveform, sample_rate, dims, details)
+        embedding, backend = self._extract_cached_with_backend(
+            lambda: audio_content_hash(audio_bytes) + tag,
+            lambda name: embed(waveform, name),
+            dims,
         )
-        score = cosine_similarity(current_embedding, core_embedding)
-        corrected = audio_bytes
+        score = cosine_similarity(embedding, core_embedding)
+        samples = mono.astype(np.int16)
         correction_applied = False
 
-        if score < self.threshold:
-            correction_ratio = max(
-                0.0,
-                min(1.0, (self.threshold - score) * (1.0 + self.correction_strength)),
-            )
-            corrected = self._apply_parametric_correction(audio_bytes, correction_ratio)
-            correction_applied = corrected != audio_bytes
+        correction_ratio = self._correction_ratio(score) if correction else 0.0
+        if correction_ratio > 0.0:
+            corrected = np.clip(
+                self._correct_samples(samples.astype(np.float32) / 32768.0, correction_ratio)
+                * 32768.0,
+                -32768,
+                32767,
+            ).astype(np.int16)
+            correction_applied = not np.array_equal(corrected, samples)
             if correction_applied:
-                corrected_embedding = self.extract_embedding_from_audio(
-                    corrected, dims=len(core_embedding) or 256
-                )
-                score = max(
-                    score, cosine_similarity(corrected_embedding, core_embedding)
+                samples = corrected
+                score = self._rescore_corrected(
+                    score,
+                    backend,
+                    embed,
+                    tag,
+                    waveform,
+                    samples / np.float32(32768.0),
+                    sample_rate,
+                    core_embedding,
+                    details,
                 )
 
-        watermarked = self.apply_sonic_watermark(corrected, voice_fingerprint_id)
+        rvc_ready = score >= self.threshold
+        if samples.size == 0:
+            return audio_bytes, score, rvc_ready, correction_applied
+        mixed = samples.astype(np.float32)
+        add_watermark(mixed, self.watermark_pattern(voice_fingerprint_id, sample_rate))
+        return _encode_wav_bytes(sample_rate, mixed), score, rvc_ready, correction_applied
+
+    def enforce_consistency_buffer(
+        self,
+        buffer: AudioBuffer,
+        core_embedding: Sequence[float],
+        voice_fingerprint_id: str,
+        correction: bool = True,
+        details: dict | None = None,
+    ) -> tuple[AudioBuffer, float, bool, bool]:
+        dims = len(core_embedding) or 256
+        mono = buffer.mono()
+        embed, tag = self._scoring_embedder(mono, buffer.sample_rate, dims, details)
+        embedding, backend = self._extract_cached_with_backend(
+            lambda: audio_content_hash(
+                buffer.sample_rate.to_bytes(4, "little") + mono.tobytes()
+            )
+            + tag,
+            lambda name: embed(mono, name),
+            dims,
+        )
+        score = cosine_similarity(embedding, core_embedding)
+        corrected = buffer
+        correction_applied = False
+
+        correction_ratio = self._correction_ratio(score) if correction else 0.0
+        if correction_ratio > 0.0 and buffer.frames:
+            corrected = buffer.replace(
+                self._correct_samples(buffer.samples, correction_ratio)
+            )
+            correction_applied = True
+            score = self._rescore_corrected(
+                score,
+                backend,
+                embed,
+                tag,
+                mono,
+                corrected.mono(),
+                buffer.sample_rate,
+                core_embedding,
+                details,
+            )
+
+        if corrected.frames == 0:
+            return corrected, score, score >= self.threshold, correction_applied
+        # ``corrected`` is either the caller's buffer (copy it) or our own.
+        watermarked = corrected.replace(
+            self.apply_sonic_watermark_block(
+                corrected.samples,
+                corrected.sample_rate,
+                voice_fingerprint_id,
+                in_place=correction_applied,
+            )
+        )
         rvc_ready = score >= self.threshold
         return watermarked, score, rvc_ready, correction_applied
 
+    def _correction_ratio(self, score: float) -> float:
+        if score >= self.threshold:
+            return 0.0
+        return max(
+            0.0,
+            min(1.0, (self.threshold - score) * (1.0 + self.correction_strength)),
+        )
+
+    def _scoring_embedder(
+        self,
+        waveform: np.ndarray,
+        sample_rate: int,
+        dims: int,
+        details: dict | None = None,
+    ) -> tuple[Callable[[np.ndarray, str], list[float]], str]:
+        """``(embed(waveform, backend), cache_tag)`` used for consistency scores.
+
+        With ``scoring_windows`` set, long clips are scored on a bounded set of
+        windows picked by :func:`select_scoring_windows` and aggregated as the
+        mean direction of the window embeddings, so scoring cost stops growing
+        with clip length. The windows are chosen once from the original audio
+        and reused for the corrected audio, which keeps sample alignment.
+        """
+        starts = None
+        if self.scoring_windows > 0:
+            starts = select_scoring_windows(
+                waveform,
+                sample_rate,
+                self.scoring_windows,
+                self.scoring_window_seconds,
+                self.scoring_strategy,
+            )
+        if details is not None:
+            details["windows"] = 0 if starts is None else int(starts.size)
+        if starts is None:
+            return (
+                lambda samples, backend: self.embed_waveform(
+                    samples, sample_rate, backend, dims
+                )
+            ), ""
+
+        window = max(1, int(self.scoring_window_seconds * sample_rate))
+
+        def embed(samples: np.ndarray, backend: str) -> list[float]:
+            vectors = self.embed_waveforms(
+                [(samples[start : start + window], sample_rate) for start in starts],
+                backend,
+                dims,
+            )
+            return _mean_direction(vectors, dims)
+
+        tag = (
+            f"|windows:{self.scoring_strategy}:{self.scoring_windows}:"
+            f"{self.scoring_window_seconds}"
+        )
+        return embed, tag
+
+    def _rescore_corrected(
+        self,
+        score: float,
+        backend: str | None,
+        embed: Callable[[np.ndarray, str], list[float]],
+        tag: str,
+        waveform: np.ndarray,
+        corrected: np.ndarray,
+        sample_rate: int,
+        core_embedding: Sequence[float],
+        details: dict | None,
+    ) -> float:
+        """Best of ``score`` and the corrected audio's score, extracting only if needed.
+
+        The numpy extractor is cheap enough to rerun. Model backends are
+        re-extracted on the corrected audio unless ``proxy_margin`` is set.
+        Then the drift ``d`` between the numpy embeddings before and after
+        correction is used as a heuristic for how far the model score could
+        move. It is not a bound, since MFCC distance says nothing exact
+        about a resemblyzer or SpeechBrain embedding. If ``score`` plus
+        ``proxy_margin * d`` misses the threshold, the second extraction is
+        skipped and the uncorrected ``score`` is kept, which can
+        under-report a correction that did work. ``details["rescore"]``
+        records the path taken: ``numpy``, ``proxy`` or ``full``.
+        """
+        dims = len(core_embedding) or 256
+        if backend is None:
+            return score
+        if backend == "numpy":
+            rescored = cosine_similarity(embed(corrected, "numpy"), core_embedding)
+            self._note_rescore(details, "numpy", None)
+            return max(score, rescored)
+
+        drift = None
+        if self.proxy_margin is not None:
+            drift = _unit_distance(
+                embed(waveform, "numpy"), embed(corrected, "numpy")
+            )
+            if score + self.proxy_margin * drift < self.threshold:
+                self._note_rescore(details, "proxy", drift)
+                return score
+
+        corrected_embedding = self._extract_cached(
+            lambda: audio_content_hash(
+                sample_rate.to_bytes(4, "little")
+                + np.asarray(corrected, dtype=np.float32).tobytes()
+            )
+            + tag,
+            lambda name: embed(corrected, name),
+            dims,
+        )
+        self._note_rescore(details, "full", drift)
+        return max(score, cosine_similarity(corrected_embedding, core_embedding))
+
+    @staticmethod
+    def _note_rescore(details: dict | None, path: str, drift: float | None) -> None:
+        if details is not None:
+            details["rescore"] = path
+            details["proxy_drift"] = drift
+
+    def apply_sonic_watermark_buffer(
+        self, buffer: AudioBuffer, voice_fingerprint_id: str
+    ) -> AudioBuffer:
+        if buffer.frames == 0:
+            return buffer
+        return buffer.replace(
+            self.apply_sonic_watermark_block(
+                buffer.samples, buffer.sample_rate, voice_fingerprint_id
+            )
+        )
+
+    def apply_sonic_watermark_block(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        voice_fingerprint_id: str,
+        offset: int = 0,
+        in_place: bool = False,
+    ) -> np.ndarray:
+        """Watermark float samples that start ``offset`` frames into a stream.
+
+        Consecutive blocks watermarked with running offsets match a single
+        :meth:`apply_sonic_watermark_buffer` call over the whole utterance.
+        With ``in_place`` a writable float ``samples`` array is modified and
+        returned instead of copied.
+        """
+        output = samples if in_place else samples.copy()
+        return add_watermark(
+            output,
+            self.watermark_pattern(voice_fingerprint_id, sample_rate),
+            offset=offset,
+            scale=1.0 / 32768.0,
+        )
+
     def apply_sonic_watermark(
         self, audio_bytes: bytes, voice_fingerprint_id: str
     ) -> bytes:
@@ -173,69 +566,113 @@ class VoiceConsistencyEngine:
         if samples.size == 0:
             return audio_bytes
 
-        bit_stream = self._fingerprint_bits(voice_fingerprint_id)
-        watermark = self._build_watermark_signal(
-            samples.shape[0], sample_rate, bit_stream
+        mixed = samples.astype(np.float32)
+        add_watermark(mixed, self.watermark_pattern(voice_fingerprint_id, sample_rate))
+        return _encode_wav_bytes(sample_rate, mixed)
+
+    def apply_sonic_watermark_batch(
+        self,
+        audio_items: Sequence[bytes],
+        voice_fingerprint_ids: str | Sequence[str],
+    ) -> list[bytes]:
+        """Watermark many WAV clips; pass one fingerprint or one per clip."""
+        if isinstance(voice_fingerprint_ids, str):
+            voice_fingerprint_ids = [voice_fingerprint_ids] * len(audio_items)
+        if len(voice_fingerprint_ids) != len(audio_items):
+            raise ValueError("voice_fingerprint_ids must match audio_items")
+        return [
+            self.apply_sonic_watermark(audio_bytes, voice_fingerprint_id)
+            for audio_bytes, voice_fingerprint_id in zip(
+                audio_items, voice_fingerprint_ids
+            )
+        ]
+
+    def watermark_pattern(
+        self, voice_fingerprint_id: str, sample_rate: int
+    ) -> np.ndarray:
+        """Cached read-only watermark waveform in PCM16 units."""
+        pinned = self._pinned.get((voice_fingerprint_id, sample_rate))
+        if pinned is not None:
+            return pinned
+        return get_watermark_cache().pattern(
+            voice_fingerprint_id, sample_rate, self.watermark_depth
         )
 
-        if samples.ndim == 1:
-            mixed = samples.astype(np.float32) + watermark
-        else:
-            mixed = samples.astype(np.float32) + watermark[:, None]
+    def embed_waveform(
+        self,
+        waveform: np.ndarray,
+        sample_rate: int,
+        backend: str = "numpy",
+        dims: int = 256,
+    ) -> list[float]:
+        """Embed already-decoded mono samples scaled to [-1, 1]."""
+        if backend == "resemblyzer":
+            return self._embed_resemblyzer(waveform, sample_rate, dims)
+        if backend == "speechbrain":
+            return self._embed_speechbrain(waveform, sample_rate, dims)
+        if backend == "numpy":
+            return self._embed_numpy(waveform, sample_rate, dims)
+        raise ValueError(f"Unknown embedding backend '{backend}'")
+
+    def embed_waveforms(
+        self,
+        waveforms: Sequence[tuple[np.ndarray, int]],
+        backend: str = "numpy",
+        dims: int = 256,
+    ) -> list[list[float]]:
+        """Embed several ``(waveform, sample_rate)`` clips in one call.
+
+        SpeechBrain receives a single padded batch and the numpy extractor
+        frames all clips into one matrix; resemblyzer embeds clip by clip
+        against the already-loaded model.
+        """
+        if backend == "numpy":
+            from .features import speaker_embeddings
+
+            return speaker_embeddings(waveforms, dims=dims)
+        if backend != "speechbrain" or len(waveforms) < 2:
+            return [
+                self.embed_waveform(waveform, sample_rate, backend, dims)
+                for waveform, sample_rate in waveforms
+            ]
 
-        return _encode_wav_bytes(sample_rate, mixed)
+        classifier = get_encoder_pool().speechbrain()
+        import torch
 
-    def _extract_with_resemblyzer(self, audio_bytes: bytes, dims: int) -> list[float]:
-        from resemblyzer import VoiceEncoder, preprocess_wav
+        resampled = [
+            _resample_linear(np.asarray(waveform, dtype=np.float32), sample_rate, 16000)
+            for waveform, sample_rate in waveforms
+        ]
+        longest = max(max(item.size for item in resampled), 1)
+        batch = np.zeros((len(resampled), longest), dtype=np.float32)
+        for row, item in enumerate(resampled):
+            batch[row, : item.size] = item
+        lengths = torch.tensor(
+            [item.size / longest for item in resampled], dtype=torch.float32
+        )
+        embeddings = (
+            classifier.encode_batch(torch.from_numpy(batch), lengths)
+            .detach()
+            .cpu()
+            .numpy()
+            .reshape(len(resampled), -1)
+        )
+        return [_fit_embedding_dims(row, dims=dims) for row in embeddings]
 
+    def _extract_with_resemblyzer(self, audio_bytes: bytes, dims: int) -> list[float]:
         sample_rate, mono = _read_wav_bytes(audio_bytes)
-        waveform = mono / 32768.0
-        processed = preprocess_wav(waveform, source_sr=sample_rate)
-        embedding = VoiceEncoder().embed_utterance(processed)
-        return _fit_embedding_dims(embedding, dims=dims)
+        return self._embed_resemblyzer(mono / 32768.0, sample_rate, dims)
 
     def _extract_with_speechbrain(self, audio_bytes: bytes, dims: int) -> list[float]:
-        import torch
-        from speechbrain.pretrained import EncoderClassifier
-
         sample_rate, mono = _read_wav_bytes(audio_bytes)
-        waveform = mono / 32768.0
-        if sample_rate != 16000 and waveform.size > 1:
-            source = np.linspace(0.0, 1.0, waveform.size, dtype=np.float32)
-            target_length = int(waveform.size * (16000 / sample_rate))
-            target = np.linspace(0.0, 1.0, max(target_length, 1), dtype=np.float32)
-            waveform = np.interp(target, source, waveform)
-
-        classifier = EncoderClassifier.from_hparams(
-            source="speechbrain/spkrec-ecapa-voxceleb"
-        )
-        batch = torch.tensor(waveform, dtype=torch.float32).unsqueeze(0)
-        embedding = classifier.encode_batch(batch).detach().cpu().numpy().reshape(-1)
-        return _fit_embedding_dims(embedding, dims=dims)
+        return self._embed_speechbrain(mono / 32768.0, sample_rate, dims)
 
     def _extract_with_numpy(self, audio_bytes: bytes, dims: int) -> list[float]:
         try:
             sample_rate, mono = _read_wav_bytes(audio_bytes)
-            mono = mono.astype(np.float32)
             if mono.size == 0:
                 return [0.0] * dims
-            normalized = mono / 32768.0
-            spectrum = np.abs(np.fft.rfft(normalized, n=min(8192, max(512, mono.size))))
-            summary = np.concatenate(
-                [
-                    np.array(
-                        [
-                            float(np.mean(normalized)),
-                            float(np.std(normalized)),
-                            float(np.max(np.abs(normalized))),
-                            float(sample_rate / 48000.0),
-                        ],
-                        dtype=np.float32,
-                    ),
-                    spectrum.astype(np.float32),
-                ]
-            )
-            return _fit_embedding_dims(summary, dims=dims)
+            return self._embed_numpy(mono / 32768.0, sample_rate, dims)
         except Exception:
             digest = hashlib.sha256(audio_bytes).digest()
             values = [
@@ -244,51 +681,129 @@ class VoiceConsistencyEngine:
             ]
             return values
 
-    def _apply_parametric_correction(
-        self, audio_bytes: bytes, correction_ratio: float
-    ) -> bytes:
-        try:
-            sample_rate, samples = _decode_wav_bytes(audio_bytes)
-        except Exception:
-            return audio_bytes
+    def _embed_resemblyzer(
+        self, waveform: np.ndarray, sample_rate: int, dims: int
+    ) -> list[float]:
+        encoder, preprocess_wav = get_encoder_pool().resemblyzer()
+        processed = preprocess_wav(waveform, source_sr=sample_rate)
+        embedding = encoder.embed_utterance(processed)
+        return _fit_embedding_dims(embedding, dims=dims)
 
-        bounded = max(0.0, min(1.0, correction_ratio))
-        if bounded <= 0.0:
-            return audio_bytes
+    def _embed_speechbrain(
+        self, waveform: np.ndarray, sample_rate: int, dims: int
+    ) -> list[float]:
+        classifier = get_encoder_pool().speechbrain()
+        import torch
+
+        waveform = _resample_linear(waveform, sample_rate, 16000)
+        batch = torch.tensor(waveform, dtype=torch.float32).unsqueeze(0)
+        embedding = classifier.encode_batch(batch).detach().cpu().numpy().reshape(-1)
+        return _fit_embedding_dims(embedding, dims=dims)
+
+    def _embed_numpy(
+        self, waveform: np.ndarray, sample_rate: int, dims: int
+    ) -> list[float]:
+        from .features import speaker_embedding
 
-        source = samples.astype(np.float32)
-        normalized = source / 32768.0
+        return speaker_embedding(waveform, sample_rate, dims=dims)
+
+    def _correct_samples(self, normalized: np.ndarray, bounded: float) -> np.ndarray:
         shaped = np.tanh(normalized * (1.0 + bounded * 0.6))
-        corrected = (1.0 - bounded * 0.35) * normalized + (bounded * 0.35) * shaped
-        return _encode_wav_bytes(sample_rate, corrected * 32768.0)
-
-    def _fingerprint_bits(self, voice_fingerprint_id: str) -> list[int]:
-        digest = hashlib.sha256(voice_fingerprint_id.encode("utf-8")).digest()
-        bits: list[int] = []
-        for value in digest:
-            for shift in range(8):
-                bits.append((value >> shift) & 1)
-        return bits
-
-    def _build_watermark_signal(
-        self, sample_count: int, sample_rate: int, bit_stream: Sequence[int]
-    ) -> np.ndarray:
-        indices = np.arange(sample_count, dtype=np.float32)
-        bit_window = max(128, int(sample_rate * 0.015))
-        base_frequency = min(7800.0, sample_rate * 0.42)
-        signal = np.zeros(sample_count, dtype=np.float32)
-
-        for bit_index, bit in enumerate(bit_stream):
-            start = bit_index * bit_window
-            if start >= sample_count:
-                break
-            end = min(sample_count, start + bit_window)
-            phase_shift = math.pi / 3 if bit else -math.pi / 3
-            carrier = np.sin(
-                (2.0 * math.pi * base_frequency * indices[start:end] / sample_rate)
-                + phase_shift
+        return (1.0 - bounded * 0.35) * normalized + (bounded * 0.35) * shaped
+
+
+class ConsistencyEnginePool:
+    """Keyed LRU of warm :class:`VoiceConsistencyEngine` instances.
+
+    Engines are keyed by their full configuration (threshold, correction
+    strength, watermark depth and scoring windows), so every utterance for
+    the same agent settings reuses one engine together with its pinned
+    watermark carriers. Embeddings, encoder models and unpinned carriers
+    stay in the process-wide caches shared by all engines.
+    """
+
+    def __init__(self, max_engines: int = 16):
+        self.max_engines = max_engines
+        self.hits = 0
+        self.misses = 0
+        self._engines: "OrderedDict[Tuple[Any, ...], VoiceConsistencyEngine]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        threshold: float = 0.92,
+        correction_strength: float = 0.10,
+        watermark_depth: float = 0.002,
+        scoring_windows: int = 0,
+        scoring_window_seconds: float = 1.5,
+        scoring_strategy: str = "vad",
+        proxy_margin: float | None = None,
+    ) -> Tuple[Any, ...]:
+        return (
+            float(threshold),
+            float(correction_strength),
+            float(watermark_depth),
+            int(scoring_windows),
+            float(scoring_window_seconds),
+            str(scoring_strategy),
+            None if proxy_margin is None else float(proxy_margin),
+        )
+
+    def get(self, **config: Any) -> VoiceConsistencyEngine:
+        key = self.key(**config)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                self.hits += 1
+                return engine
+            self.misses += 1
+            (
+                threshold,
+                correction_strength,
+                watermark_depth,
+                scoring_windows,
+                scoring_window_seconds,
+                scoring_strategy,
+                proxy_margin,
+            ) = key
+            engine = VoiceConsistencyEngine(
+                threshold=threshold,
+                correction_strength=correction_strength,
+                watermark_depth=watermark_depth,
+                proxy_margin=proxy_margin,
+                scoring_windows=scoring_windows,
+                scoring_window_seconds=scoring_window_seconds,
+                scoring_strategy=scoring_strategy,
             )
-            signal[start:end] += carrier
+            if self.max_engines > 0:
+                self._engines[key] = engine
+                while len(self._engines) > self.max_engines:
+                    self._engines.popitem(last=False)
+            return engine
+
+    def warmup(
+        self,
+        voice_fingerprint_ids: Iterable[str] = (),
+        sample_rates: Iterable[int] = (16000, 22050, 24000),
+        encoders: bool = True,
+        **config: Any,
+    ) -> Dict[str, Any]:
+        """Create (or reuse) the engine for ``config`` and warm it."""
+        return self.get(**config).warmup(
+            voice_fingerprint_ids, sample_rates=sample_rates, encoders=encoders
+        )
 
-        amplitude = 32768.0 * max(0.0, min(0.01, self.watermark_depth))
-        return signal * amplitude
+    def clear(self) -> None:
+        with self._lock:
+            self._engines.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "engines": len(self._engines),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
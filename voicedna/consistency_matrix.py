@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .consistency import VoiceConsistencyEngine, _read_wav_bytes
+from .embedding_cache import audio_content_hash, get_embedding_cache
+from .speaker_index import normalize_rows, top_k_indices
+
+
+SearchHit = Tuple[str, float]
+
+
+@dataclass
+class ClipEmbeddings:
+    ids: List[str]
+    matrix: np.ndarray
+    backend: str
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ConsistencyMatrix:
+    """Cosine scores of every clip (rows) against every voice (columns)."""
+
+    clip_ids: List[str]
+    voice_ids: List[str]
+    scores: np.ndarray
+    threshold: float = 0.92
+
+    def top_k(self, k: int = 5) -> List[List[SearchHit]]:
+        return [
+            [(self.voice_ids[column], float(row[column])) for column in top_k_indices(row, k)]
+            for row in self.scores
+        ]
+
+    def above(self, threshold: float | None = None) -> np.ndarray:
+        """Boolean mask of scores at or above ``threshold`` (default: the matrix's)."""
+        return self.scores >= (self.threshold if threshold is None else threshold)
+
+    def voice_summary(self) -> Dict[str, Dict[str, float | int]]:
+        """Score distribution per voice over all clips."""
+        if self.scores.shape[0] == 0:
+            return {voice_id: {"clips": 0} for voice_id in self.voice_ids}
+        percentiles = np.percentile(self.scores, [5, 50, 95], axis=0)
+        accepted = self.above().sum(axis=0)
+        return {
+            voice_id: {
+                "clips": int(self.scores.shape[0]),
+                "mean": round(float(self.scores[:, column].mean()), 4),
+                "std": round(float(self.scores[:, column].std()), 4),
+                "min": round(float(self.scores[:, column].min()), 4),
+                "p05": round(float(percentiles[0, column]), 4),
+                "p50": round(float(percentiles[1, column]), 4),
+                "p95": round(float(percentiles[2, column]), 4),
+                "max": round(float(self.scores[:, column].max()), 4),
+                "accepted": int(accepted[column]),
+            }
+            for column, voice_id in enumerate(self.voice_ids)
+        }
+
+    def verify(self, expected: Mapping[str, str]) -> List[Dict[str, Any]]:
+        """Genuine-vs-impostor check for clips whose owning voice is known.
+
+        A clip passes when its own voice scores at or above the threshold
+        and above every impostor voice.
+        """
+        columns = {voice_id: column for column, voice_id in enumerate(self.voice_ids)}
+        results = []
+        for row, clip_id in enumerate(self.clip_ids):
+            voice_id = expected.get(clip_id)
+            if voice_id not in columns:
+                continue
+            scores = self.scores[row]
+            genuine = float(scores[columns[voice_id]])
+            impostors = np.delete(scores, columns[voice_id])
+            best = int(np.argmax(impostors)) if impostors.size else -1
+            impostor_id = None
+            impostor_score = None
+            if best >= 0:
+                impostor_column = best + (best >= columns[voice_id])
+                impostor_id = self.voice_ids[impostor_column]
+                impostor_score = float(impostors[best])
+            results.append(
+                {
+                    "clip": clip_id,
+                    "voice": voice_id,
+                    "score": round(genuine, 4),
+                    "best_impostor": impostor_id,
+                    "impostor_score": None
+                    if impostor_score is None
+                    else round(impostor_score, 4),
+                    "margin": None
+                    if impostor_score is None
+                    else round(genuine - impostor_score, 4),
+                    "passed": genuine >= self.threshold
+                    and (impostor_score is None or genuine > impostor_score),
+                }
+            )
+        return results
+
+
+def score_matrix(
+    clip_embeddings: np.ndarray | Sequence[Sequence[float]],
+    voice_embeddings: np.ndarray | Sequence[Sequence[float]],
+    clip_ids: Sequence[str] | None = None,
+    voice_ids: Sequence[str] | None = None,
+    threshold: float = 0.92,
+) -> ConsistencyMatrix:
+    """All clip-vs-voice cosine scores through one normalized matrix multiply.
+
+    Mismatched dimensions are truncated to the shorter length, as in
+    :func:`~voicedna.consistency.cosine_similarity`; zero vectors score 0.
+    """
+    clips = _as_matrix(clip_embeddings)
+    voices = _as_matrix(voice_embeddings)
+    dims = min(clips.shape[1], voices.shape[1])
+    scores = normalize_rows(clips[:, :dims]) @ normalize_rows(voices[:, :dims]).T
+    return ConsistencyMatrix(
+        clip_ids=list(clip_ids)
+        if clip_ids is not None
+        else [str(row) for row in range(clips.shape[0])],
+        voice_ids=list(voice_ids)
+        if voice_ids is not None
+        else [str(column) for column in range(voices.shape[0])],
+        scores=scores.astype(np.float32),
+        threshold=threshold,
+    )
+
+
+def _as_matrix(values: np.ndarray | Sequence[Sequence[float]]) -> np.ndarray:
+    array = np.asarray(values, dtype=np.float32)
+    if array.ndim == 1:
+        array = array.reshape(1, -1) if array.size else array.reshape(0, 0)
+    return array
+
+
+def embed_wav_files(
+    paths: Sequence[str | Path],
+    engine: VoiceConsistencyEngine | None = None,
+    dims: int = 256,
+    batch_size: int = 32,
+    workers: int = 4,
+    backend: str | None = None,
+) -> ClipEmbeddings:
+    """Embed WAV files for scoring, ``batch_size`` clips per worker task.
+
+    Every clip is embedded with one ``backend`` (default: the engine's
+    :meth:`~voicedna.consistency.VoiceConsistencyEngine.preferred_backend`),
+    so all rows share an embedding space; compare them only against voices
+    enrolled with the same backend. Each worker decodes its batch, answers
+    what it can from the embedding cache (shared with
+    ``enforce_consistency``, so clips scored at render time are not embedded
+    again) and embeds the rest in one ``embed_waveforms`` call. Unreadable
+    files, and clips the backend fails on, are reported in ``errors`` and
+    left out of ``ids``.
+    """
+    engine = engine or VoiceConsistencyEngine()
+    backend = backend or engine.preferred_backend()
+    paths = [str(path) for path in paths]
+    batches = [
+        paths[start : start + max(1, batch_size)]
+        for start in range(0, len(paths), max(1, batch_size))
+    ]
+    result = ClipEmbeddings(
+        ids=[], matrix=np.zeros((0, dims), np.float32), backend=backend
+    )
+    rows: List[List[float]] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for batch in pool.map(
+            lambda chunk: _embed_batch(engine, chunk, dims, backend), batches
+        ):
+            for path, embedding, error in batch:
+                if error is not None:
+                    result.errors[path] = error
+                    continue
+                result.ids.append(path)
+                rows.append(embedding)
+    if rows:
+        result.matrix = np.asarray(rows, dtype=np.float32)
+    return result
+
+
+def _embed_batch(
+    engine: VoiceConsistencyEngine, paths: List[str], dims: int, backend: str
+) -> List[Tuple[str, List[float] | None, str | None]]:
+    decoded: Dict[int, Tuple[str, int, np.ndarray]] = {}
+    errors: Dict[int, str] = {}
+    for index, path in enumerate(paths):
+        try:
+            audio_bytes = Path(path).read_bytes()
+            sample_rate, mono = _read_wav_bytes(audio_bytes)
+            decoded[index] = (audio_content_hash(audio_bytes), sample_rate, mono / 32768.0)
+        except Exception as error:
+            errors[index] = f"{type(error).__name__}: {error}"
+
+    cache = get_embedding_cache()
+    model_version = engine.model_version(backend)
+    embeddings: Dict[int, List[float]] = {}
+    misses = []
+    for index, (digest, _, _) in decoded.items():
+        cached = (
+            cache.get(cache.make_key(digest, backend, model_version, dims))
+            if cache.enabled
+            else None
+        )
+        if cached is not None:
+            embeddings[index] = cached
+        else:
+            misses.append(index)
+    if misses:
+        try:
+            vectors = engine.embed_waveforms(
+                [(decoded[index][2], decoded[index][1]) for index in misses],
+                backend=backend,
+                dims=dims,
+            )
+        except Exception as error:
+            for index in misses:
+                errors[index] = f"{backend}: {type(error).__name__}: {error}"
+        else:
+            for index, vector in zip(misses, vectors):
+                embeddings[index] = vector
+                if cache.enabled:
+                    cache.put(
+                        cache.make_key(decoded[index][0], backend, model_version, dims),
+                        vector,
+                        backend=backend,
+                    )
+
+    return [
+        (path, embeddings[index], None)
+        if index in embeddings
+        else (path, None, errors.get(index, f"{backend} could not embed"))
+        for index, path in enumerate(paths)
+    ]
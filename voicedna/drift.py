@@ -0,0 +1,472 @@
+"""Rolling identity-drift statistics per voice.
+
+``enforce_consistency`` scores one clip at a time. :class:`DriftMonitor`
+folds those scores into constant-size state per ``voice_fingerprint_id``:
+an exponentially weighted mean/variance, the last ``window`` scores and a
+baseline frozen after the first ``warmup`` observations. ``evolve()`` keeps
+the fingerprint, so one voice's history carries across sessions and
+maturation steps.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+from voice_dna import file_lock
+
+from .embedding_cache import default_cache_root
+
+logger = logging.getLogger("VoiceDNA")
+
+DRIFT_STATES = ("warming", "stable", "drifting", "below_threshold")
+STATE_VERSION = 1
+FLUSH_PENDING = 8192
+
+
+@dataclass
+class DriftStats:
+    """Constant-size score history of one voice."""
+
+    window: int = 32
+    count: int = 0
+    last: float | None = None
+    mean: float = 0.0
+    variance: float = 0.0
+    minimum: float | None = None
+    baseline: float | None = None
+    baseline_count: int = 0
+    threshold: float | None = None
+    state: str = "warming"
+    updated_at: float = 0.0
+    recent: Deque[float] = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        self.recent = deque(self.recent, maxlen=self.window)
+
+    @property
+    def drop(self) -> float:
+        """How far the EWMA sits below the baseline (0 while warming)."""
+        return 0.0 if self.baseline is None else self.baseline - self.mean
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = list(self.recent)
+        below = (
+            sum(score < self.threshold for score in recent) / len(recent)
+            if recent and self.threshold is not None
+            else None
+        )
+        return {
+            "state": self.state,
+            "count": self.count,
+            "last": _round(self.last),
+            "ewma": _round(self.mean),
+            "ewma_std": _round(math.sqrt(max(self.variance, 0.0))),
+            "window_mean": _round(sum(recent) / len(recent)) if recent else None,
+            "window_min": _round(min(recent)) if recent else None,
+            "window_below_threshold": _round(below),
+            "baseline": _round(self.baseline),
+            "drop": _round(self.drop),
+            "min": _round(self.minimum),
+            "threshold": self.threshold,
+            "updated_at": self.updated_at,
+        }
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "last": self.last,
+            "mean": self.mean,
+            "variance": self.variance,
+            "minimum": self.minimum,
+            "baseline": self.baseline,
+            "baseline_count": self.baseline_count,
+            "threshold": self.threshold,
+            "state": self.state,
+            "updated_at": self.updated_at,
+            "recent": list(self.recent),
+        }
+
+    @classmethod
+    def from_state_dict(cls, payload: Dict[str, Any], window: int) -> "DriftStats":
+        known = {key: payload[key] for key in cls.__dataclass_fields__ if key in payload}
+        known.pop("window", None)
+        return cls(window=window, **known)
+
+
+@dataclass
+class DriftEvent:
+    """A voice moved between drift states."""
+
+    voice_fingerprint_id: str
+    state: str
+    previous: str
+    score: float
+    stats: Dict[str, Any]
+
+
+DriftCallback = Callable[[DriftEvent], None]
+# ("observe", score, threshold, at), ("rebaseline", at) or ("reset",)
+PendingOp = Tuple[Any, ...]
+
+
+class DriftMonitor:
+    """Streaming drift detector over consistency scores, keyed by voice.
+
+    A voice leaves ``warming`` after ``warmup`` scores, whose mean becomes its
+    baseline. It is ``drifting`` once the EWMA falls more than
+    ``drop_threshold`` below that baseline and ``below_threshold`` once the
+    EWMA falls under the consistency threshold; it returns to ``stable`` only
+    after recovering past half the drop (or ``recovery_margin`` above the
+    threshold), so a score hovering at the boundary does not flap.
+    Callbacks registered with :meth:`on_drift` run on every state change
+    after warm-up, outside the monitor's lock.
+
+    With ``state_path`` set, state is read back on construction and written
+    by a background thread every ``save_interval`` seconds, right after a
+    state change and once more at exit; :meth:`observe` itself never touches
+    the disk. A save replays the scores observed since the previous one onto
+    the file's current state under a file lock, so processes sharing the
+    file all contribute to the same per-voice history.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        window: int = 32,
+        warmup: int = 10,
+        drop_threshold: float = 0.05,
+        recovery_margin: float = 0.01,
+        max_voices: int = 4096,
+        state_path: str | Path | None = None,
+        save_interval: float = 30.0,
+        enabled: bool = True,
+    ):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.window = max(1, int(window))
+        self.warmup = max(1, int(warmup))
+        self.drop_threshold = drop_threshold
+        self.recovery_margin = recovery_margin
+        self.max_voices = max_voices
+        self.state_path = Path(state_path) if state_path else None
+        self.save_interval = save_interval
+        self.enabled = enabled
+        self._voices: Dict[str, DriftStats] = {}
+        self._callbacks: List[DriftCallback] = []
+        self._dirty = False
+        self._pending: Dict[str, List[PendingOp]] = {}
+        self._pending_count = 0
+        self._cleared = False
+        self._flush_now = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._lock = threading.Lock()
+        if self.state_path is not None:
+            self.load()
+
+    @staticmethod
+    def from_env() -> "DriftMonitor":
+        mode = os.getenv("VOICEDNA_DRIFT_MONITOR", "memory").strip().lower()
+        configured = os.getenv("VOICEDNA_DRIFT_STATE", "").strip()
+        state_path = (
+            Path(configured).expanduser()
+            if configured
+            else default_cache_root() / "drift.json"
+        )
+        return DriftMonitor(
+            alpha=float(os.getenv("VOICEDNA_DRIFT_ALPHA", "0.1")),
+            window=int(os.getenv("VOICEDNA_DRIFT_WINDOW", "32")),
+            warmup=int(os.getenv("VOICEDNA_DRIFT_WARMUP", "10")),
+            drop_threshold=float(os.getenv("VOICEDNA_DRIFT_DROP", "0.05")),
+            state_path=state_path if mode == "disk" else None,
+            enabled=mode not in {"off", "0", "false", "no"},
+        )
+
+    def on_drift(self, callback: DriftCallback) -> DriftCallback:
+        """Register ``callback`` for state changes; usable as a decorator."""
+        with self._lock:
+            self._callbacks.append(callback)
+        return callback
+
+    def remove_callback(self, callback: DriftCallback) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def observe(
+        self,
+        voice_fingerprint_id: str,
+        score: float,
+        threshold: float | None = None,
+    ) -> Dict[str, Any] | None:
+        """Fold one consistency score in and return the voice's rolling stats."""
+        if not self.enabled or score is None or not math.isfinite(score):
+            return None
+        score = float(score)
+        with self._lock:
+            stats = self._voices.get(voice_fingerprint_id)
+            if stats is None:
+                stats = self._admit(voice_fingerprint_id)
+            now = time.time()
+            self._update(stats, score, threshold, now)
+            previous = stats.state
+            stats.state = self._classify(stats)
+            state = stats.state
+            snapshot = stats.to_dict()
+            callbacks = list(self._callbacks)
+            self._record(voice_fingerprint_id, ("observe", score, threshold, now))
+        changed = previous != state and previous != "warming"
+        if changed or self._pending_count >= FLUSH_PENDING:
+            self._flush_now.set()
+        if changed:
+            event = DriftEvent(voice_fingerprint_id, state, previous, score, snapshot)
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception as error:
+                    logger.warning("Drift callback failed: %s", error)
+        return snapshot
+
+    def stats(self, voice_fingerprint_id: str) -> Dict[str, Any] | None:
+        with self._lock:
+            stats = self._voices.get(voice_fingerprint_id)
+            return None if stats is None else stats.to_dict()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                voice_id: stats.to_dict() for voice_id, stats in self._voices.items()
+            }
+
+    def rebaseline(self, voice_fingerprint_id: str) -> None:
+        """Forget a voice's baseline, e.g. after an intentional re-enrollment."""
+        with self._lock:
+            stats = self._voices.get(voice_fingerprint_id)
+            if stats is not None:
+                now = time.time()
+                self._rebaseline(stats, now)
+                self._record(voice_fingerprint_id, ("rebaseline", now))
+
+    def reset(self, voice_fingerprint_id: str | None = None) -> None:
+        with self._lock:
+            if voice_fingerprint_id is None:
+                self._voices.clear()
+                self._pending.clear()
+                self._pending_count = 0
+                self._cleared = True
+                self._dirty = True
+            else:
+                self._voices.pop(voice_fingerprint_id, None)
+                self._pending_count -= len(self._pending.pop(voice_fingerprint_id, []))
+                self._record(voice_fingerprint_id, ("reset",))
+
+    def save(self) -> bool:
+        """Merge state into ``state_path``; returns False if nothing was written.
+
+        Under the file lock, the scores, rebaselines and resets recorded
+        since the last save are replayed onto the voices currently on disk,
+        and the result becomes this monitor's state too. Writers sharing the
+        file therefore add to each other's counts, EWMAs and windows rather
+        than replacing them.
+        """
+        if self.state_path is None:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            pending, cleared = self._pending, self._cleared
+            self._pending, self._pending_count, self._cleared = {}, 0, False
+            self._dirty = False
+        temp_path = self.state_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with file_lock(self.state_path):
+                voices = {} if cleared else self._read_voices()
+                for voice_id, operations in pending.items():
+                    self._replay(voices, voice_id, operations)
+                while len(voices) > self.max_voices:
+                    stalest = min(voices, key=lambda key: voices[key].updated_at)
+                    del voices[stalest]
+                payload = {
+                    "version": STATE_VERSION,
+                    "alpha": self.alpha,
+                    "window": self.window,
+                    "voices": {
+                        voice_id: stats.state_dict()
+                        for voice_id, stats in voices.items()
+                    },
+                }
+                descriptor = os.open(
+                    temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+                )
+                with os.fdopen(descriptor, "w", encoding="utf-8") as file_handle:
+                    json.dump(payload, file_handle)
+                os.replace(temp_path, self.state_path)
+        except OSError as error:
+            temp_path.unlink(missing_ok=True)
+            logger.debug("Could not save drift state: %s", error)
+            with self._lock:
+                if not self._cleared:
+                    for voice_id, operations in pending.items():
+                        self._pending[voice_id] = operations + self._pending.get(
+                            voice_id, []
+                        )
+                    self._pending_count = sum(map(len, self._pending.values()))
+                    self._cleared = cleared
+                self._dirty = True
+            return False
+        with self._lock:
+            # Anything recorded while the file was being written goes on top.
+            if self._cleared:
+                voices = {}
+            for voice_id, operations in self._pending.items():
+                self._replay(voices, voice_id, operations)
+            self._voices = voices
+        return True
+
+    def load(self) -> int:
+        """Merge voices from ``state_path``; returns how many were loaded."""
+        if self.state_path is None:
+            return 0
+        voices = self._read_voices()
+        with self._lock:
+            self._voices.update(voices)
+        return len(voices)
+
+    def _read_voices(self) -> Dict[str, DriftStats]:
+        try:
+            payload = json.loads(self.state_path.read_text(encoding="utf-8"))
+            return {
+                voice_id: DriftStats.from_state_dict(state, self.window)
+                for voice_id, state in payload.get("voices", {}).items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def _record(self, voice_fingerprint_id: str, operation: PendingOp) -> None:
+        self._dirty = True
+        if self.state_path is None:
+            return
+        self._pending.setdefault(voice_fingerprint_id, []).append(operation)
+        self._pending_count += 1
+        self._start_flusher()
+
+    def _replay(
+        self,
+        voices: Dict[str, DriftStats],
+        voice_fingerprint_id: str,
+        operations: List[PendingOp],
+    ) -> None:
+        stats = voices.get(voice_fingerprint_id)
+        for operation in operations:
+            if operation[0] == "reset":
+                stats = None
+            elif operation[0] == "rebaseline":
+                if stats is not None:
+                    self._rebaseline(stats, operation[1])
+            else:
+                _, score, threshold, at = operation
+                if stats is None:
+                    stats = DriftStats(window=self.window)
+                self._update(stats, score, threshold, at)
+                stats.state = self._classify(stats)
+        if stats is None:
+            voices.pop(voice_fingerprint_id, None)
+        else:
+            voices[voice_fingerprint_id] = stats
+
+    def _start_flusher(self) -> None:
+        if self.state_path is None or self._flusher is not None:
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="voicedna-drift-flush", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.save)
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._flush_now.wait(self.save_interval)
+            self._flush_now.clear()
+            self.save()
+
+    def _admit(self, voice_fingerprint_id: str) -> DriftStats:
+        while len(self._voices) >= self.max_voices:
+            stalest = min(self._voices, key=lambda key: self._voices[key].updated_at)
+            del self._voices[stalest]
+        stats = DriftStats(window=self.window)
+        self._voices[voice_fingerprint_id] = stats
+        return stats
+
+    def _rebaseline(self, stats: DriftStats, at: float) -> None:
+        stats.baseline = None
+        stats.baseline_count = 0
+        stats.state = "warming"
+        stats.updated_at = at
+
+    def _update(
+        self, stats: DriftStats, score: float, threshold: float | None, at: float
+    ) -> None:
+        if stats.count == 0:
+            stats.mean = score
+            stats.variance = 0.0
+        else:
+            difference = score - stats.mean
+            increment = self.alpha * difference
+            stats.mean += increment
+            stats.variance = (1.0 - self.alpha) * (
+                stats.variance + difference * increment
+            )
+        if stats.baseline_count < self.warmup:
+            stats.baseline_count += 1
+            previous = stats.baseline or 0.0
+            stats.baseline = previous + (score - previous) / stats.baseline_count
+        stats.count += 1
+        stats.last = score
+        stats.minimum = score if stats.minimum is None else min(stats.minimum, score)
+        stats.recent.append(score)
+        if threshold is not None:
+            stats.threshold = float(threshold)
+        stats.updated_at = at
+
+    def _classify(self, stats: DriftStats) -> str:
+        if stats.baseline_count < self.warmup:
+            return "warming"
+        threshold = stats.threshold
+        if threshold is not None:
+            if stats.mean < threshold:
+                return "below_threshold"
+            if (
+                stats.state == "below_threshold"
+                and stats.mean < threshold + self.recovery_margin
+            ):
+                return "below_threshold"
+        if stats.drop > self.drop_threshold:
+            return "drifting"
+        if stats.state in {"drifting", "below_threshold"} and (
+            stats.drop > self.drop_threshold / 2
+        ):
+            return "drifting"
+        return "stable"
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(float(value), 4)
+
+
+DRIFT_MONITOR = DriftMonitor.from_env()
+
+
+def get_drift_monitor() -> DriftMonitor:
+    return DRIFT_MONITOR
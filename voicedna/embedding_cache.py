@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+
+def default_cache_root() -> Path:
+    configured = os.getenv("VOICEDNA_CACHE_DIR", "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    xdg = os.getenv("XDG_CACHE_HOME", "").strip()
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "voicedna"
+
+
+def audio_content_hash(audio_bytes: bytes) -> str:
+    return hashlib.blake2b(audio_bytes, digest_size=20).hexdigest()
+
+
+def file_content_hash(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_stat_hash(path: str | Path) -> str:
+    """Key a file by resolved path, size and mtime without reading its content.
+
+    For callers that may stop reading a long file early, where hashing the
+    whole content would cost more than the work it saves.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    material = f"{resolved}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")
+    return hashlib.blake2b(material, digest_size=20).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier cache of speaker embeddings keyed by audio content.
+
+    Keys combine the audio content hash with the extractor backend, its model
+    version and the requested ``dims``, so changing any of them is a miss.
+    The memory tier is an LRU of float32 arrays; the disk tier stores raw
+    float32 files under ``<cache root>/embeddings`` and evicts the oldest
+    files once ``max_disk_bytes`` is exceeded. Only backends listed in
+    ``disk_backends`` (the expensive model-based ones) are written to disk.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        disk_dir: str | Path | None = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        disk_backends: Iterable[str] = ("resemblyzer", "speechbrain"),
+        enabled: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_backends = set(disk_backends)
+        self.enabled = enabled
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._disk_bytes: int | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_env() -> "EmbeddingCache":
+        mode = os.getenv("VOICEDNA_EMBEDDING_CACHE", "disk").strip().lower()
+        return EmbeddingCache(
+            max_entries=int(os.getenv("VOICEDNA_EMBEDDING_CACHE_SIZE", "2048")),
+            disk_dir=default_cache_root() / "embeddings" if mode == "disk" else None,
+            max_disk_bytes=int(
+                os.getenv("VOICEDNA_EMBEDDING_CACHE_DISK_BYTES", str(256 << 20))
+            ),
+            enabled=mode not in {"off", "0", "false", "no"},
+        )
+
+    @staticmethod
+    def make_key(
+        content_hash: str, backend: str, model_version: str, dims: int
+    ) -> str:
+        material = f"{content_hash}|{backend}|{model_version}|{dims}".encode("utf-8")
+        return hashlib.blake2b(material, digest_size=20).hexdigest()
+
+    def get(self, key: str) -> List[float] | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return cached.tolist()
+
+        path = self._disk_path(key)
+        if path is not None and path.exists():
+            try:
+                array = np.fromfile(path, dtype="<f4")
+            except OSError:
+                array = None
+            if array is not None and array.size:
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                self._remember(key, array)
+                with self._lock:
+                    self.disk_hits += 1
+                return array.tolist()
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, embedding: Iterable[float], backend: str = "") -> None:
+        if not self.enabled:
+            return
+        array = np.asarray(list(embedding), dtype="<f4")
+        self._remember(key, array)
+
+        path = self._disk_path(key)
+        if path is None or backend not in self.disk_backends:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            array.tofile(temp_path)
+            replaced = _file_size(path)
+            os.replace(temp_path, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += array.nbytes - replaced
+            over_limit = self._current_disk_bytes() > self.max_disk_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def clear(self, disk: bool = False) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.rglob("*.f32"):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            hits = self.memory_hits + self.disk_hits
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _remember(self, key: str, array: np.ndarray) -> None:
+        with self._lock:
+            self._entries[key] = array
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.f32"
+
+    def _current_disk_bytes(self) -> int:
+        if self._disk_bytes is None:
+            total = 0
+            if self.disk_dir is not None and self.disk_dir.exists():
+                total = sum(
+                    path.stat().st_size for path in self.disk_dir.rglob("*.f32")
+                )
+            self._disk_bytes = total
+        return self._disk_bytes
+
+    def _evict_disk(self) -> None:
+        if self.disk_dir is None:
+            return
+        files = []
+        for path in self.disk_dir.rglob("*.f32"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_disk_bytes * 0.9)
+        for _, size, path in files:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+EMBEDDING_CACHE = EmbeddingCache.from_env()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    return EMBEDDING_CACHE
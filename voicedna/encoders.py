@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from importlib import metadata
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+logger = logging.getLogger("VoiceDNA")
+
+BACKENDS = ("resemblyzer", "speechbrain")
+SPEECHBRAIN_SOURCE = "speechbrain/spkrec-ecapa-voxceleb"
+
+
+def _load_resemblyzer(device: str) -> Tuple[Any, Callable[..., Any]]:
+    from resemblyzer import VoiceEncoder, preprocess_wav
+
+    try:
+        encoder = VoiceEncoder(device=device, verbose=False)
+    except TypeError:
+        encoder = VoiceEncoder()
+    return encoder, preprocess_wav
+
+
+def _load_speechbrain(device: str) -> Any:
+    try:
+        from speechbrain.inference.speaker import EncoderClassifier
+    except ImportError:
+        from speechbrain.pretrained import EncoderClassifier
+
+    return EncoderClassifier.from_hparams(
+        source=SPEECHBRAIN_SOURCE, run_opts={"device": device}
+    )
+
+
+@lru_cache(maxsize=None)
+def _package_version(package: str) -> str:
+    # Looked up for every embedding cache key; reading package metadata
+    # costs more than the memory-cache hit it keys.
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class SpeakerEncoderPool:
+    """Lazily loaded, process-wide speaker-encoder models.
+
+    Each backend is loaded at most once (guarded by a per-backend lock) and
+    shared by ``VoiceDNA`` imprint extraction and ``VoiceConsistencyEngine``.
+    Backends whose import fails are remembered as unavailable so the numpy
+    fallback does not pay a failed import per clip. Models unused for
+    ``idle_seconds`` are dropped by :meth:`unload_idle`, which runs on every
+    acquire and optionally from a background reaper thread.
+
+    Loaded models are used in inference mode only and may be called from
+    several threads at once.
+    """
+
+    def __init__(
+        self,
+        device: str = "cpu",
+        cpu_threads: int | None = None,
+        idle_seconds: float = 0.0,
+    ):
+        self.device = device
+        self.cpu_threads = cpu_threads
+        self.idle_seconds = idle_seconds
+        self._loaders: Dict[str, Callable[[str], Any]] = {
+            "resemblyzer": _load_resemblyzer,
+            "speechbrain": _load_speechbrain,
+        }
+        self._models: Dict[str, Any] = {}
+        self._last_used: Dict[str, float] = {}
+        self._unavailable: Dict[str, str] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._locks = {backend: threading.Lock() for backend in BACKENDS}
+        self._state_lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+        self._reaper_stop = threading.Event()
+        self._threads_applied = False
+
+    @staticmethod
+    def from_env() -> "SpeakerEncoderPool":
+        threads = os.getenv("VOICEDNA_ENCODER_THREADS", "").strip()
+        return SpeakerEncoderPool(
+            device=os.getenv("VOICEDNA_ENCODER_DEVICE", "cpu"),
+            cpu_threads=int(threads) if threads else None,
+            idle_seconds=float(os.getenv("VOICEDNA_ENCODER_IDLE_SECONDS", "0")),
+        )
+
+    def acquire(self, backend: str) -> Any:
+        if backend not in self._loaders:
+            raise ValueError(f"Unknown speaker encoder backend '{backend}'")
+
+        self.unload_idle()
+        with self._state_lock:
+            if backend in self._unavailable:
+                raise RuntimeError(self._unavailable[backend])
+            model = self._models.get(backend)
+            if model is not None:
+                self._last_used[backend] = time.monotonic()
+                return model
+
+        with self._locks[backend]:
+            with self._state_lock:
+                model = self._models.get(backend)
+                if model is not None:
+                    self._last_used[backend] = time.monotonic()
+                    return model
+                if backend in self._unavailable:
+                    raise RuntimeError(self._unavailable[backend])
+
+            self._apply_cpu_threads()
+            started_at = time.perf_counter()
+            try:
+                model = self._loaders[backend](self.device)
+            except ImportError as error:
+                with self._state_lock:
+                    self._unavailable[backend] = f"{backend} unavailable: {error}"
+                raise RuntimeError(self._unavailable[backend]) from error
+
+            with self._state_lock:
+                self._models[backend] = model
+                self._last_used[backend] = time.monotonic()
+                self._load_seconds[backend] = time.perf_counter() - started_at
+            logger.info(
+                "Loaded %s speaker encoder in %.2fs",
+                backend,
+                self._load_seconds[backend],
+            )
+            return model
+
+    def resemblyzer(self) -> Tuple[Any, Callable[..., Any]]:
+        return self.acquire("resemblyzer")
+
+    def speechbrain(self) -> Any:
+        return self.acquire("speechbrain")
+
+    def model_version(self, backend: str) -> str:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown speaker encoder backend '{backend}'")
+        version = _package_version(backend)
+        if backend == "speechbrain":
+            return f"{SPEECHBRAIN_SOURCE}@{version}"
+        return f"{backend}@{version}"
+
+    def is_available(self, backend: str) -> bool:
+        with self._state_lock:
+            return backend not in self._unavailable
+
+    def available_backends(self) -> List[str]:
+        return [backend for backend in BACKENDS if self.is_available(backend)]
+
+    def warmup(self, backends: Iterable[str] = BACKENDS) -> Dict[str, bool]:
+        results: Dict[str, bool] = {}
+        for backend in backends:
+            try:
+                self.acquire(backend)
+                results[backend] = True
+            except Exception as error:
+                logger.info("Speaker encoder %s not warmed: %s", backend, error)
+                results[backend] = False
+        return results
+
+    def configure_cpu_threads(self, threads: int | None) -> None:
+        self.cpu_threads = threads
+        self._threads_applied = False
+        with self._state_lock:
+            loaded = bool(self._models)
+        if loaded:
+            self._apply_cpu_threads()
+
+    def unload(self, backend: str | None = None) -> List[str]:
+        with self._state_lock:
+            targets = list(self._models) if backend is None else [backend]
+            unloaded = [name for name in targets if self._models.pop(name, None)]
+            for name in unloaded:
+                self._last_used.pop(name, None)
+            if backend is None:
+                self._unavailable.clear()
+            else:
+                self._unavailable.pop(backend, None)
+        if unloaded:
+            gc.collect()
+        return unloaded
+
+    def unload_idle(self, now: float | None = None) -> List[str]:
+        if self.idle_seconds <= 0:
+            return []
+        current = time.monotonic() if now is None else now
+        with self._state_lock:
+            idle = [
+                backend
+                for backend, last_used in self._last_used.items()
+                if current - last_used >= self.idle_seconds
+            ]
+        unloaded: List[str] = []
+        for backend in idle:
+            unloaded.extend(self.unload(backend))
+        return unloaded
+
+    def start_idle_reaper(self, interval_seconds: float = 30.0) -> None:
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._reaper_stop.clear()
+
+        def _reap() -> None:
+            while not self._reaper_stop.wait(interval_seconds):
+                self.unload_idle()
+
+        self._reaper = threading.Thread(
+            target=_reap, name="voicedna-encoder-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def stop_idle_reaper(self) -> None:
+        self._reaper_stop.set()
+        self._reaper = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._state_lock:
+            return {
+                "device": self.device,
+                "cpu_threads": self.cpu_threads,
+                "loaded": sorted(self._models),
+                "unavailable": sorted(self._unavailable),
+                "load_seconds": {
+                    backend: round(seconds, 3)
+                    for backend, seconds in self._load_seconds.items()
+                },
+            }
+
+    def _apply_cpu_threads(self) -> None:
+        if self._threads_applied or not self.cpu_threads:
+            return
+        try:
+            import torch
+
+            torch.set_num_threads(int(self.cpu_threads))
+        except Exception as error:
+            logger.debug("Could not set encoder CPU threads: %s", error)
+        self._threads_applied = True
+
+
+ENCODER_POOL = SpeakerEncoderPool.from_env()
+
+
+def get_encoder_pool() -> SpeakerEncoderPool:
+    return ENCODER_POOL
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import csv
+import json
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+from voice_dna import BINARY_SUFFIX, VoiceDNA
+
+from .consistency import VoiceConsistencyEngine, _read_wav_bytes
+from .embedding_cache import (
+    audio_content_hash,
+    file_content_hash,
+    get_embedding_cache,
+)
+from .encoders import get_encoder_pool
+from .streaming import should_stream
+
+AUDIO_SUFFIXES = (".wav", ".flac", ".mp3", ".m4a", ".ogg")
+ENCRYPTED_SUFFIX = ".voicedna.enc"
+
+ProgressCallback = Callable[["EnrollmentResult", int, int], None]
+
+
+@dataclass
+class EnrollmentJob:
+    audio_path: Path
+    voice_name: str
+    user: str = ""
+
+
+@dataclass
+class EnrollmentResult:
+    voice_name: str
+    audio_path: str
+    output_path: str
+    status: str
+    backend: str = ""
+    fingerprint: str = ""
+    error: str = ""
+    decode_seconds: float = 0.0
+    embed_seconds: float = 0.0
+    encrypt_seconds: float = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        return self.decode_seconds + self.embed_seconds + self.encrypt_seconds
+
+
+@dataclass
+class _Decoded:
+    job: EnrollmentJob
+    output_path: Path
+    content_hash: str = ""
+    sample_rate: int = 0
+    waveform: np.ndarray | None = None
+    decode_seconds: float = 0.0
+    error: str = ""
+
+
+def _slugify(value: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "_", value.strip().lower())
+    slug = re.sub(r"_+", "_", slug).strip("_")
+    return slug or "voice"
+
+
+def load_jobs(source: str | Path) -> List[EnrollmentJob]:
+    """Read enrollment jobs from a directory of recordings or a manifest.
+
+    Manifests may be CSV (``audio,voice_name,user`` header), JSON (a list of
+    objects with the same keys) or JSON lines. Relative audio paths are
+    resolved against the manifest's directory.
+    """
+    source_path = Path(source)
+    if source_path.is_dir():
+        return [
+            EnrollmentJob(audio_path=path, voice_name=path.stem)
+            for path in sorted(source_path.iterdir())
+            if path.is_file() and path.suffix.lower() in AUDIO_SUFFIXES
+        ]
+
+    text = source_path.read_text(encoding="utf-8")
+    if source_path.suffix.lower() == ".csv":
+        rows: List[Dict[str, Any]] = list(csv.DictReader(text.splitlines()))
+    elif source_path.suffix.lower() == ".jsonl":
+        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        rows = json.loads(text)
+
+    jobs: List[EnrollmentJob] = []
+    for row in rows:
+        audio = (row.get("audio") or "").strip()
+        if not audio:
+            raise ValueError(f"Manifest row without 'audio' in {source_path}: {row}")
+        audio_path = Path(audio).expanduser()
+        if not audio_path.is_absolute():
+            audio_path = source_path.parent / audio_path
+        jobs.append(
+            EnrollmentJob(
+                audio_path=audio_path,
+                voice_name=(row.get("voice_name") or "").strip() or audio_path.stem,
+                user=(row.get("user") or "").strip(),
+            )
+        )
+    return jobs
+
+
+def _write_voice(
+    data: Dict[str, Any], password: str | None, output_path: str, binary: bool
+) -> float:
+    started_at = time.perf_counter()
+    dna = VoiceDNA(**data)
+    partial_path = f"{output_path}.partial"
+    if binary:
+        dna.save_binary(partial_path, password=password)
+    else:
+        dna.save_encrypted(password=password, filepath=partial_path)
+    os.replace(partial_path, output_path)
+    return time.perf_counter() - started_at
+
+
+class BatchEnroller:
+    """Create many VoiceDNA files from recordings in one pass.
+
+    Recordings are decoded on a thread pool, embedded in batches against the
+    pooled speaker encoder (checking the embedding cache first) and written
+    on a process pool so the PBKDF2 step of each file runs in parallel.
+    Outputs that already exist are skipped, and files are written under a
+    ``.partial`` name and renamed, so an interrupted run can be resumed.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path = "voices",
+        password: str | None = None,
+        binary: bool = False,
+        batch_size: int = 16,
+        decode_workers: int = 4,
+        encrypt_workers: int | None = None,
+        overwrite: bool = False,
+        dims: int = 256,
+        engine: VoiceConsistencyEngine | None = None,
+        on_progress: ProgressCallback | None = None,
+    ):
+        if not binary and not password:
+            raise ValueError("A password is required for encrypted enrollment")
+        self.output_dir = Path(output_dir)
+        self.password = password
+        self.binary = binary
+        self.batch_size = max(1, batch_size)
+        self.decode_workers = max(1, decode_workers)
+        if encrypt_workers is None:
+            encrypt_workers = os.cpu_count() or 1
+        self.encrypt_workers = encrypt_workers
+        self.overwrite = overwrite
+        self.dims = dims
+        self.engine = engine or VoiceConsistencyEngine()
+        self.on_progress = on_progress
+
+    def output_path_for(self, job: EnrollmentJob) -> Path:
+        suffix = BINARY_SUFFIX if self.binary else ENCRYPTED_SUFFIX
+        return self.output_dir / f"{_slugify(job.voice_name)}{suffix}"
+
+    def run(self, jobs: Sequence[EnrollmentJob]) -> List[EnrollmentResult]:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        results: List[EnrollmentResult] = []
+        pending: List[EnrollmentJob] = []
+        planned: set[Path] = set()
+        for job in jobs:
+            output_path = self.output_path_for(job)
+            status, error = "", ""
+            if output_path in planned:
+                status, error = "failed", "duplicate voice name in this batch"
+            elif output_path.exists() and not self.overwrite:
+                status = "skipped"
+            planned.add(output_path)
+            if not status:
+                pending.append(job)
+                continue
+            self._report(
+                results,
+                EnrollmentResult(
+                    voice_name=job.voice_name,
+                    audio_path=str(job.audio_path),
+                    output_path=str(output_path),
+                    status=status,
+                    error=error,
+                ),
+                len(jobs),
+            )
+
+        writes: List[tuple[Future, EnrollmentResult]] = []
+        process_pool = (
+            ProcessPoolExecutor(
+                max_workers=self.encrypt_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            if self.encrypt_workers > 0 and len(pending) > 1
+            else None
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=self.decode_workers) as decode_pool:
+                for start in range(0, len(pending), self.batch_size):
+                    chunk = pending[start : start + self.batch_size]
+                    decoded = list(decode_pool.map(self._decode, chunk))
+                    for item, result, dna in self._embed(decoded):
+                        if dna is None:
+                            self._report(results, result, len(jobs))
+                            continue
+                        args = (
+                            asdict(dna),
+                            self.password,
+                            str(item.output_path),
+                            self.binary,
+                        )
+                        if process_pool is None:
+                            self._finish_write(results, result, len(jobs), args=args)
+                        else:
+                            writes.append(
+                                (process_pool.submit(_write_voice, *args), result)
+                            )
+                    writes = self._drain(results, writes, len(jobs), wait=False)
+
+            self._drain(results, writes, len(jobs), wait=True)
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown(wait=True, cancel_futures=True)
+        return results
+
+    def _decode(self, job: EnrollmentJob) -> _Decoded:
+        item = _Decoded(job=job, output_path=self.output_path_for(job))
+        started_at = time.perf_counter()
+        try:
+            if job.audio_path.suffix.lower() == ".wav" and not should_stream(
+                job.audio_path
+            ):
+                audio_bytes = job.audio_path.read_bytes()
+                item.content_hash = audio_content_hash(audio_bytes)
+                item.sample_rate, mono = _read_wav_bytes(audio_bytes)
+                item.waveform = mono / 32768.0
+            else:
+                item.content_hash = file_content_hash(job.audio_path)
+        except Exception as error:
+            item.error = str(error)
+        item.decode_seconds = time.perf_counter() - started_at
+        return item
+
+    def _embed(
+        self, decoded: List[_Decoded]
+    ) -> List[tuple[_Decoded, EnrollmentResult, VoiceDNA | None]]:
+        cache = get_embedding_cache()
+        pool = get_encoder_pool()
+        embeddings: Dict[int, List[float]] = {}
+        backends: Dict[int, str] = {}
+        embed_seconds: Dict[int, float] = {}
+
+        for backend in pool.available_backends():
+            misses: List[int] = []
+            for index, item in enumerate(decoded):
+                if index in embeddings or item.error or item.waveform is None:
+                    continue
+                cached = None
+                if cache.enabled:
+                    cached = cache.get(self._cache_key(item, backend))
+                if cached is not None:
+                    embeddings[index] = cached
+                    backends[index] = backend
+                else:
+                    misses.append(index)
+            if not misses:
+                continue
+
+            started_at = time.perf_counter()
+            try:
+                clips = [
+                    (decoded[index].waveform, decoded[index].sample_rate)
+                    for index in misses
+                ]
+                vectors = self.engine.embed_waveforms(
+                    clips,
+                    backend=backend,
+                    dims=self.dims,
+                )
+            except Exception:
+                continue
+            share = (time.perf_counter() - started_at) / len(misses)
+            for index, vector in zip(misses, vectors):
+                embeddings[index] = vector
+                backends[index] = backend
+                embed_seconds[index] = share
+                if cache.enabled:
+                    cache.put(
+                        self._cache_key(decoded[index], backend), vector, backend=backend
+                    )
+
+        outputs: List[tuple[_Decoded, EnrollmentResult, VoiceDNA | None]] = []
+        for index, item in enumerate(decoded):
+            result = EnrollmentResult(
+                voice_name=item.job.voice_name,
+                audio_path=str(item.job.audio_path),
+                output_path=str(item.output_path),
+                status="created",
+                decode_seconds=item.decode_seconds,
+            )
+            if item.error:
+                result.status = "failed"
+                result.error = item.error
+                outputs.append((item, result, None))
+                continue
+
+            embedding = embeddings.get(index)
+            if embedding is None:
+                started_at = time.perf_counter()
+                embedding = VoiceDNA._extract_core_embedding(
+                    str(item.job.audio_path), dims=self.dims
+                )
+                embed_seconds[index] = time.perf_counter() - started_at
+            result.backend = backends.get(index, "imprint")
+            result.embed_seconds = embed_seconds.get(index, 0.0)
+
+            dna = VoiceDNA.create_new(
+                str(item.job.audio_path),
+                item.job.user or _slugify(item.job.voice_name),
+                core_embedding=embedding,
+            )
+            result.fingerprint = dna.voice_fingerprint_id
+            outputs.append((item, result, dna))
+        return outputs
+
+    def _cache_key(self, item: _Decoded, backend: str) -> str:
+        return get_embedding_cache().make_key(
+            item.content_hash,
+            f"enroll:{backend}",
+            get_encoder_pool().model_version(backend),
+            self.dims,
+        )
+
+    def _drain(
+        self,
+        results: List[EnrollmentResult],
+        writes: List[tuple[Future, EnrollmentResult]],
+        total: int,
+        wait: bool,
+    ) -> List[tuple[Future, EnrollmentResult]]:
+        remaining = []
+        for future, result in writes:
+            if wait or future.done():
+                self._finish_write(results, result, total, future=future)
+            else:
+                remaining.append((future, result))
+        return remaining
+
+    def _finish_write(
+        self,
+        results: List[EnrollmentResult],
+        result: EnrollmentResult,
+        total: int,
+        args: tuple | None = None,
+        future: Future | None = None,
+    ) -> None:
+        try:
+            result.encrypt_seconds = (
+                future.result() if future is not None else _write_voice(*args)
+            )
+        except Exception as error:
+            result.status = "failed"
+            result.error = str(error)
+        self._report(results, result, total)
+
+    def _report(
+        self, results: List[EnrollmentResult], result: EnrollmentResult, total: int
+    ) -> None:
+        results.append(result)
+        if self.on_progress is not None:
+            self.on_progress(result, len(results), total)
+
+
+def summarize(results: Sequence[EnrollmentResult], wall_seconds: float) -> Dict[str, Any]:
+    created = [result for result in results if result.status == "created"]
+    return {
+        "total": len(results),
+        "created": len(created),
+        "skipped": sum(1 for result in results if result.status == "skipped"),
+        "failed": sum(1 for result in results if result.status == "failed"),
+        "wall_seconds": round(wall_seconds, 3),
+        "decode_seconds": round(sum(result.decode_seconds for result in created), 3),
+        "embed_seconds": round(sum(result.embed_seconds for result in created), 3),
+        "encrypt_seconds": round(sum(result.encrypt_seconds for result in created), 3),
+        "files_per_second": round(len(created) / wall_seconds, 2)
+        if wall_seconds > 0
+        else 0.0,
+        "files": [
+            {**asdict(result), "total_seconds": round(result.total_seconds, 4)}
+            for result in results
+        ],
+    }
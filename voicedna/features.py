@@ -0,0 +1,194 @@
+"""Pure-numpy log-mel / MFCC speaker features.
+
+The CPU fallback embedding for hosts without resemblyzer or SpeechBrain.
+Frames are analysed at the clip's native rate with a fixed frame duration
+and a filterbank laid out in Hz, so clips at different sample rates land in
+the same feature space without resampling.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .consistency import _fit_embedding_dims
+from .vad import voiced_frames
+
+FRAME_SECONDS = 0.025
+HOP_SECONDS = 0.010
+N_MELS = 80
+N_MFCC = 32
+F_MIN = 20.0
+F_MAX = 7600.0
+PRE_EMPHASIS = 0.97
+# Log floor relative to each clip's loudest mel bin; empty bands of clean or
+# band-limited audio would otherwise swing the features on tiny changes.
+DYNAMIC_RANGE_DB = 50.0
+
+# Block layout of the 256-dim embedding: liftered MFCC means, MFCC spread,
+# delta-MFCC spread, detrended log-mel means and log-mel spread.
+_BLOCKS = (N_MFCC, N_MFCC, N_MFCC, N_MELS, N_MELS)
+EMBEDDING_DIMS = sum(_BLOCKS)
+
+
+def _hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + np.asarray(hz, dtype=np.float64) / 700.0)
+
+
+def _mel_to_hz(mel):
+    return 700.0 * (10.0 ** (np.asarray(mel, dtype=np.float64) / 2595.0) - 1.0)
+
+
+@lru_cache(maxsize=32)
+def frame_geometry(sample_rate: int) -> Tuple[int, int, int]:
+    """``(frame_length, hop_length, n_fft)`` in samples for ``sample_rate``."""
+    frame_length = max(16, int(round(FRAME_SECONDS * sample_rate)))
+    hop_length = max(1, int(round(HOP_SECONDS * sample_rate)))
+    n_fft = 1 << (frame_length - 1).bit_length()
+    return frame_length, hop_length, n_fft
+
+
+@lru_cache(maxsize=32)
+def analysis_window(frame_length: int) -> np.ndarray:
+    window = np.hanning(frame_length + 1)[:-1].astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=32)
+def mel_filterbank(
+    sample_rate: int, n_fft: int, n_mels: int = N_MELS
+) -> np.ndarray:
+    """Slaney-style triangular filters, shape ``(n_fft // 2 + 1, n_mels)``."""
+    f_max = min(F_MAX, sample_rate / 2.0)
+    edges = _mel_to_hz(np.linspace(_hz_to_mel(F_MIN), _hz_to_mel(f_max), n_mels + 2))
+    bins = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    lower, centre, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins[None, :] - lower) / (centre - lower)
+    falling = (upper - bins[None, :]) / (upper - centre)
+    filters = np.maximum(0.0, np.minimum(rising, falling))
+    filters *= (2.0 / (upper - lower))
+    bank = np.ascontiguousarray(filters.T, dtype=np.float32)
+    bank.flags.writeable = False
+    return bank
+
+
+@lru_cache(maxsize=8)
+def dct_matrix(n_mels: int = N_MELS, n_mfcc: int = N_MFCC) -> np.ndarray:
+    """Orthonormal DCT-II rows 1..n_mfcc (c0, the loudness term, is dropped)."""
+    k = np.arange(1, n_mfcc + 1)[:, None]
+    n = np.arange(n_mels)[None, :]
+    basis = np.sqrt(2.0 / n_mels) * np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels))
+    matrix = np.ascontiguousarray(basis.T, dtype=np.float32)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def frame_signal(waveform: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Pre-emphasised, windowed frames, shape ``(frames, frame_length)``."""
+    frame_length, hop_length, _ = frame_geometry(sample_rate)
+    signal = np.asarray(waveform, dtype=np.float32)
+    if signal.size < frame_length:
+        signal = np.pad(signal, (0, frame_length - signal.size))
+    emphasised = np.empty_like(signal)
+    emphasised[0] = signal[0]
+    emphasised[1:] = signal[1:] - PRE_EMPHASIS * signal[:-1]
+    frames = np.lib.stride_tricks.sliding_window_view(emphasised, frame_length)[
+        ::hop_length
+    ]
+    return frames * analysis_window(frame_length)
+
+
+def mel_power_frames(frames: np.ndarray, sample_rate: int) -> np.ndarray:
+    _, _, n_fft = frame_geometry(sample_rate)
+    power = np.abs(np.fft.rfft(frames, n=n_fft, axis=1)) ** 2
+    return power.astype(np.float32) @ mel_filterbank(sample_rate, n_fft)
+
+
+def log_compress(mel_power: np.ndarray) -> np.ndarray:
+    floor = max(float(mel_power.max(initial=0.0)), 1e-12) * 10.0 ** (
+        -DYNAMIC_RANGE_DB / 10.0
+    )
+    return np.log(mel_power + floor)
+
+
+def speaker_embedding(
+    waveform: np.ndarray, sample_rate: int, dims: int = EMBEDDING_DIMS
+) -> List[float]:
+    return speaker_embeddings([(waveform, sample_rate)], dims)[0]
+
+
+def speaker_embeddings(
+    clips: Sequence[Tuple[np.ndarray, int]], dims: int = EMBEDDING_DIMS
+) -> List[List[float]]:
+    """Statistics-pooled log-mel/MFCC embeddings for several clips.
+
+    Clips sharing a sample rate are framed into one matrix so the FFT and
+    the filterbank each run once per rate. Each clip keeps only its
+    voiced frames (energy VAD) and pools means and spreads. MFCCs drop c0
+    and are liftered, and the log-mel means are detrended, so the overall
+    level of a recording does not change the embedding.
+    """
+    results: List[List[float] | None] = [None] * len(clips)
+    by_rate: dict[int, List[int]] = {}
+    for position, (waveform, sample_rate) in enumerate(clips):
+        if np.asarray(waveform).size == 0:
+            results[position] = [0.0] * dims
+        else:
+            by_rate.setdefault(int(sample_rate), []).append(position)
+
+    for sample_rate, positions in by_rate.items():
+        framed = [frame_signal(clips[position][0], sample_rate) for position in positions]
+        counts = [frames.shape[0] for frames in framed]
+        frames = np.concatenate(framed)
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frames.shape[1])
+        mel_power = mel_power_frames(frames, sample_rate)
+        start = 0
+        for position, count in zip(positions, counts):
+            stop = start + count
+            log_mel = log_compress(mel_power[start:stop])
+            vector = _pool(log_mel, log_mel @ dct_matrix(), rms[start:stop])
+            results[position] = (
+                vector.tolist()
+                if dims == EMBEDDING_DIMS
+                else _fit_embedding_dims(vector, dims=dims)
+            )
+            start = stop
+    return results  # type: ignore[return-value]
+
+
+def _pool(log_mel: np.ndarray, mfcc: np.ndarray, rms: np.ndarray) -> np.ndarray:
+    voiced = voiced_frames(rms)
+    if voiced.sum() >= 3:
+        log_mel, mfcc = log_mel[voiced], mfcc[voiced]
+    delta = np.diff(mfcc, axis=0) if mfcc.shape[0] > 1 else np.zeros_like(mfcc)
+    # Every block is signed and roughly zero-mean, so unrelated voices land
+    # near zero cosine instead of sharing one all-positive direction.
+    blocks = [
+        mfcc.mean(axis=0) * _lifter(),
+        0.5 * _centre(mfcc.std(axis=0)) * _lifter(),
+        0.5 * _centre(delta.std(axis=0)) * _lifter(),
+        _detrend(log_mel.mean(axis=0)),
+        _centre(log_mel.std(axis=0)),
+    ]
+    return np.concatenate(blocks).astype(np.float32)
+
+
+@lru_cache(maxsize=1)
+def _lifter() -> np.ndarray:
+    # Low cepstra mostly encode the shared spectral tilt of speech; the higher
+    # ones carry formant and pitch detail that separates speakers.
+    return np.arange(1, N_MFCC + 1, dtype=np.float32)
+
+
+def _centre(block: np.ndarray) -> np.ndarray:
+    return block - block.mean()
+
+
+def _detrend(block: np.ndarray) -> np.ndarray:
+    """``block`` minus its least-squares line (removes level and spectral tilt)."""
+    positions = np.arange(block.size, dtype=np.float64)
+    slope, intercept = np.polyfit(positions, block, 1)
+    return block - (slope * positions + intercept)
@@ -1,13 +1,18 @@
 import io
 from typing import Dict
 
+import numpy as np
+
 from voice_dna import VoiceDNA
 
-from .audio_helpers import pitch_shift_wav_bytes
-from ..plugins.base import IVoiceDNAFilter
+from .audio_helpers import pitch_shift_wav_bytes, rate_shift_samples
+from ..audio import AudioBuffer
+from ..plugins.base import FilterStream, IStreamingFilter
+
 
+class AgeMaturationFilter(IStreamingFilter):
+    thread_safe = True
 
-class AgeMaturationFilter(IVoiceDNAFilter):
     def name(self) -> str:
         return "AgeMaturation"
 
@@ -15,10 +20,7 @@ class AgeMaturationFilter(IVoiceDNAFilter):
         return 10
 
     def process(self, audio_bytes: bytes, dna: VoiceDNA, params: Dict) -> bytes:
-        age = params.get("force_age") or dna.get_current_age()
-        pitch_factor = 1.0 - (age - 5) * 0.015
-        bounded_factor = max(0.5, min(1.25, pitch_factor))
-        params["age_maturation.pitch_factor"] = bounded_factor
+        bounded_factor = self._pitch_factor(dna, params)
 
         audio_format = params.get("audio_format", "wav")
         try:
@@ -43,3 +45,67 @@ class AgeMaturationFilter(IVoiceDNAFilter):
                 except Exception as fallback_error:
                     params["age_maturation.fallback_error"] = str(fallback_error)
             return audio_bytes
+
+    def process_buffer(
+        self, buffer: AudioBuffer, dna: VoiceDNA, params: Dict
+    ) -> AudioBuffer:
+        bounded_factor = self._pitch_factor(dna, params)
+        return buffer.replace(rate_shift_samples(buffer.samples, bounded_factor))
+
+    def open(
+        self, dna: VoiceDNA, params: Dict, sample_rate: int, channels: int
+    ) -> FilterStream:
+        return _RateShiftStream(self._pitch_factor(dna, params))
+
+    def _pitch_factor(self, dna: VoiceDNA, params: Dict) -> float:
+        age = params.get("force_age") or dna.get_current_age()
+        pitch_factor = 1.0 - (age - 5) * 0.015
+        bounded_factor = max(0.5, min(1.25, pitch_factor))
+        params["age_maturation.pitch_factor"] = bounded_factor
+        return bounded_factor
+
+
+class _RateShiftStream(FilterStream):
+    """Block-wise :func:`rate_shift_samples` with identical output.
+
+    Output frame ``k`` reads the input at position ``k * factor``; the stream
+    carries the next output index and the previous block's last frame so
+    positions that straddle a block boundary interpolate correctly.
+    """
+
+    def __init__(self, factor: float):
+        self.factor = max(0.5, min(1.25, factor))
+        self.consumed = 0
+        self.next_output = 0
+        self.tail: np.ndarray | None = None
+
+    def process_block(self, samples: np.ndarray) -> np.ndarray:
+        frames = samples.shape[0]
+        if frames == 0:
+            return samples
+        if self.tail is None:
+            window, window_start = samples, self.consumed
+        else:
+            window = np.concatenate([self.tail, samples])
+            window_start = self.consumed - 1
+
+        last_index = self.consumed + frames - 1
+        stop = int(last_index / self.factor) + 1
+        positions = (
+            np.arange(self.next_output, stop, dtype=np.float64) * self.factor
+            - window_start
+        )
+        self.next_output = max(self.next_output, stop)
+        self.consumed += frames
+        self.tail = samples[-1:]
+
+        source_indices = np.arange(window.shape[0], dtype=np.float64)
+        if window.ndim == 1:
+            return np.interp(positions, source_indices, window).astype(np.float32)
+        return np.stack(
+            [
+                np.interp(positions, source_indices, window[:, channel])
+                for channel in range(window.shape[1])
+            ],
+            axis=1,
+        ).astype(np.float32)
@@ -82,3 +82,36 @@ def _resample_1d(signal: np.ndarray, pitch_factor: float) -> np.ndarray:
         restore_indices, np.arange(resampled.shape[0], dtype=np.float32), resampled
     )
     return np.clip(restored, -32768, 32767).astype(np.int16)
+
+
+def rate_shift_samples(samples: np.ndarray, factor: float) -> np.ndarray:
+    """Play ``samples`` at ``factor`` times their rate, resampled back.
+
+    Float equivalent of pydub's ``_spawn(frame_rate=rate * factor)`` followed
+    by ``set_frame_rate(rate)``: pitch and duration both scale by ``factor``.
+    """
+    bounded_factor = max(0.5, min(1.25, factor))
+    frames = samples.shape[0]
+    if frames <= 1:
+        return samples
+    target_length = int((frames - 1) / bounded_factor) + 1
+    positions = np.arange(target_length, dtype=np.float64) * bounded_factor
+    source_indices = np.arange(frames, dtype=np.float64)
+    if samples.ndim == 1:
+        return np.interp(positions, source_indices, samples).astype(np.float32)
+    return np.stack(
+        [
+            np.interp(positions, source_indices, samples[:, channel])
+            for channel in range(samples.shape[1])
+        ],
+        axis=1,
+    ).astype(np.float32)
+
+
+def imprint_mix_samples(samples: np.ndarray, strength: float) -> np.ndarray:
+    """Float equivalent of the pydub wet/dry overlay used for WAV imprinting."""
+    bounded_strength = max(0.0, min(1.0, strength))
+    dry_gain = 10 ** (-(6 - 4 * bounded_strength) / 20)
+    wet_gain = 10 ** ((-18 + 12 * bounded_strength) / 20)
+    mixed = samples * np.float32(dry_gain + wet_gain)
+    return np.clip(mixed, -1.0, 32767 / 32768).astype(np.float32)
@@ -1,37 +1,182 @@
 import io
 import os
 import tempfile
-from typing import Dict
+import time
+import wave
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
 
 from voice_dna import VoiceDNA
 
-from .audio_helpers import imprint_mix_wav_bytes
-from ..consistency import VoiceConsistencyEngine
-from ..plugins.base import IVoiceDNAFilter
+from .audio_helpers import imprint_mix_samples, imprint_mix_wav_bytes
+from ..audio import AudioBuffer
+from ..budget import StageCosts
+from ..consistency import (
+    NUMPY_EXTRACTOR_VERSION,
+    ConsistencyEnginePool,
+    VoiceConsistencyEngine,
+)
+from ..drift import get_drift_monitor
+from ..plugins.base import FilterStream, IStreamingFilter
+
+
+# Starting cost estimates in ms per second of audio, replaced by measured
+# timings after each stage has run once (see StageCosts).
+IMPRINT_STAGE_COSTS_MS = {
+    "simple": 2.0,
+    "rvc": 800.0,
+    "consistency:full": 45.0,
+    "consistency:score": 20.0,
+    "consistency:watermark": 1.0,
+    "consistency:off": 0.0,
+}
+
+
+class ImprintConverterFilter(IStreamingFilter):
+    thread_safe = True
+
+    def __init__(self):
+        self.costs = StageCosts(IMPRINT_STAGE_COSTS_MS)
+        self.engines = ConsistencyEnginePool()
+
+    def warmup(
+        self,
+        params: Dict | None = None,
+        voice_fingerprint_ids: Iterable[str] = (),
+        sample_rates: Iterable[int] = (16000, 22050, 24000),
+        encoders: bool = True,
+    ) -> Dict[str, Any]:
+        """Build the consistency engine ``params`` select and warm it.
+
+        Loads the speaker encoders and pins the watermark carriers of
+        ``voice_fingerprint_ids``, so the first utterance of each agent does
+        not pay for either.
+        """
+        return self.engines.warmup(
+            voice_fingerprint_ids,
+            sample_rates=sample_rates,
+            encoders=encoders,
+            **_engine_config(params or {}),
+        )
 
+    @property
+    def version(self) -> str:
+        # Consistency correction depends on the numpy embedding extractor.
+        return f"1+{NUMPY_EXTRACTOR_VERSION}"
 
-class ImprintConverterFilter(IVoiceDNAFilter):
     def name(self) -> str:
         return "ImprintConverter"
 
     def priority(self) -> int:
         return 20
 
-    def process(self, audio_bytes: bytes, dna: VoiceDNA, params: Dict) -> bytes:
-        strength = max(0.0, min(1.0, dna.imprint_strength))
-        params["imprint_converter.strength"] = strength
-        params["imprint_converter.source"] = dna.imprint_source
-        params["imprint_converter.rvc_ready"] = True
-        params["imprint_converter.rvc_mode"] = "disabled"
-        params["imprint_converter.consistency_threshold"] = float(
-            params.get("imprint_converter.consistency_threshold", 0.92)
-        )
-        params["imprint_converter.consistency_enabled"] = bool(
-            params.get("imprint_converter.consistency_enabled", True)
+    def supports_buffer(self, params: Dict) -> bool:
+        return params.get("imprint_converter.mode", "simple") != "rvc"
+
+    def process_buffer(
+        self, buffer: AudioBuffer, dna: VoiceDNA, params: Dict
+    ) -> AudioBuffer:
+        started_at = time.perf_counter()
+        output = self._convert_buffer(buffer, dna, params)
+        self._observe(params, started_at, buffer.duration_seconds)
+        return output
+
+    def _convert_buffer(
+        self, buffer: AudioBuffer, dna: VoiceDNA, params: Dict
+    ) -> AudioBuffer:
+        strength, mode = self._prepare_params(dna, params)
+        if mode == "rvc_stub":
+            params["imprint_converter.rvc_note"] = (
+                "RVC stub path selected; using placeholder conversion"
+            )
+            params["imprint_converter.rvc_mode"] = "stub"
+            self._process_rvc_stub(b"", dna, params)
+            converted = buffer
+        else:
+            converted = buffer.replace(imprint_mix_samples(buffer.samples, strength))
+        return self._enforce_consistency_buffer(converted, dna, params)
+
+    def open(
+        self, dna: VoiceDNA, params: Dict, sample_rate: int, channels: int
+    ) -> FilterStream:
+        """Stream the imprint mix and sonic watermark block by block.
+
+        Consistency scoring and correction need the whole utterance, so a
+        stream only carries the watermark position between blocks.
+        """
+        strength, mode = self._prepare_params(dna, params)
+        if mode == "rvc_stub":
+            params["imprint_converter.rvc_note"] = (
+                "RVC stub path selected; using placeholder conversion"
+            )
+            params["imprint_converter.rvc_mode"] = "stub"
+            self._process_rvc_stub(b"", dna, params)
+        watermark = bool(params.get("imprint_converter.consistency_enabled", True))
+        params["imprint_converter.consistency_corrected"] = False
+        params["imprint_converter.watermark_applied"] = watermark
+        return _ImprintStream(
+            strength=None if mode == "rvc_stub" else strength,
+            engine=self.engines.get(**_engine_config(params)) if watermark else None,
+            voice_fingerprint_id=dna.voice_fingerprint_id,
+            sample_rate=sample_rate,
         )
 
-        mode = params.get("imprint_converter.mode", "simple")
-        params["imprint_converter.mode"] = mode
+    def process(self, audio_bytes: bytes, dna: VoiceDNA, params: Dict) -> bytes:
+        started_at = time.perf_counter()
+        output = self._convert_bytes(audio_bytes, dna, params)
+        self._observe(params, started_at, _wav_seconds(audio_bytes))
+        return output
+
+    def estimate_cost_ms(self, params: Dict, audio_seconds: float) -> float:
+        return self.costs.estimate_ms(
+            _convert_stage(params), audio_seconds
+        ) + self.costs.estimate_ms(_consistency_stage(params), audio_seconds)
+
+    def degrade(
+        self, params: Dict, remaining_ms: float, audio_seconds: float
+    ) -> List[str]:
+        """Drop RVC, then parametric correction, then consistency scoring.
+
+        The sonic watermark is never dropped.
+        """
+        steps = [
+            ("rvc", "imprint_converter.mode", "simple"),
+            ("parametric_correction", "imprint_converter.correction_enabled", False),
+            ("consistency_scoring", "imprint_converter.consistency_scoring", False),
+        ]
+        dropped: List[str] = []
+        for stage, key, cheaper in steps:
+            if self.estimate_cost_ms(params, audio_seconds) <= remaining_ms:
+                break
+            if stage == "rvc" and params.get(key, "simple") != "rvc":
+                continue
+            if stage != "rvc" and (
+                not params.get(key, True)
+                or not params.get("imprint_converter.consistency_enabled", True)
+            ):
+                continue
+            params[key] = cheaper
+            dropped.append(stage)
+        return dropped
+
+    def _observe(self, params: Dict, started_at: float, audio_seconds: float) -> None:
+        if audio_seconds <= 0:
+            return
+        consistency_seconds = params.get("imprint_converter.consistency_seconds", 0.0)
+        convert_seconds = time.perf_counter() - started_at - consistency_seconds
+        stage = _convert_stage(params)
+        # An RVC call that fell back without converting says nothing about
+        # what a real conversion costs.
+        if stage != "rvc" or params.get("imprint_converter.rvc_mode") == "active":
+            self.costs.observe(stage, convert_seconds, audio_seconds)
+        if consistency_seconds:
+            self.costs.observe(
+                _consistency_stage(params), consistency_seconds, audio_seconds
+            )
+
+    def _convert_bytes(self, audio_bytes: bytes, dna: VoiceDNA, params: Dict) -> bytes:
+        strength, mode = self._prepare_params(dna, params)
 
         if mode == "rvc":
             converted = self._process_rvc(audio_bytes, dna, params)
@@ -69,6 +214,39 @@ class ImprintConverterFilter(IVoiceDNAFilter):
                     params["imprint_converter.fallback_error"] = str(fallback_error)
             return audio_bytes
 
+    def _prepare_params(self, dna: VoiceDNA, params: Dict) -> tuple[float, str]:
+        strength = max(0.0, min(1.0, dna.imprint_strength))
+        params["imprint_converter.strength"] = strength
+        params["imprint_converter.source"] = dna.imprint_source
+        params["imprint_converter.rvc_ready"] = True
+        params["imprint_converter.rvc_mode"] = "disabled"
+        params["imprint_converter.consistency_threshold"] = float(
+            params.get("imprint_converter.consistency_threshold", 0.92)
+        )
+        params["imprint_converter.consistency_enabled"] = bool(
+            params.get("imprint_converter.consistency_enabled", True)
+        )
+        params["imprint_converter.consistency_scoring"] = bool(
+            params.get("imprint_converter.consistency_scoring", True)
+        )
+        params["imprint_converter.correction_enabled"] = bool(
+            params.get("imprint_converter.correction_enabled", True)
+        )
+        params["imprint_converter.scoring_windows"] = int(
+            params.get("imprint_converter.scoring_windows", 0)
+        )
+        params["imprint_converter.scoring_window_seconds"] = float(
+            params.get("imprint_converter.scoring_window_seconds", 1.5)
+        )
+        params["imprint_converter.scoring_strategy"] = str(
+            params.get("imprint_converter.scoring_strategy", "vad")
+        )
+        params["imprint_converter.consistency_seconds"] = 0.0
+
+        mode = params.get("imprint_converter.mode", "simple")
+        params["imprint_converter.mode"] = mode
+        return strength, mode
+
     def _process_rvc(self, audio_bytes: bytes, dna: VoiceDNA, params: Dict) -> bytes:
         """
         Real RVC mode.
@@ -264,23 +442,94 @@ class ImprintConverterFilter(IVoiceDNAFilter):
         if not params.get("imprint_converter.consistency_enabled", True):
             return audio_bytes
 
-        threshold = float(params.get("imprint_converter.consistency_threshold", 0.92))
-        engine = VoiceConsistencyEngine(threshold=threshold)
-        output_audio, score, rvc_ready, correction_applied = engine.enforce_consistency(
-            audio_bytes,
-            dna.core_embedding,
+        started_at = time.perf_counter()
+        engine = self.engines.get(**_engine_config(params))
+        if params.get("imprint_converter.consistency_scoring", True):
+            details: Dict = {}
+            output_audio, score, rvc_ready, correction_applied = (
+                engine.enforce_consistency(
+                    audio_bytes,
+                    dna.core_embedding,
+                    dna.voice_fingerprint_id,
+                    correction=params.get("imprint_converter.correction_enabled", True),
+                    details=details,
+                )
+            )
+            self._record_consistency(params, score, rvc_ready, correction_applied)
+            params["imprint_converter.consistency_rescore"] = details.get("rescore")
+            params["imprint_converter.consistency_windows"] = details.get("windows", 0)
+            self._observe_drift(params, dna, score)
+        else:
+            output_audio = engine.apply_sonic_watermark(
+                audio_bytes, dna.voice_fingerprint_id
+            )
+            self._record_consistency(params, None, None, False)
+        params["imprint_converter.watermark_applied"] = output_audio != audio_bytes
+        params["imprint_converter.consistency_seconds"] = (
+            time.perf_counter() - started_at
+        )
+        return output_audio
+
+    def _enforce_consistency_buffer(
+        self, buffer: AudioBuffer, dna: VoiceDNA, params: Dict
+    ) -> AudioBuffer:
+        if not params.get("imprint_converter.consistency_enabled", True):
+            return buffer
+
+        started_at = time.perf_counter()
+        engine = self.engines.get(**_engine_config(params))
+        if params.get("imprint_converter.consistency_scoring", True):
+            details: Dict = {}
+            output, score, rvc_ready, correction_applied = (
+                engine.enforce_consistency_buffer(
+                    buffer,
+                    dna.core_embedding,
+                    dna.voice_fingerprint_id,
+                    correction=params.get("imprint_converter.correction_enabled", True),
+                    details=details,
+                )
+            )
+            self._record_consistency(params, score, rvc_ready, correction_applied)
+            params["imprint_converter.consistency_rescore"] = details.get("rescore")
+            params["imprint_converter.consistency_windows"] = details.get("windows", 0)
+            self._observe_drift(params, dna, score)
+        else:
+            output = engine.apply_sonic_watermark_buffer(
+                buffer, dna.voice_fingerprint_id
+            )
+            self._record_consistency(params, None, None, False)
+        params["imprint_converter.watermark_applied"] = output is not buffer
+        params["imprint_converter.consistency_seconds"] = (
+            time.perf_counter() - started_at
+        )
+        return output
+
+    def _observe_drift(self, params: Dict, dna: VoiceDNA, score: float) -> None:
+        if not params.get("imprint_converter.drift_monitor", True):
+            return
+        params["imprint_converter.identity_drift"] = get_drift_monitor().observe(
             dna.voice_fingerprint_id,
+            score,
+            params.get("imprint_converter.consistency_threshold"),
         )
 
-        params["imprint_converter.consistency_score"] = round(score, 4)
-        params["imprint_converter.rvc_ready"] = rvc_ready
+    def _record_consistency(
+        self,
+        params: Dict,
+        score: float | None,
+        rvc_ready: bool | None,
+        correction_applied: bool,
+    ) -> None:
+        params["imprint_converter.consistency_score"] = (
+            None if score is None else round(score, 4)
+        )
+        if rvc_ready is not None:
+            params["imprint_converter.rvc_ready"] = rvc_ready
         params["imprint_converter.consistency_corrected"] = correction_applied
-        params["imprint_converter.watermark_applied"] = output_audio != audio_bytes
         if correction_applied and params.get("imprint_converter.rvc_note") is None:
             params["imprint_converter.rvc_note"] = (
                 "Applied gentle parametric correction to reinforce core voice identity"
             )
-        return output_audio
 
     def _process_rvc_stub(
         self, audio_bytes: bytes, dna: VoiceDNA, params: Dict
@@ -306,3 +555,72 @@ class ImprintConverterFilter(IVoiceDNAFilter):
             "imprint_converter.rvc_backend", "rvc-python"
         )
         return audio_bytes
+
+
+class _ImprintStream(FilterStream):
+    def __init__(
+        self,
+        strength: float | None,
+        engine: VoiceConsistencyEngine | None,
+        voice_fingerprint_id: str,
+        sample_rate: int,
+    ):
+        self.strength = strength
+        self.engine = engine
+        self.voice_fingerprint_id = voice_fingerprint_id
+        self.sample_rate = sample_rate
+        self.offset = 0
+
+    def process_block(self, samples: np.ndarray) -> np.ndarray:
+        if self.strength is not None:
+            samples = imprint_mix_samples(samples, self.strength)
+        if self.engine is not None:
+            # The mix already produced a private copy we can watermark in place.
+            samples = self.engine.apply_sonic_watermark_block(
+                samples,
+                self.sample_rate,
+                self.voice_fingerprint_id,
+                self.offset,
+                in_place=self.strength is not None,
+            )
+        self.offset += samples.shape[0]
+        return samples
+
+
+def _convert_stage(params: Dict) -> str:
+    return "rvc" if params.get("imprint_converter.mode", "simple") == "rvc" else "simple"
+
+
+def _engine_config(params: Dict) -> Dict[str, Any]:
+    return {
+        "threshold": params.get("imprint_converter.consistency_threshold", 0.92),
+        "correction_strength": params.get(
+            "imprint_converter.correction_strength", 0.10
+        ),
+        "watermark_depth": params.get("imprint_converter.watermark_depth", 0.002),
+        "scoring_windows": params.get("imprint_converter.scoring_windows", 0),
+        "scoring_window_seconds": params.get(
+            "imprint_converter.scoring_window_seconds", 1.5
+        ),
+        "scoring_strategy": params.get("imprint_converter.scoring_strategy", "vad"),
+        "proxy_margin": params.get("imprint_converter.proxy_margin"),
+    }
+
+
+def _consistency_stage(params: Dict) -> str:
+    if not params.get("imprint_converter.consistency_enabled", True):
+        return "consistency:off"
+    if not params.get("imprint_converter.consistency_scoring", True):
+        return "consistency:watermark"
+    if not params.get("imprint_converter.correction_enabled", True):
+        return "consistency:score"
+    return "consistency:full"
+
+
+def _wav_seconds(audio_bytes: bytes) -> float:
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wave_file:
+            rate = wave_file.getframerate()
+            return wave_file.getnframes() / rate if rate else 0.0
+    except (wave.Error, EOFError):
+        return 0.0
@@ -1,80 +1,243 @@
 from __future__ import annotations
 
-from importlib import metadata
+import io
 import logging
+import multiprocessing
+import threading
 import time
-from typing import Any, Dict, List
+import wave
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+import numpy as np
 
 from voice_dna import VoiceDNA
 
+from .audio import AudioBuffer
+from .budget import BUDGET_PARAM, LatencyBudget, remaining_budget_ms
+from .embedding_cache import get_embedding_cache
+from .encoders import get_encoder_pool
 from .filters import AgeMaturationFilter, ImprintConverterFilter
-from .plugins.base import IVoiceDNAFilter
+from .plugins.base import (
+    FilterStream,
+    IAudioBufferFilter,
+    IStreamingFilter,
+    IVoiceDNAFilter,
+)
+from .plugins.registry import PLUGIN_GROUPS, PluginSpec, get_plugin_registry
+from .render_cache import (
+    RENDER_CACHE_PARAM,
+    RenderCache,
+    RenderEntry,
+    dna_state_digest,
+    get_render_cache,
+    normalize_text,
+    params_digest,
+    provider_identity,
+)
 
 
 logger = logging.getLogger("VoiceDNA")
 
 
+@dataclass
+class ProcessResult:
+    """Outcome of one ``VoiceDNAProcessor`` call.
+
+    Each call gets its own result, so threads sharing a processor never see
+    each other's metrics or report.
+    """
+
+    audio: bytes = b""
+    metrics: Dict[str, float] = field(default_factory=dict)
+    report: Dict[str, Any] = field(default_factory=dict)
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """Ordered per-item results of :meth:`VoiceDNAProcessor.process_many`."""
+
+    results: List[ProcessResult] = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def audio(self) -> List[bytes]:
+        return [result.audio for result in self.results]
+
+
 class VoiceDNAProcessor:
+    """Runs the filter chain; safe to share between threads.
+
+    Per-call state lives in a :class:`ProcessResult`. Filters that do not
+    declare ``thread_safe = True`` are serialised with a per-filter lock, so
+    concurrent calls only queue at those filters rather than the whole chain.
+    ``get_last_report()`` returns the calling thread's most recent report.
+    """
+
     def __init__(self):
-        self.filters: List[IVoiceDNAFilter] = []
-        self.last_metrics: Dict[str, float] = {}
-        self.last_report: Dict[str, Any] = {}
+        self._filters: List[IVoiceDNAFilter] = []
+        self._filter_locks: Dict[int, threading.Lock] = {}
+        self._pending_plugins: List[PluginSpec] = []
+        self._plugin_lock = threading.RLock()
+        self._plugins_resolved = threading.Event()
+        self._local = threading.local()
+        self._last_result = ProcessResult()
         self.load_plugins()
 
+    @property
+    def filters(self) -> List[IVoiceDNAFilter]:
+        self._ensure_plugins_loaded()
+        return self._filters
+
+    @property
+    def last_report(self) -> Dict[str, Any]:
+        return self._latest_result().report
+
+    @property
+    def last_metrics(self) -> Dict[str, float]:
+        return self._latest_result().metrics
+
     def register_filter(self, plugin: IVoiceDNAFilter):
         plugin_name = plugin.name()
-        if plugin_name in self.get_filter_names():
-            return
-        self.filters.append(plugin)
-        self.filters.sort(key=lambda filter_plugin: filter_plugin.priority())
+        with self._plugin_lock:
+            if any(existing.name() == plugin_name for existing in self._filters):
+                return
+            if not getattr(plugin, "thread_safe", False):
+                self._filter_locks[id(plugin)] = threading.Lock()
+            self._filters = sorted(
+                [*self._filters, plugin],
+                key=lambda filter_plugin: filter_plugin.priority(),
+            )
 
     def load_plugins(self):
         self._register_builtin_filters()
-        self._load_plugins_from_group("voicedna.filters")
-        self._load_plugins_from_group("voicedna.plugins")
+        registry = get_plugin_registry()
+        with self._plugin_lock:
+            for group in PLUGIN_GROUPS:
+                self._pending_plugins.extend(registry.specs(group))
+            if self._pending_plugins:
+                self._plugins_resolved.clear()
+            else:
+                self._plugins_resolved.set()
 
     def _register_builtin_filters(self):
         self.register_filter(AgeMaturationFilter())
         self.register_filter(ImprintConverterFilter())
 
-    def _load_plugins_from_group(self, group: str):
-        try:
-            discovered = metadata.entry_points(group=group)
-        except TypeError:
-            discovered = metadata.entry_points().select(group=group)
+    def _ensure_plugins_loaded(self) -> None:
+        # The event is set only after every pending plugin is registered, so
+        # a thread arriving mid-load waits on the lock instead of running the
+        # chain without them.
+        if not self._plugins_resolved.is_set():
+            self._resolve_pending_plugins()
 
-        for entrypoint in discovered:
-            try:
-                plugin_factory = entrypoint.load()
-                plugin = (
-                    plugin_factory() if callable(plugin_factory) else plugin_factory
-                )
-                plugin_name = plugin.name()
-                if plugin_name in self.get_filter_names():
+    def _resolve_pending_plugins(self):
+        with self._plugin_lock:
+            registry = get_plugin_registry()
+            while self._pending_plugins:
+                spec = self._pending_plugins.pop(0)
+                try:
+                    plugin_factory = registry.load(spec)
+                    plugin = (
+                        plugin_factory() if callable(plugin_factory) else plugin_factory
+                    )
+                    self.register_filter(plugin)
+                except Exception as error:
+                    logger.warning(
+                        "Failed loading plugin %s from %s: %s",
+                        spec.name,
+                        spec.group,
+                        error,
+                    )
                     continue
-                self.register_filter(plugin)
-            except Exception as error:
-                logger.warning(
-                    "Failed loading plugin %s from %s: %s",
-                    entrypoint.name,
-                    group,
-                    error,
-                )
-                continue
+            self._plugins_resolved.set()
 
     def process(
-        self, audio_bytes: bytes, dna: VoiceDNA, params: Dict | None = None
+        self,
+        audio_bytes: bytes,
+        dna: VoiceDNA,
+        params: Dict | None = None,
+        result: ProcessResult | None = None,
+        budget_ms: float | None = None,
     ) -> bytes:
+        return self.process_with_report(
+            audio_bytes, dna, params, result=result, budget_ms=budget_ms
+        ).audio
+
+    def process_with_report(
+        self,
+        audio_bytes: bytes,
+        dna: VoiceDNA,
+        params: Dict | None = None,
+        result: ProcessResult | None = None,
+        budget_ms: float | None = None,
+    ) -> ProcessResult:
+        """Run the chain once.
+
+        ``budget_ms`` (or ``params["latency_budget_ms"]``) sets a latency
+        budget: filters that would overrun it are degraded and, if optional,
+        skipped. ``report["budget"]`` records what was dropped.
+        """
+        result = result if result is not None else ProcessResult()
         chain_started_at = time.perf_counter()
-        current_audio = audio_bytes
+        current_audio: bytes | AudioBuffer = audio_bytes
         process_params = params or {}
+        budget = LatencyBudget.from_params(budget_ms, process_params)
+        audio_format = process_params.get("audio_format", "wav")
         metrics: Dict[str, float] = {}
         report_filters: List[Dict[str, Any]] = []
+        conversions = {"decodes": 0, "encodes": 0}
+        undecodable: bytes | None = None
+        filters = self.filters
 
-        for filter_obj in self.filters:
+        for filter_obj in filters:
             started_at = time.perf_counter()
+            if budget is not None and not budget.admit(
+                filter_obj, process_params, _audio_seconds(current_audio)
+            ):
+                report_filters.append(
+                    {
+                        "name": filter_obj.name(),
+                        "status": "skipped",
+                        "duration_ms": 0.0,
+                        "reason": "latency_budget",
+                    }
+                )
+                continue
+            use_buffer = isinstance(
+                filter_obj, IAudioBufferFilter
+            ) and filter_obj.supports_buffer(process_params)
+            if (
+                use_buffer
+                and isinstance(current_audio, bytes)
+                and current_audio is not undecodable
+            ):
+                try:
+                    current_audio = AudioBuffer.from_bytes(current_audio, audio_format)
+                    conversions["decodes"] += 1
+                except Exception:
+                    undecodable = current_audio
             try:
-                current_audio = filter_obj.process(current_audio, dna, process_params)
+                with self._filter_locks.get(id(filter_obj)) or nullcontext():
+                    if use_buffer and isinstance(current_audio, AudioBuffer):
+                        current_audio = filter_obj.process_buffer(
+                            current_audio, dna, process_params
+                        )
+                    else:
+                        if isinstance(current_audio, AudioBuffer):
+                            current_audio = current_audio.to_bytes()
+                            conversions["encodes"] += 1
+                        current_audio = filter_obj.process(
+                            current_audio, dna, process_params
+                        )
             except Exception as error:
                 logger.warning("Filter %s failed: %s", filter_obj.name(), error)
                 report_filters.append(
@@ -98,41 +261,234 @@ class VoiceDNAProcessor:
                 }
             )
 
-        self.last_metrics = metrics
-        self.last_report = {
+        if isinstance(current_audio, AudioBuffer):
+            current_audio = current_audio.to_bytes()
+            conversions["encodes"] += 1
+
+        result.audio = current_audio
+        result.metrics = metrics
+        result.params = process_params
+        result.report = {
             "filters": report_filters,
-            "filter_count": len(self.filters),
+            "filter_count": len(filters),
             "total_duration_ms": round(
                 (time.perf_counter() - chain_started_at) * 1000, 3
             ),
             "input_bytes": len(audio_bytes),
             "output_bytes": len(current_audio),
-            "consistency_score": process_params.get(
-                "imprint_converter.consistency_score"
-            ),
-            "rvc_ready": bool(process_params.get("imprint_converter.rvc_ready", False)),
-            "rvc_mode": process_params.get("imprint_converter.rvc_mode", "disabled"),
-            "imprint_converter": {
-                "mode": process_params.get("imprint_converter.mode", "simple"),
-                "rvc_ready": bool(
-                    process_params.get("imprint_converter.rvc_ready", False)
-                ),
-                "rvc_mode": process_params.get(
-                    "imprint_converter.rvc_mode", "disabled"
-                ),
-                "consistency_score": process_params.get(
-                    "imprint_converter.consistency_score"
-                ),
-                "consistency_corrected": bool(
-                    process_params.get("imprint_converter.consistency_corrected", False)
-                ),
-                "watermark_applied": bool(
-                    process_params.get("imprint_converter.watermark_applied", False)
-                ),
-                "rvc_note": process_params.get("imprint_converter.rvc_note"),
-            },
+            "audio_pipeline": conversions,
+            "budget": budget.report() if budget is not None else None,
+            **_params_report(process_params),
+        }
+        self._remember_result(result)
+        return result
+
+    def process_stream(
+        self,
+        blocks: Iterable[bytes | np.ndarray],
+        dna: VoiceDNA,
+        params: Dict | None = None,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        result: ProcessResult | None = None,
+    ) -> Iterator[bytes | np.ndarray]:
+        """Run the chain over PCM blocks, yielding output as soon as it is ready.
+
+        ``blocks`` yields interleaved little-endian PCM16 bytes or float32
+        arrays shaped like ``AudioBuffer.samples``; output blocks use the same
+        representation as the input. Filters implementing
+        :class:`IStreamingFilter` process each block with state carried
+        between blocks. Any other filter collects the rest of the stream and
+        runs once at the end, so the stream still completes but loses its
+        latency advantage from that point on (``report["stream"]["buffered"]``
+        names those filters). A trailing partial PCM frame cannot be decoded
+        and is dropped; ``report["stream"]["dropped_bytes"]`` counts it. The
+        report is available once the generator is exhausted or closed.
+        """
+        result = result if result is not None else ProcessResult()
+        process_params = params if params is not None else {}
+        process_params["audio_format"] = "wav"
+        filters = self.filters
+        started_at = time.perf_counter()
+        stages: List[_StreamStage] = []
+        for filter_obj in filters:
+            lock = self._filter_locks.get(id(filter_obj)) or nullcontext()
+            stage = _StreamStage(filter_obj, lock)
+            try:
+                with lock:
+                    if isinstance(
+                        filter_obj, IStreamingFilter
+                    ) and filter_obj.supports_stream(process_params):
+                        stage.stream = filter_obj.open(
+                            dna, process_params, sample_rate, channels
+                        )
+                    else:
+                        stage.stream = _BufferedFilterStream(
+                            filter_obj, dna, process_params, sample_rate
+                        )
+                        stage.status = "buffered"
+            except Exception as error:
+                stage.fail(error)
+            stages.append(stage)
+
+        stats = {
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "blocks_in": 0,
+            "blocks_out": 0,
+            "frames_in": 0,
+            "frames_out": 0,
+            "dropped_bytes": 0,
+            "first_block_ms": None,
+            "buffered": [stage.name for stage in stages if stage.status == "buffered"],
         }
-        return current_audio
+        as_bytes: bool | None = None
+        remainder = b""
+        frame_bytes = 2 * channels
+
+        def _emit(samples: np.ndarray | None):
+            if samples is None or samples.shape[0] == 0:
+                return None
+            if stats["first_block_ms"] is None:
+                stats["first_block_ms"] = round(
+                    (time.perf_counter() - started_at) * 1000, 3
+                )
+            stats["blocks_out"] += 1
+            stats["frames_out"] += samples.shape[0]
+            if as_bytes:
+                return _samples_to_pcm16(samples)
+            return samples
+
+        try:
+            for block in blocks:
+                if as_bytes is None:
+                    as_bytes = isinstance(block, (bytes, bytearray, memoryview))
+                if as_bytes:
+                    data = remainder + bytes(block)
+                    usable = len(data) - len(data) % frame_bytes
+                    remainder = data[usable:]
+                    samples = _pcm16_to_samples(data[:usable], channels)
+                else:
+                    samples = np.asarray(block, dtype=np.float32)
+                stats["blocks_in"] += 1
+                stats["frames_in"] += samples.shape[0]
+                for stage in stages:
+                    if samples.shape[0] == 0:
+                        break
+                    samples = stage.process_block(samples)
+                output = _emit(samples)
+                if output is not None:
+                    yield output
+            if remainder:
+                stats["dropped_bytes"] = len(remainder)
+                logger.warning(
+                    "PCM stream ended mid-frame; dropped %d trailing bytes",
+                    len(remainder),
+                )
+
+            # Flush in chain order: each stage's tail still has to pass
+            # through every stage after it.
+            pending: np.ndarray | None = None
+            for stage in stages:
+                flushed = []
+                if pending is not None and pending.shape[0]:
+                    flushed.append(stage.process_block(pending))
+                tail = stage.close()
+                if tail is not None:
+                    flushed.append(np.asarray(tail, dtype=np.float32))
+                pending = np.concatenate(flushed) if flushed else None
+            output = _emit(pending)
+            if output is not None:
+                yield output
+        finally:
+            result.metrics = {
+                stage.name: stage.seconds for stage in stages if stage.status != "error"
+            }
+            result.params = process_params
+            result.report = {
+                "filters": [stage.report() for stage in stages],
+                "filter_count": len(filters),
+                "total_duration_ms": round(
+                    (time.perf_counter() - started_at) * 1000, 3
+                ),
+                "stream": stats,
+                **_params_report(process_params),
+            }
+            self._remember_result(result)
+
+    def process_many(
+        self,
+        items: Iterable[bytes],
+        dna: VoiceDNA | Sequence[VoiceDNA],
+        params: Dict | Sequence[Dict] | None = None,
+        executor: str | Executor = "thread",
+        max_workers: int | None = None,
+        warm_encoders: bool = False,
+    ) -> BatchResult:
+        """Process many clips on a thread or process pool.
+
+        ``dna`` and ``params`` may be single values shared by every item or
+        sequences aligned with ``items``; each item gets its own copy of its
+        params. ``executor`` is ``"thread"``, ``"process"`` or an existing
+        ``concurrent.futures`` executor. Process workers are initialised once
+        with the DNA set and a warm processor (built-in and entry-point
+        filters only; filters added with ``register_filter`` stay in this
+        process). To keep process workers across calls pass a
+        :class:`BatchProcessPool` holding every DNA used; other process
+        pools are rejected. Results keep the input order.
+        """
+        audio_items = list(items)
+        count = len(audio_items)
+        dnas, dna_indices = _align_dnas(dna, count)
+        item_params = _align_params(params, count)
+        started_at = time.perf_counter()
+
+        if isinstance(executor, str) and executor not in {"thread", "process"}:
+            raise ValueError("executor must be 'thread', 'process' or an Executor")
+
+        if isinstance(executor, ProcessPoolExecutor) and not isinstance(
+            executor, BatchProcessPool
+        ):
+            raise ValueError(
+                "Pass executor='process' or a BatchProcessPool; other process "
+                "pools cannot be pre-initialised with the DNA set"
+            )
+
+        if executor == "process":
+            with BatchProcessPool(
+                dnas, max_workers=max_workers, warm_encoders=warm_encoders
+            ) as pool:
+                results = _run_in_workers(pool, audio_items, dna_indices, item_params)
+        elif isinstance(executor, BatchProcessPool):
+            indices = [executor.dna_index(dnas[index]) for index in dna_indices]
+            results = _run_in_workers(executor, audio_items, indices, item_params)
+        else:
+            self._ensure_plugins_loaded()
+            if warm_encoders:
+                get_encoder_pool().warmup()
+            pool = (
+                ThreadPoolExecutor(max_workers=max_workers)
+                if executor == "thread"
+                else executor
+            )
+            try:
+                futures = [
+                    pool.submit(
+                        self.process_with_report, audio, dnas[index], item_param
+                    )
+                    for audio, index, item_param in zip(
+                        audio_items, dna_indices, item_params
+                    )
+                ]
+                results = [_collect(future) for future in futures]
+            finally:
+                if pool is not executor:
+                    pool.shutdown(wait=True)
+
+        return BatchResult(
+            results=results,
+            stats=_batch_stats(audio_items, results, time.perf_counter() - started_at),
+        )
 
     def synthesize_and_process(
         self,
@@ -140,19 +496,384 @@ class VoiceDNAProcessor:
         dna: VoiceDNA,
         tts_provider: Any,
         params: Dict | None = None,
+        budget_ms: float | None = None,
     ) -> bytes:
+        """Synthesize then process; ``budget_ms`` covers both steps.
+
+        Results are served from the render cache when the same text, voice
+        state, params, provider configuration and filter chain were rendered
+        before; concurrent identical calls render once. Pass
+        ``params["render_cache"] = False`` to bypass it.
+        ``report["render_cache"]`` carries the hit ratio.
+        """
         if not hasattr(tts_provider, "synthesize"):
             raise ValueError(
                 "tts_provider must implement synthesize(text) -> wav bytes"
             )
 
+        started_at = time.perf_counter()
         process_params = dict(params or {})
         process_params["tts.backend"] = tts_provider.__class__.__name__
-        raw_audio = tts_provider.synthesize(text)
-        return self.process(raw_audio, dna, process_params)
+        if budget_ms is None:
+            budget_ms = process_params.pop(BUDGET_PARAM, None)
+        cache = get_render_cache()
+        use_cache = process_params.pop(RENDER_CACHE_PARAM, True) and cache.enabled
+
+        def _render() -> tuple[RenderEntry, bool]:
+            raw_audio = tts_provider.synthesize(text)
+            result = self.process_with_report(
+                raw_audio,
+                dna,
+                process_params,
+                budget_ms=remaining_budget_ms(budget_ms, started_at),
+            )
+            return RenderEntry(result.audio, result.report), _cacheable(result.report)
+
+        if not use_cache:
+            return _render()[0].audio
+
+        entry, tier = cache.get_or_render(
+            self.render_key(text, dna, tts_provider, process_params), _render
+        )
+        if tier != "miss":
+            self._remember_result(
+                ProcessResult(audio=entry.audio, report=entry.report, params=process_params)
+            )
+        self._latest_result().report[RENDER_CACHE_PARAM] = {
+            **cache.stats(),
+            "hit": tier != "miss",
+            "tier": tier,
+        }
+        return entry.audio
+
+    def render_key(
+        self, text: str, dna: VoiceDNA, tts_provider: Any, params: Dict[str, Any]
+    ) -> str:
+        """Render-cache key for synthesizing ``text`` with this filter chain."""
+        return RenderCache.make_key(
+            source=f"text:{normalize_text(text)}",
+            voice=dna_state_digest(dna),
+            params=params_digest(params),
+            backend=provider_identity(tts_provider),
+            chain=[
+                f"{type(filter_obj).__module__}.{type(filter_obj).__qualname__}:"
+                f"{getattr(filter_obj, 'version', '1')}"
+                for filter_obj in self.filters
+            ],
+        )
 
     def get_filter_names(self) -> List[str]:
         return [filter_obj.name() for filter_obj in self.filters]
 
     def get_last_report(self) -> Dict[str, Any]:
         return self.last_report
+
+    def _remember_result(self, result: ProcessResult) -> None:
+        self._local.result = result
+        self._last_result = result
+
+    def _latest_result(self) -> ProcessResult:
+        return getattr(self._local, "result", None) or self._last_result
+
+
+class _StreamStage:
+    def __init__(self, filter_obj: IVoiceDNAFilter, lock):
+        self.filter_obj = filter_obj
+        self.name = filter_obj.name()
+        self.lock = lock
+        self.stream: FilterStream = FilterStream()
+        self.status = "ok"
+        self.error: str | None = None
+        self.seconds = 0.0
+
+    def fail(self, error: Exception) -> None:
+        logger.warning("Filter %s failed: %s", self.name, error)
+        self.status = "error"
+        self.error = str(error)
+        self.stream = FilterStream()
+
+    def process_block(self, samples: np.ndarray) -> np.ndarray:
+        started_at = time.perf_counter()
+        try:
+            with self.lock:
+                return self.stream.process_block(samples)
+        except Exception as error:
+            self.fail(error)
+            return samples
+        finally:
+            self.seconds += time.perf_counter() - started_at
+
+    def close(self) -> np.ndarray | None:
+        started_at = time.perf_counter()
+        try:
+            with self.lock:
+                return self.stream.close()
+        except Exception as error:
+            # Like process(), a failed filter passes its input through; a
+            # buffered filter still holds every block it was fed.
+            held = (
+                self.stream.release()
+                if isinstance(self.stream, _BufferedFilterStream)
+                else None
+            )
+            self.fail(error)
+            return held
+        finally:
+            self.seconds += time.perf_counter() - started_at
+
+    def report(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "name": self.name,
+            "status": self.status,
+            "duration_ms": round(self.seconds * 1000, 3),
+        }
+        if self.error is not None:
+            entry["error"] = self.error
+        return entry
+
+
+class _BufferedFilterStream(FilterStream):
+    """Runs a non-streaming filter once over everything it was fed."""
+
+    def __init__(
+        self,
+        filter_obj: IVoiceDNAFilter,
+        dna: VoiceDNA,
+        params: Dict[str, Any],
+        sample_rate: int,
+    ):
+        self.filter_obj = filter_obj
+        self.dna = dna
+        self.params = params
+        self.sample_rate = sample_rate
+        self.blocks: List[np.ndarray] = []
+
+    def process_block(self, samples: np.ndarray) -> np.ndarray:
+        self.blocks.append(samples)
+        return samples[:0]
+
+    def close(self) -> np.ndarray | None:
+        if not self.blocks:
+            return None
+        buffer = AudioBuffer(
+            samples=np.concatenate(self.blocks), sample_rate=self.sample_rate
+        )
+        if isinstance(
+            self.filter_obj, IAudioBufferFilter
+        ) and self.filter_obj.supports_buffer(self.params):
+            output = self.filter_obj.process_buffer(buffer, self.dna, self.params).samples
+        else:
+            processed = self.filter_obj.process(
+                buffer.to_bytes(), self.dna, self.params
+            )
+            output = AudioBuffer.from_bytes(processed).samples
+        self.blocks = []
+        return output
+
+    def release(self) -> np.ndarray | None:
+        """Hand back the held blocks unprocessed."""
+        blocks, self.blocks = self.blocks, []
+        return np.concatenate(blocks) if blocks else None
+
+
+def _pcm16_to_samples(data: bytes, channels: int) -> np.ndarray:
+    samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    return samples
+
+
+def _samples_to_pcm16(samples: np.ndarray) -> bytes:
+    return (
+        np.clip(np.round(samples * 32768.0), -32768, 32767).astype("<i2").tobytes()
+    )
+
+
+class BatchProcessPool(ProcessPoolExecutor):
+    """Spawned process pool whose workers hold a warm processor and ``dnas``.
+
+    Each worker builds its filter chain (and optionally warms the speaker
+    encoders) once at start-up and receives the DNA set once; items only
+    carry an index into it. Reuse one pool across several
+    :meth:`VoiceDNAProcessor.process_many` calls to keep workers warm.
+    """
+
+    def __init__(
+        self,
+        dnas: Sequence[VoiceDNA],
+        max_workers: int | None = None,
+        warm_encoders: bool = False,
+    ):
+        self.dnas = list(dnas)
+        super().__init__(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=([asdict(entry) for entry in self.dnas], warm_encoders),
+        )
+
+    def dna_index(self, dna: VoiceDNA) -> int:
+        for index, known in enumerate(self.dnas):
+            if known is dna or known == dna:
+                return index
+        raise ValueError(
+            f"VoiceDNA '{dna.voice_fingerprint_id}' was not loaded into this pool"
+        )
+
+
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_batch_worker(
+    dna_payloads: List[Dict[str, Any]], warm_encoders: bool = False
+) -> None:
+    processor = VoiceDNAProcessor()
+    processor._ensure_plugins_loaded()
+    if warm_encoders:
+        get_encoder_pool().warmup()
+    _WORKER_STATE["processor"] = processor
+    _WORKER_STATE["dnas"] = [VoiceDNA(**payload) for payload in dna_payloads]
+
+
+def _process_in_worker(
+    audio_bytes: bytes, dna_index: int, params: Dict[str, Any]
+) -> ProcessResult:
+    return _WORKER_STATE["processor"].process_with_report(
+        audio_bytes, _WORKER_STATE["dnas"][dna_index], params
+    )
+
+
+def _run_in_workers(
+    pool: BatchProcessPool,
+    audio_items: List[bytes],
+    dna_indices: List[int],
+    item_params: List[Dict[str, Any]],
+) -> List[ProcessResult]:
+    futures = [
+        pool.submit(_process_in_worker, audio, index, item_param)
+        for audio, index, item_param in zip(audio_items, dna_indices, item_params)
+    ]
+    return [_collect(future) for future in futures]
+
+
+def _align_dnas(
+    dna: VoiceDNA | Sequence[VoiceDNA], count: int
+) -> tuple[List[VoiceDNA], List[int]]:
+    if isinstance(dna, VoiceDNA):
+        return [dna], [0] * count
+    entries = list(dna)
+    if len(entries) != count:
+        raise ValueError(f"Expected {count} VoiceDNA entries, got {len(entries)}")
+    unique: List[VoiceDNA] = []
+    positions: Dict[int, int] = {}
+    indices: List[int] = []
+    for entry in entries:
+        if id(entry) not in positions:
+            positions[id(entry)] = len(unique)
+            unique.append(entry)
+        indices.append(positions[id(entry)])
+    return unique, indices
+
+
+def _align_params(
+    params: Dict | Sequence[Dict] | None, count: int
+) -> List[Dict[str, Any]]:
+    if params is None or isinstance(params, dict):
+        return [dict(params or {}) for _ in range(count)]
+    entries = list(params)
+    if len(entries) != count:
+        raise ValueError(f"Expected {count} params entries, got {len(entries)}")
+    return [dict(entry or {}) for entry in entries]
+
+
+def _collect(future: Future) -> ProcessResult:
+    try:
+        return future.result()
+    except Exception as error:
+        logger.warning("Batch item failed: %s", error)
+        return ProcessResult(report={"status": "error", "error": str(error)})
+
+
+def _batch_stats(
+    items: Sequence[bytes], results: Sequence[ProcessResult], wall_seconds: float
+) -> Dict[str, Any]:
+    audio_seconds = sum(_wav_duration_seconds(audio) for audio in items)
+    errors = sum(1 for result in results if result.report.get("status") == "error")
+    return {
+        "items": len(results),
+        "errors": errors,
+        "wall_seconds": round(wall_seconds, 4),
+        "items_per_second": round(len(results) / wall_seconds, 2)
+        if wall_seconds > 0
+        else 0.0,
+        "input_bytes": sum(len(audio) for audio in items),
+        "output_bytes": sum(len(result.audio) for result in results),
+        "audio_seconds": round(audio_seconds, 3),
+        "realtime_factor": round(audio_seconds / wall_seconds, 2)
+        if wall_seconds > 0
+        else 0.0,
+    }
+
+
+def _cacheable(report: Dict[str, Any]) -> bool:
+    budget = report.get("budget")
+    if budget and (budget["skipped"] or budget["degraded"]):
+        return False
+    return all(entry.get("status") == "ok" for entry in report.get("filters", []))
+
+
+def _audio_seconds(audio: bytes | AudioBuffer) -> float:
+    if isinstance(audio, AudioBuffer):
+        return audio.duration_seconds
+    return _wav_duration_seconds(audio)
+
+
+def _wav_duration_seconds(audio_bytes: bytes) -> float:
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wave_file:
+            rate = wave_file.getframerate()
+            return wave_file.getnframes() / rate if rate else 0.0
+    except (wave.Error, EOFError):
+        return 0.0
+
+
+def _params_report(process_params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "consistency_score": process_params.get(
+            "imprint_converter.consistency_score"
+        ),
+        "rvc_ready": bool(process_params.get("imprint_converter.rvc_ready", False)),
+        "rvc_mode": process_params.get("imprint_converter.rvc_mode", "disabled"),
+        "imprint_converter": {
+            "mode": process_params.get("imprint_converter.mode", "simple"),
+            "rvc_ready": bool(
+                process_params.get("imprint_converter.rvc_ready", False)
+            ),
+            "rvc_mode": process_params.get(
+                "imprint_converter.rvc_mode", "disabled"
+            ),
+            "consistency_score": process_params.get(
+                "imprint_converter.consistency_score"
+            ),
+            "consistency_corrected": bool(
+                process_params.get("imprint_converter.consistency_corrected", False)
+            ),
+            "watermark_applied": bool(
+                process_params.get("imprint_converter.watermark_applied", False)
+            ),
+            "consistency_rescore": process_params.get(
+                "imprint_converter.consistency_rescore"
+            ),
+            "consistency_windows": process_params.get(
+                "imprint_converter.consistency_windows"
+            ),
+            "identity_drift": process_params.get("imprint_converter.identity_drift"),
+            "rvc_note": process_params.get("imprint_converter.rvc_note"),
+        },
+        "plugin_import_ms": {
+            entry["name"]: entry["import_ms"]
+            for entry in get_plugin_registry().stats()
+            if entry["loaded"]
+        },
+        "embedding_cache": get_embedding_cache().stats(),
+    }
@@ -16,6 +16,9 @@ synthesize(text, preset, output_path=None) -> bytes
     Synthesize speech using the given preset.  Returns raw WAV bytes and
     optionally writes them to *output_path*.
 
+await synthesize_async(text, preset, output_path=None) -> bytes
+    Same as synthesize() without blocking the event loop.
+
 PRESET_REGISTRY : dict[str, dict]
     Read-only registry of built-in pilot presets.
 
@@ -56,6 +59,11 @@ try:
 except Exception:  # pragma: no cover
     _SimpleLocalTTSImpl = None  # type: ignore[assignment]
 
+try:
+    from voicedna.aio import AsyncProcessor as _AsyncProcessor  # type: ignore[import]
+except Exception:  # pragma: no cover
+    _AsyncProcessor = None  # type: ignore[assignment]
+
 
 logger = logging.getLogger("voicedna.openclaw_adapter")
 
@@ -198,6 +206,9 @@ class VoiceAdapter:
         else:
             self._tts = _SimpleLocalTTSImpl()
             self._processor = _VoiceDNAProcessor()
+        self._async: Any = None
+        # One DNA per preset so repeated lines hit the render cache.
+        self._dna_cache: Dict[str, Any] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -238,8 +249,7 @@ class VoiceAdapter:
                 "cannot synthesize audio."
             )
 
-        dna = _build_dna_for_preset(preset)
-        raw_audio = self._tts.synthesize(text)
+        dna = self._dna_for(preset)
 
         preset_cfg = PRESET_REGISTRY[preset]
         process_params: Dict[str, Any] = {
@@ -258,6 +268,7 @@ class VoiceAdapter:
             )
         except AttributeError:
             # Older VoiceDNAProcessor: use process() directly
+            raw_audio = self._tts.synthesize(text)
             processed = self._processor.process(raw_audio, dna, process_params)
 
         if output_path:
@@ -267,6 +278,57 @@ class VoiceAdapter:
 
         return processed
 
+    async def synthesize_async(
+        self,
+        text: str,
+        preset: str,
+        output_path: Optional[str] = None,
+    ) -> bytes:
+        """Async :meth:`synthesize`.
+
+        espeak-ng runs as an asyncio subprocess and filter work runs in an
+        executor, bounded by the adapter's :class:`voicedna.aio.AsyncProcessor`
+        concurrency limit.
+        """
+        if preset not in PRESET_REGISTRY:
+            raise ValueError(
+                f"Unknown preset '{preset}'. Choose from: {list(PRESET_REGISTRY)}"
+            )
+
+        if self._tts is None or self._processor is None or _AsyncProcessor is None:
+            raise RuntimeError(
+                "voice_dna/voicedna packages are not installed; "
+                "cannot synthesize audio."
+            )
+
+        if self._async is None:
+            self._async = _AsyncProcessor(processor=self._processor)
+        dna = self._dna_for(preset)
+        preset_cfg = PRESET_REGISTRY[preset]
+        process_params: Dict[str, Any] = {
+            "text": text,
+            "audio_format": "wav",
+            "base_model": f"openclaw_{preset}",
+            **preset_cfg.get("process_params", {}),
+        }
+        result = await self._async.synthesize_and_process(
+            text, dna, self._tts, process_params
+        )
+        processed = result.audio
+
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            Path(output_path).write_bytes(processed)
+            logger.info("Wrote %d bytes to %s", len(processed), output_path)
+
+        return processed
+
+    def _dna_for(self, preset: str) -> Any:
+        dna = self._dna_cache.get(preset)
+        if dna is None:
+            dna = self._dna_cache.setdefault(preset, _build_dna_for_preset(preset))
+        return dna
+
     # ------------------------------------------------------------------
     # Convenience helpers
     # ------------------------------------------------------------------
@@ -1,10 +1,21 @@
-from .base import IVoiceDNAFilter
+from .base import (
+    FilterStream,
+    IAudioBufferFilter,
+    IStreamingFilter,
+    IVoiceDNAFilter,
+)
 from .builtin import Base64PassThroughFilter, PromptTagFilter
 from .manager import PluginManager
+from .registry import PluginRegistry, get_plugin_registry
 
 __all__ = [
+    "FilterStream",
+    "IAudioBufferFilter",
+    "IStreamingFilter",
     "IVoiceDNAFilter",
     "PluginManager",
+    "PluginRegistry",
+    "get_plugin_registry",
     "Base64PassThroughFilter",
     "PromptTagFilter",
 ]
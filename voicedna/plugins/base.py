@@ -1,10 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List
+
+import numpy as np
 
 from voice_dna import VoiceDNA
 
+from ..audio import AudioBuffer
+
 
 class IVoiceDNAFilter(ABC):
+    # Set to True when process() keeps no per-call state on the instance and
+    # only writes to its ``params`` argument; otherwise VoiceDNAProcessor
+    # serialises calls to this filter.
+    thread_safe: bool = False
+    # Optional filters may be skipped when a call's latency budget cannot
+    # cover estimate_cost_ms(), even after degrade().
+    optional: bool = False
+    # Part of the render-cache key; bump when a change alters the output.
+    version: str = "1"
+
     @abstractmethod
     def name(self) -> str:
         pass
@@ -16,3 +30,70 @@ class IVoiceDNAFilter(ABC):
     @abstractmethod
     def process(self, audio_bytes: bytes, dna: VoiceDNA, params: Dict) -> bytes:
         pass
+
+    def estimate_cost_ms(self, params: Dict, audio_seconds: float) -> float:
+        return 0.0
+
+    def degrade(
+        self, params: Dict, remaining_ms: float, audio_seconds: float
+    ) -> List[str]:
+        """Switch ``params`` to cheaper settings; return the stages dropped."""
+        return []
+
+
+class IAudioBufferFilter(IVoiceDNAFilter):
+    """Filter that can work on a decoded :class:`AudioBuffer`.
+
+    ``VoiceDNAProcessor`` decodes once before the first buffer filter and
+    encodes once after the chain, calling ``process_buffer`` whenever
+    ``supports_buffer(params)`` is true. The bytes ``process`` method remains
+    the entry point for ``PluginManager`` and direct callers.
+    """
+
+    def supports_buffer(self, params: Dict) -> bool:
+        return True
+
+    @abstractmethod
+    def process_buffer(
+        self, buffer: AudioBuffer, dna: VoiceDNA, params: Dict
+    ) -> AudioBuffer:
+        pass
+
+    def process(self, audio_bytes: bytes, dna: VoiceDNA, params: Dict) -> bytes:
+        buffer = AudioBuffer.from_bytes(audio_bytes, params.get("audio_format", "wav"))
+        return self.process_buffer(buffer, dna, params).to_bytes()
+
+
+class FilterStream:
+    """State carried between blocks of one streamed utterance.
+
+    ``process_block`` receives float32 samples shaped like
+    ``AudioBuffer.samples`` and may return more or fewer frames than it was
+    given; ``close`` returns anything still held back. The base class passes
+    audio through unchanged.
+    """
+
+    def process_block(self, samples: np.ndarray) -> np.ndarray:
+        return samples
+
+    def close(self) -> np.ndarray | None:
+        return None
+
+
+class IStreamingFilter(IAudioBufferFilter):
+    """Buffer filter that can also run block by block.
+
+    ``VoiceDNAProcessor.process_stream`` calls ``open`` once per stream while
+    ``supports_stream(params)`` is true. All per-stream state belongs on the
+    returned :class:`FilterStream`, so one filter instance can serve many
+    concurrent streams.
+    """
+
+    def supports_stream(self, params: Dict) -> bool:
+        return self.supports_buffer(params)
+
+    @abstractmethod
+    def open(
+        self, dna: VoiceDNA, params: Dict, sample_rate: int, channels: int
+    ) -> FilterStream:
+        pass
@@ -3,10 +3,13 @@ from typing import Dict
 
 from voice_dna import VoiceDNA
 
-from .base import IVoiceDNAFilter
+from ..audio import AudioBuffer
+from .base import FilterStream, IStreamingFilter
 
 
-class PromptTagFilter(IVoiceDNAFilter):
+class PromptTagFilter(IStreamingFilter):
+    thread_safe = True
+
     def name(self) -> str:
         return "prompt_tag"
 
@@ -25,8 +28,23 @@ class PromptTagFilter(IVoiceDNAFilter):
         prefix = f"[VoiceDNA:{dna.get_recognition_id()}::{tag_value}]\n".encode("utf-8")
         return prefix + audio_bytes
 
+    def supports_buffer(self, params: Dict) -> bool:
+        return not params.get("prepend_style_tag", False)
+
+    def process_buffer(
+        self, buffer: AudioBuffer, dna: VoiceDNA, params: Dict
+    ) -> AudioBuffer:
+        return buffer
+
+    def open(
+        self, dna: VoiceDNA, params: Dict, sample_rate: int, channels: int
+    ) -> FilterStream:
+        return FilterStream()
+
+
+class Base64PassThroughFilter(IStreamingFilter):
+    thread_safe = True
 
-class Base64PassThroughFilter(IVoiceDNAFilter):
     def name(self) -> str:
         return "base64_passthrough"
 
@@ -39,3 +57,16 @@ class Base64PassThroughFilter(IVoiceDNAFilter):
 
         encoded = base64.b64encode(audio_bytes)
         return base64.b64decode(encoded)
+
+    def supports_buffer(self, params: Dict) -> bool:
+        return not params.get("round_trip_base64", False)
+
+    def process_buffer(
+        self, buffer: AudioBuffer, dna: VoiceDNA, params: Dict
+    ) -> AudioBuffer:
+        return buffer
+
+    def open(
+        self, dna: VoiceDNA, params: Dict, sample_rate: int, channels: int
+    ) -> FilterStream:
+        return FilterStream()
@@ -1,9 +1,9 @@
-from importlib import metadata
 from typing import Dict, List, Tuple
 
 from voice_dna import VoiceDNA
 
 from .base import IVoiceDNAFilter
+from .registry import get_plugin_registry
 
 
 class PluginManager:
@@ -20,21 +20,17 @@ class PluginManager:
         loaded: List[str] = []
         failed: List[str] = []
 
-        try:
-            discovered = metadata.entry_points(group=group)
-        except TypeError:
-            discovered = metadata.entry_points().select(group=group)
-
-        for entrypoint in discovered:
+        registry = get_plugin_registry()
+        for spec in registry.specs(group):
             try:
-                plugin_factory = entrypoint.load()
+                plugin_factory = registry.load(spec)
                 plugin = (
                     plugin_factory() if callable(plugin_factory) else plugin_factory
                 )
                 self.register(plugin)
-                loaded.append(entrypoint.name)
+                loaded.append(spec.name)
             except Exception:
-                failed.append(entrypoint.name)
+                failed.append(spec.name)
 
         return loaded, failed
 
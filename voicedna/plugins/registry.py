@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Any, Dict, List, Tuple
+
+
+logger = logging.getLogger("VoiceDNA")
+
+PLUGIN_GROUPS = ("voicedna.filters", "voicedna.plugins")
+
+
+@dataclass
+class PluginSpec:
+    group: str
+    name: str
+    value: str
+    entry_point: Any
+    factory: Any = None
+    import_seconds: float | None = None
+    error: str | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.factory is not None
+
+
+class PluginRegistry:
+    """Process-wide cache of entry-point plugin discovery and imports.
+
+    Entry points are scanned once per group and rescanned only when the
+    install environment changes (the mtimes of the site-packages directories
+    on ``sys.path``, which move whenever a distribution is installed or
+    removed). Plugin modules are imported on first :meth:`load` and the
+    import time of each plugin is recorded for :meth:`stats`.
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, List[PluginSpec]] = {}
+        self._environment: Tuple[Tuple[str, int], ...] | None = None
+        self._lock = threading.RLock()
+        self.discoveries = 0
+
+    def specs(self, group: str) -> List[PluginSpec]:
+        with self._lock:
+            environment = _environment_key()
+            if environment != self._environment:
+                self._specs.clear()
+                self._environment = environment
+            if group not in self._specs:
+                self._specs[group] = self._discover(group)
+            return list(self._specs[group])
+
+    def load(self, spec: PluginSpec) -> Any:
+        with self._lock:
+            if spec.loaded:
+                return spec.factory
+            if spec.error is not None:
+                raise ImportError(spec.error)
+
+            started_at = time.perf_counter()
+            try:
+                spec.factory = spec.entry_point.load()
+            except Exception as error:
+                spec.error = f"{type(error).__name__}: {error}"
+                raise
+            finally:
+                spec.import_seconds = time.perf_counter() - started_at
+            if spec.import_seconds > 0.25:
+                logger.info(
+                    "Plugin %s (%s) took %.2fs to import",
+                    spec.name,
+                    spec.value,
+                    spec.import_seconds,
+                )
+            return spec.factory
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._specs.clear()
+            self._environment = None
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "group": spec.group,
+                    "name": spec.name,
+                    "value": spec.value,
+                    "loaded": spec.loaded,
+                    "import_ms": None
+                    if spec.import_seconds is None
+                    else round(spec.import_seconds * 1000, 3),
+                    "error": spec.error,
+                }
+                for specs in self._specs.values()
+                for spec in specs
+            ]
+
+    def _discover(self, group: str) -> List[PluginSpec]:
+        self.discoveries += 1
+        try:
+            discovered = metadata.entry_points(group=group)
+        except TypeError:
+            discovered = metadata.entry_points().select(group=group)
+        return [
+            PluginSpec(
+                group=group,
+                name=entrypoint.name,
+                value=entrypoint.value,
+                entry_point=entrypoint,
+            )
+            for entrypoint in discovered
+        ]
+
+
+def _environment_key() -> Tuple[Tuple[str, int], ...]:
+    key = []
+    for entry in sys.path:
+        if not entry.rstrip(os.sep).endswith(("site-packages", "dist-packages")):
+            continue
+        try:
+            key.append((entry, os.stat(entry).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(key)
+
+
+PLUGIN_REGISTRY = PluginRegistry()
+
+
+def get_plugin_registry() -> PluginRegistry:
+    return PLUGIN_REGISTRY
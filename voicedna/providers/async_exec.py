@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Sequence
+
+
+async def run_command_async(
+    command: Sequence[str], input_text: str | None = None
+) -> tuple[int, str]:
+    """Run ``command`` without blocking the event loop.
+
+    Returns ``(returncode, stderr)``. If the awaiting task is cancelled the
+    child process is killed and reaped before the cancellation propagates.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE
+        if input_text is not None
+        else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await process.communicate(
+            None if input_text is None else input_text.encode("utf-8")
+        )
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+        raise
+    return process.returncode, (stderr or b"").decode("utf-8", errors="replace")
@@ -6,6 +6,8 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+from .async_exec import run_command_async
+
 
 def piper_natural_message() -> str:
     return "Piper natural voice"
@@ -60,6 +62,43 @@ class PiperTTS:
         if not text or not text.strip():
             raise ValueError("Text for Piper synthesis must not be empty")
 
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
+            output_wav = Path(handle.name)
+
+        try:
+            completed = subprocess.run(
+                self._command(text, output_wav),
+                input=text,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+            )
+            if completed.returncode != 0:
+                stderr = (completed.stderr or "").strip()
+                raise RuntimeError(stderr or "piper synthesis failed")
+            return output_wav.read_bytes()
+        finally:
+            output_wav.unlink(missing_ok=True)
+
+    async def synthesize_async(self, text: str, sample_rate: int = 22050) -> bytes:
+        if not text or not text.strip():
+            raise ValueError("Text for Piper synthesis must not be empty")
+
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
+            output_wav = Path(handle.name)
+
+        try:
+            returncode, stderr = await run_command_async(
+                self._command(text, output_wav), input_text=text
+            )
+            if returncode != 0:
+                raise RuntimeError(stderr.strip() or "piper synthesis failed")
+            return output_wav.read_bytes()
+        finally:
+            output_wav.unlink(missing_ok=True)
+
+    def _command(self, text: str, output_wav: Path) -> list[str]:
         resolved_length_scale, resolved_noise_scale, resolved_noise_w = (
             _resolve_prosody_for_text(
                 text=text,
@@ -69,9 +108,6 @@ class PiperTTS:
             )
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
-            output_wav = Path(handle.name)
-
         command = [
             self.executable,
             "--model",
@@ -91,22 +127,7 @@ class PiperTTS:
                 f"{resolved_noise_w:.3f}",
             ]
         )
-
-        try:
-            completed = subprocess.run(
-                command,
-                input=text,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False,
-            )
-            if completed.returncode != 0:
-                stderr = (completed.stderr or "").strip()
-                raise RuntimeError(stderr or "piper synthesis failed")
-            return output_wav.read_bytes()
-        finally:
-            output_wav.unlink(missing_ok=True)
+        return command
 
 
 def _candidate_model_dirs() -> list[Path]:
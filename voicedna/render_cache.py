@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import struct
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from .embedding_cache import _file_size, default_cache_root
+
+RENDER_CACHE_VERSION = "render-v1"
+RENDER_CACHE_PARAM = "render_cache"
+
+# Params that never change the rendered audio (or are keyed separately).
+VOLATILE_PARAMS = frozenset({"text", "latency_budget_ms", RENDER_CACHE_PARAM})
+
+_HEADER = struct.Struct("<I")
+
+
+@dataclass
+class RenderEntry:
+    audio: bytes
+    report: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.audio)
+
+    def copy(self) -> "RenderEntry":
+        """Share the audio bytes but give the caller its own report."""
+        return RenderEntry(audio=self.audio, report=copy.deepcopy(self.report))
+
+
+def normalize_text(text: str) -> str:
+    """NFC-normalise and collapse whitespace; case and punctuation are kept."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def dna_state_digest(dna: Any) -> str:
+    """Digest of everything about ``dna`` that can change its rendering."""
+    state = asdict(dna)
+    state["current_age"] = round(dna.get_current_age(), 6)
+    return _digest(state)
+
+
+def params_digest(params: Dict[str, Any] | None) -> str:
+    return _digest(
+        {
+            key: value
+            for key, value in (params or {}).items()
+            if key not in VOLATILE_PARAMS
+        }
+    )
+
+
+def provider_identity(tts_provider: Any) -> str:
+    """Class plus primitive configuration (model paths, speaker, prosody).
+
+    Providers should keep counters and other per-call state out of public
+    primitive attributes, or every call would produce a new key.
+    """
+    provider_type = type(tts_provider)
+    settings = {
+        key: value
+        for key, value in sorted(vars(tts_provider).items())
+        if not key.startswith("_")
+        and isinstance(value, (str, int, float, bool, type(None)))
+    }
+    return f"{provider_type.__module__}.{provider_type.__qualname__}:{_digest(settings)}"
+
+
+class RenderCache:
+    """Two-tier cache of fully rendered utterances with single-flight fills.
+
+    Entries hold the processed audio and its processor report. The memory
+    tier is an LRU bounded by entry count and total bytes; the disk tier
+    stores one ``.vdr`` file per entry (0600, length-prefixed JSON report
+    followed by the audio) under ``<cache root>/renders`` and evicts the
+    oldest files once ``max_disk_bytes`` is exceeded. Concurrent requests for
+    the same key wait for the first one to render instead of rendering again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir: str | Path | None = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+        enabled: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self.enabled = enabled
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, RenderEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: int | None = None
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_env() -> "RenderCache":
+        mode = os.getenv("VOICEDNA_RENDER_CACHE", "disk").strip().lower()
+        return RenderCache(
+            max_entries=int(os.getenv("VOICEDNA_RENDER_CACHE_SIZE", "512")),
+            max_memory_bytes=int(
+                os.getenv("VOICEDNA_RENDER_CACHE_MEMORY_BYTES", str(64 << 20))
+            ),
+            disk_dir=default_cache_root() / "renders" if mode == "disk" else None,
+            max_disk_bytes=int(
+                os.getenv("VOICEDNA_RENDER_CACHE_DISK_BYTES", str(512 << 20))
+            ),
+            enabled=mode not in {"off", "0", "false", "no"},
+        )
+
+    @staticmethod
+    def make_key(
+        source: str, voice: str, params: str, backend: str, chain: Iterable[str]
+    ) -> str:
+        """``source`` is ``"text:<normalized text>"`` or ``"audio:<content hash>"``."""
+        material = json.dumps(
+            [RENDER_CACHE_VERSION, source, voice, params, backend, list(chain)]
+        ).encode("utf-8")
+        return hashlib.blake2b(material, digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Tuple[RenderEntry | None, str]:
+        """Return ``(entry, tier)``; ``tier`` is ``memory``, ``disk`` or ``miss``."""
+        if not self.enabled:
+            return None, "miss"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry.copy(), "memory"
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None, "miss"
+            self.disk_hits += 1
+        self._remember(key, entry)
+        return entry.copy(), "disk"
+
+    def put(self, key: str, audio: bytes, report: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        entry = RenderEntry(audio=bytes(audio), report=_storable(report))
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    def claim(self, key: str) -> Tuple[Future, bool]:
+        """Join or start the in-flight render for ``key``.
+
+        Returns ``(future, leader)``. The leader must call :meth:`release`
+        when done; followers wait on the future (``asyncio.wrap_future`` works
+        for coroutines).
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None and key in self._entries:
+                # Filled between the caller's miss and this claim.
+                future = Future()
+                future.set_result(self._entries[key])
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def release(
+        self,
+        key: str,
+        future: Future,
+        entry: RenderEntry | None = None,
+        error: BaseException | None = None,
+        cacheable: bool = True,
+    ) -> None:
+        snapshot = None
+        if entry is not None:
+            snapshot = RenderEntry(audio=bytes(entry.audio), report=_storable(entry.report))
+            if cacheable and self.enabled:
+                self._remember(key, snapshot)
+                self._write_disk(key, snapshot)
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(snapshot)
+
+    def get_or_render(
+        self, key: str, render: Callable[[], Tuple[RenderEntry, bool]]
+    ) -> Tuple[RenderEntry, str]:
+        """Serve ``key`` from cache or render it once for all concurrent callers.
+
+        ``render`` returns ``(entry, cacheable)``. The second value of the
+        result is ``memory``, ``disk``, ``coalesced`` or ``miss``.
+        """
+        entry, tier = self.get(key)
+        if entry is not None:
+            return entry, tier
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result().copy(), "coalesced"
+        try:
+            entry, cacheable = render()
+        except BaseException as error:
+            self.release(key, future, error=error)
+            raise
+        self.release(key, future, entry=entry, cacheable=cacheable)
+        return entry, "miss"
+
+    def clear(self, disk: bool = False) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.coalesced = 0
+            self.misses = 0
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.rglob("*.vdr"):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            # Coalesced requests missed the cache but did not render.
+            hits = self.memory_hits + self.disk_hits + self.coalesced
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "coalesced": self.coalesced,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _remember(self, key: str, entry: RenderEntry) -> None:
+        if entry.nbytes > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous.nbytes
+            self._entries[key] = entry
+            self._memory_bytes += entry.nbytes
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self._memory_bytes > self.max_memory_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted.nbytes
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.vdr"
+
+    def _read_disk(self, key: str) -> RenderEntry | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            payload = path.read_bytes()
+            (header_length,) = _HEADER.unpack_from(payload)
+            header_end = _HEADER.size + header_length
+            report = json.loads(payload[_HEADER.size : header_end].decode("utf-8"))
+            os.utime(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        return RenderEntry(audio=payload[header_end:], report=report)
+
+    def _write_disk(self, key: str, entry: RenderEntry) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        header = json.dumps(entry.report, default=str).encode("utf-8")
+        payload = _HEADER.pack(len(header)) + header + entry.audio
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor = os.open(
+                temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(descriptor, "wb") as file_handle:
+                file_handle.write(payload)
+            replaced = _file_size(path)
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(payload) - replaced
+            over_limit = self._current_disk_bytes() > self.max_disk_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def _current_disk_bytes(self) -> int:
+        if self._disk_bytes is None:
+            total = 0
+            if self.disk_dir is not None and self.disk_dir.exists():
+                total = sum(
+                    path.stat().st_size for path in self.disk_dir.rglob("*.vdr")
+                )
+            self._disk_bytes = total
+        return self._disk_bytes
+
+    def _evict_disk(self) -> None:
+        if self.disk_dir is None:
+            return
+        files = []
+        for path in self.disk_dir.rglob("*.vdr"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_disk_bytes * 0.9)
+        for _, size, path in files:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+
+def _digest(value: Any) -> str:
+    material = json.dumps(value, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+
+def _storable(report: Dict[str, Any]) -> Dict[str, Any]:
+    # Process-wide counters would be stale when the entry is served later.
+    stored = {
+        key: value
+        for key, value in report.items()
+        if key not in {"embedding_cache", "plugin_import_ms", RENDER_CACHE_PARAM}
+    }
+    return json.loads(json.dumps(stored, default=str))
+
+
+RENDER_CACHE = RenderCache.from_env()
+
+
+def get_render_cache() -> RenderCache:
+    return RENDER_CACHE
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+
+SearchHit = Tuple[str, float]
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    array = np.asarray(matrix, dtype=np.float32)
+    if array.ndim == 1:
+        array = array[None, :]
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return array / norms
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    if scores.size == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64)
+    k = min(k, scores.size)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _kmeans(
+    data: np.ndarray,
+    clusters: int,
+    iterations: int,
+    seed: int,
+    spherical: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    clusters = max(1, min(clusters, data.shape[0]))
+    centroids = data[rng.choice(data.shape[0], clusters, replace=False)].copy()
+    assignments = np.zeros(data.shape[0], dtype=np.int32)
+    data_sq = np.einsum("ij,ij->i", data, data)
+
+    for _ in range(max(1, iterations)):
+        if spherical:
+            assignments = np.argmax(data @ centroids.T, axis=1).astype(np.int32)
+        else:
+            distances = (
+                data_sq[:, None]
+                - 2.0 * (data @ centroids.T)
+                + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+            )
+            assignments = np.argmin(distances, axis=1).astype(np.int32)
+
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, data)
+        counts = np.bincount(assignments, minlength=clusters).astype(np.float32)
+        empty = counts == 0
+        counts[empty] = 1.0
+        updated = sums / counts[:, None]
+        if empty.any():
+            updated[empty] = data[rng.choice(data.shape[0], int(empty.sum()))]
+        centroids = normalize_rows(updated) if spherical else updated
+
+    return centroids.astype(np.float32), assignments
+
+
+class SpeakerIndex:
+    """Nearest-neighbour index over VoiceDNA ``core_embedding`` vectors.
+
+    Vectors are stored L2-normalised in one contiguous float32 matrix, so a
+    query is a single matrix-vector product (cosine similarity) plus a
+    partial sort. Removal is a tombstone that is compacted lazily.
+
+    Calling :meth:`train` adds an IVF/PQ layer for large sets: a spherical
+    k-means coarse quantizer picks ``nprobe`` lists, candidates are scored
+    with product-quantized residuals, and the best ``rerank`` are re-scored
+    exactly against the stored vectors.
+    """
+
+    def __init__(self, dims: int = 256, nprobe: int = 8, rerank: int = 64):
+        self.dims = dims
+        self.nprobe = nprobe
+        self.rerank = rerank
+        self._vectors = np.zeros((0, dims), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: List[str] = []
+        self._rows: dict[str, int] = {}
+        self._size = 0
+        self._centroids: np.ndarray | None = None
+        self._codebooks: np.ndarray | None = None
+        self._codes = np.zeros((0, 0), dtype=np.uint8)
+        self._assignments = np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, voice_id: object) -> bool:
+        return voice_id in self._rows
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None and self._codebooks is not None
+
+    def ids(self) -> List[str]:
+        return [self._ids[row] for row in sorted(self._rows.values())]
+
+    def vector(self, voice_id: str) -> np.ndarray:
+        return np.array(self._vectors[self._rows[voice_id]])
+
+    def add(self, voice_id: str, embedding: Sequence[float]) -> None:
+        self.add_many([voice_id], [embedding])
+
+    def add_many(
+        self, voice_ids: Sequence[str], embeddings: Iterable[Sequence[float]]
+    ) -> None:
+        ids = list(voice_ids)
+        matrix = normalize_rows(np.asarray(list(embeddings), dtype=np.float32))
+        if matrix.shape[0] != len(ids):
+            raise ValueError("voice_ids and embeddings must have the same length")
+        if matrix.shape[1] != self.dims:
+            raise ValueError(
+                f"Embedding has {matrix.shape[1]} dims; index expects {self.dims}"
+            )
+        last = {voice_id: offset for offset, voice_id in enumerate(ids)}
+        if len(last) < len(ids):
+            keep = sorted(last.values())
+            ids = [ids[offset] for offset in keep]
+            matrix = matrix[keep]
+
+        for voice_id in ids:
+            if voice_id in self._rows:
+                self.remove(voice_id)
+
+        self._reserve(self._size + len(ids))
+        start = self._size
+        stop = start + len(ids)
+        self._vectors[start:stop] = matrix
+        self._alive[start:stop] = True
+        for offset, voice_id in enumerate(ids):
+            self._rows[voice_id] = start + offset
+        self._ids.extend(ids)
+        self._size = stop
+
+        if self.trained:
+            assignments, codes = self._encode(matrix)
+            self._assignments[start:stop] = assignments
+            self._codes[start:stop] = codes
+
+    def remove(self, voice_id: str) -> bool:
+        row = self._rows.pop(voice_id, None)
+        if row is None:
+            return False
+        self._writable()
+        self._alive[row] = False
+        if self._size and (self._size - len(self._rows)) > self._size // 4:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        keep = np.flatnonzero(self._alive[: self._size])
+        self._vectors = np.ascontiguousarray(self._vectors[keep])
+        self._alive = np.ones(keep.size, dtype=bool)
+        self._ids = [self._ids[row] for row in keep]
+        self._rows = {voice_id: row for row, voice_id in enumerate(self._ids)}
+        self._size = keep.size
+        if self.trained:
+            self._codes = np.ascontiguousarray(self._codes[keep])
+            self._assignments = np.ascontiguousarray(self._assignments[keep])
+
+    def search(
+        self, query: Sequence[float], k: int = 5, exact: bool = False
+    ) -> List[SearchHit]:
+        return self.search_many([query], k=k, exact=exact)[0]
+
+    def search_many(
+        self,
+        queries: Iterable[Sequence[float]],
+        k: int = 5,
+        exact: bool = False,
+    ) -> List[List[SearchHit]]:
+        query_matrix = normalize_rows(np.asarray(list(queries), dtype=np.float32))
+        if not self._rows:
+            return [[] for _ in range(query_matrix.shape[0])]
+
+        if self.trained and not exact:
+            return [self._search_ivf(query, k) for query in query_matrix]
+
+        scores = query_matrix @ self._vectors[: self._size].T
+        scores[:, ~self._alive[: self._size]] = -np.inf
+        results: List[List[SearchHit]] = []
+        for row_scores in scores:
+            top = top_k_indices(row_scores, min(k, len(self._rows)))
+            results.append([(self._ids[row], float(row_scores[row])) for row in top])
+        return results
+
+    def identify(self, audio_bytes: bytes, k: int = 5, engine=None) -> List[SearchHit]:
+        if engine is None:
+            from .consistency import VoiceConsistencyEngine
+
+            engine = VoiceConsistencyEngine()
+        embedding = engine.extract_embedding_from_audio(audio_bytes, dims=self.dims)
+        return self.search(embedding, k=k)
+
+    def find_duplicates(
+        self, threshold: float = 0.98, block_size: int = 4096
+    ) -> List[Tuple[str, str, float]]:
+        rows = np.flatnonzero(self._alive[: self._size])
+        vectors = self._vectors[rows]
+        pairs: List[Tuple[str, str, float]] = []
+        for start in range(0, rows.size, block_size):
+            block = vectors[start : start + block_size] @ vectors.T
+            left, right = np.nonzero(block >= threshold)
+            for block_row, column in zip(left, right):
+                row = start + block_row
+                if column <= row:
+                    continue
+                pairs.append(
+                    (
+                        self._ids[rows[row]],
+                        self._ids[rows[column]],
+                        float(block[block_row, column]),
+                    )
+                )
+        pairs.sort(key=lambda pair: -pair[2])
+        return pairs
+
+    def train(
+        self,
+        lists: int | None = None,
+        subspaces: int = 16,
+        iterations: int = 12,
+        seed: int = 0,
+    ) -> None:
+        self.compact()
+        if self._size == 0:
+            raise ValueError("Cannot train an empty SpeakerIndex")
+        if self.dims % subspaces:
+            raise ValueError("dims must be divisible by subspaces")
+
+        data = np.asarray(self._vectors[: self._size])
+        resolved_lists = lists or max(1, int(np.sqrt(self._size)))
+        centroids, assignments = _kmeans(
+            data, resolved_lists, iterations, seed, spherical=True
+        )
+        residuals = data - centroids[assignments]
+
+        sub_dims = self.dims // subspaces
+        codewords = min(256, self._size)
+        codebooks = np.zeros((subspaces, codewords, sub_dims), dtype=np.float32)
+        codes = np.zeros((self._size, subspaces), dtype=np.uint8)
+        for subspace in range(subspaces):
+            block = np.ascontiguousarray(
+                residuals[:, subspace * sub_dims : (subspace + 1) * sub_dims]
+            )
+            codebook, block_codes = _kmeans(
+                block, codewords, iterations, seed + subspace + 1, spherical=False
+            )
+            codebooks[subspace, : codebook.shape[0]] = codebook
+            codes[:, subspace] = block_codes
+
+        self._centroids = centroids
+        self._codebooks = codebooks
+        self._codes = codes
+        self._assignments = assignments
+
+    def save(self, directory: str | Path) -> Path:
+        self.compact()
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        np.save(target / "vectors.npy", self._vectors[: self._size])
+        meta = {
+            "version": 1,
+            "dims": self.dims,
+            "nprobe": self.nprobe,
+            "rerank": self.rerank,
+            "ids": self._ids,
+            "trained": self.trained,
+        }
+        if self.trained:
+            np.save(target / "centroids.npy", self._centroids)
+            np.save(target / "codebooks.npy", self._codebooks)
+            np.save(target / "codes.npy", self._codes)
+            np.save(target / "assignments.npy", self._assignments)
+        (target / "index.json").write_text(json.dumps(meta), encoding="utf-8")
+        return target
+
+    @staticmethod
+    def load(directory: str | Path, mmap: bool = True) -> "SpeakerIndex":
+        source = Path(directory)
+        meta = json.loads((source / "index.json").read_text(encoding="utf-8"))
+        mode = "r" if mmap else None
+        index = SpeakerIndex(
+            dims=int(meta["dims"]),
+            nprobe=int(meta.get("nprobe", 8)),
+            rerank=int(meta.get("rerank", 64)),
+        )
+        index._vectors = np.load(source / "vectors.npy", mmap_mode=mode)
+        index._ids = list(meta["ids"])
+        index._size = len(index._ids)
+        index._alive = np.ones(index._size, dtype=bool)
+        index._rows = {voice_id: row for row, voice_id in enumerate(index._ids)}
+        if meta.get("trained"):
+            index._centroids = np.load(source / "centroids.npy")
+            index._codebooks = np.load(source / "codebooks.npy")
+            index._codes = np.load(source / "codes.npy", mmap_mode=mode)
+            index._assignments = np.load(source / "assignments.npy", mmap_mode=mode)
+        return index
+
+    @staticmethod
+    def from_store(store, dims: int = 256) -> "SpeakerIndex":
+        index = SpeakerIndex(dims=dims)
+        voices = [store.get(name) for name in store.names()]
+        if voices:
+            index.add_many(
+                [dna.voice_fingerprint_id for dna in voices],
+                [dna.core_embedding for dna in voices],
+            )
+        return index
+
+    def _search_ivf(self, query: np.ndarray, k: int) -> List[SearchHit]:
+        assert self._centroids is not None and self._codebooks is not None
+        coarse = self._centroids @ query
+        probes = top_k_indices(coarse, self.nprobe)
+        assignments = self._assignments[: self._size]
+        candidates = np.flatnonzero(
+            np.isin(assignments, probes) & self._alive[: self._size]
+        )
+        if candidates.size == 0:
+            return []
+
+        subspaces, _, sub_dims = self._codebooks.shape
+        lookup = np.einsum(
+            "mkd,md->mk", self._codebooks, query.reshape(subspaces, sub_dims)
+        )
+        codes = np.asarray(self._codes[candidates], dtype=np.intp)
+        approx = coarse[assignments[candidates]] + lookup[
+            np.arange(subspaces)[None, :], codes
+        ].sum(axis=1)
+
+        shortlist = candidates[top_k_indices(approx, max(k, self.rerank))]
+        exact_scores = self._vectors[shortlist] @ query
+        order = top_k_indices(exact_scores, k)
+        return [
+            (self._ids[shortlist[position]], float(exact_scores[position]))
+            for position in order
+        ]
+
+    def _encode(self, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        assert self._centroids is not None and self._codebooks is not None
+        assignments = np.argmax(matrix @ self._centroids.T, axis=1).astype(np.int32)
+        residuals = matrix - self._centroids[assignments]
+        subspaces, _, sub_dims = self._codebooks.shape
+        codes = np.zeros((matrix.shape[0], subspaces), dtype=np.uint8)
+        for subspace in range(subspaces):
+            block = residuals[:, subspace * sub_dims : (subspace + 1) * sub_dims]
+            codebook = self._codebooks[subspace]
+            distances = (
+                np.einsum("ij,ij->i", block, block)[:, None]
+                - 2.0 * (block @ codebook.T)
+                + np.einsum("ij,ij->i", codebook, codebook)[None, :]
+            )
+            codes[:, subspace] = np.argmin(distances, axis=1)
+        return assignments, codes
+
+    def _reserve(self, rows: int) -> None:
+        self._writable()
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2, 64)
+        vectors = np.zeros((new_capacity, self.dims), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]
+        self._vectors, self._alive = vectors, alive
+        if self.trained:
+            codes = np.zeros((new_capacity, self._codes.shape[1]), dtype=np.uint8)
+            codes[: self._size] = self._codes[: self._size]
+            assignments = np.zeros(new_capacity, dtype=np.int32)
+            assignments[: self._size] = self._assignments[: self._size]
+            self._codes, self._assignments = codes, assignments
+
+    def _writable(self) -> None:
+        if isinstance(self._vectors, np.memmap):
+            self._vectors = np.array(self._vectors)
+        if isinstance(self._codes, np.memmap):
+            self._codes = np.array(self._codes)
+        if isinstance(self._assignments, np.memmap):
+            self._assignments = np.array(self._assignments)
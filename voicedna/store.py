@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from voice_dna import (
+    BINARY_HEADER,
+    BINARY_SUFFIX,
+    FERNET_TOKEN_PREFIX,
+    VoiceDNA,
+    is_binary_container,
+)
+
+
+VOICE_SUFFIXES = (BINARY_SUFFIX, ".voicedna.enc", ".voicedna.json", ".json")
+# Loads of the same voice are serialized on one of this many locks, so the
+# lock set stays fixed however many voices come and go.
+LOAD_LOCK_STRIPES = 64
+
+PasswordResolver = Callable[[str, Path], "str | None"]
+
+
+def voice_name_for_path(path: Path) -> str | None:
+    for suffix in VOICE_SUFFIXES:
+        if path.name.endswith(suffix):
+            return path.name[: -len(suffix)]
+    return None
+
+
+def estimate_dna_bytes(dna: VoiceDNA) -> int:
+    total = sys.getsizeof(dna) + sys.getsizeof(dna.core_embedding)
+    total += sum(sys.getsizeof(value) for value in dna.core_embedding)
+    total += sys.getsizeof(dna.unique_traits)
+    for field in dataclasses.fields(dna):
+        value = getattr(dna, field.name)
+        if isinstance(value, str):
+            total += sys.getsizeof(value)
+    total += sum(sys.getsizeof(trait) for trait in dna.unique_traits)
+    return total
+
+
+@dataclass
+class _StoreEntry:
+    path: Path
+    mtime_ns: int
+    size: int
+    dna: VoiceDNA
+    nbytes: int
+
+
+class VoiceDNAStore:
+    """Directory-backed registry of many VoiceDNA identities.
+
+    Files are indexed by voice name (file name without its VoiceDNA suffix)
+    and only decrypted on first access. Live identities are kept in a bounded
+    LRU (entry count and estimated bytes); an entry is reloaded whenever the
+    underlying file's mtime or size changes.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = "voices",
+        password: str | None = None,
+        password_resolver: PasswordResolver | None = None,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        recursive: bool = False,
+    ):
+        self.directory = Path(directory)
+        self.password = password
+        self.password_resolver = password_resolver
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.recursive = recursive
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.evictions = 0
+        self._paths: Dict[str, Path] = {}
+        self._entries: "OrderedDict[str, _StoreEntry]" = OrderedDict()
+        self._fingerprints: Dict[str, str] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._load_locks = [threading.Lock() for _ in range(LOAD_LOCK_STRIPES)]
+        self.refresh()
+
+    def refresh(self) -> List[str]:
+        pattern = "**/*" if self.recursive else "*"
+        discovered: Dict[str, Path] = {}
+        if self.directory.exists():
+            for path in sorted(self.directory.glob(pattern)):
+                name = voice_name_for_path(path)
+                if name is None or not path.is_file():
+                    continue
+                current = discovered.get(name)
+                if current is None or _suffix_rank(path) < _suffix_rank(current):
+                    discovered[name] = path
+
+        with self._lock:
+            self._paths = discovered
+            for name in [name for name in self._entries if name not in discovered]:
+                self._evict(name)
+            return sorted(discovered)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._paths)
+
+    def path_for(self, name: str) -> Path:
+        with self._lock:
+            path = self._paths.get(name)
+        if path is None:
+            self.refresh()
+            with self._lock:
+                path = self._paths.get(name)
+        if path is None:
+            raise KeyError(f"Unknown VoiceDNA '{name}' in {self.directory}")
+        return path
+
+    def get(self, name: str, copy: bool = False) -> VoiceDNA:
+        path = self.path_for(name)
+        stat = path.stat()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and _is_current(entry, path, stat):
+                self._entries.move_to_end(name)
+                self.hits += 1
+                return _maybe_copy(entry.dna, copy)
+            load_lock = self._load_locks[hash(name) % len(self._load_locks)]
+
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is not None and _is_current(entry, path, stat):
+                    self._entries.move_to_end(name)
+                    self.hits += 1
+                    return _maybe_copy(entry.dna, copy)
+                if entry is not None:
+                    self.reloads += 1
+                    self._evict(name, count=False)
+                self.misses += 1
+
+            dna = self._load(name, path)
+            entry = _StoreEntry(
+                path=path,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                dna=dna,
+                nbytes=estimate_dna_bytes(dna),
+            )
+            with self._lock:
+                self._entries[name] = entry
+                self._bytes += entry.nbytes
+                self._fingerprints[dna.voice_fingerprint_id] = name
+                self._enforce_limits(keep=name)
+            return _maybe_copy(dna, copy)
+
+    def get_by_fingerprint(self, voice_fingerprint_id: str) -> VoiceDNA:
+        with self._lock:
+            name = self._fingerprints.get(voice_fingerprint_id)
+        if name is not None:
+            dna = self.get(name)
+            if dna.voice_fingerprint_id == voice_fingerprint_id:
+                return dna
+
+        for candidate in self.names():
+            with self._lock:
+                loaded = candidate in self._entries
+            if loaded:
+                continue
+            dna = self.get(candidate)
+            if dna.voice_fingerprint_id == voice_fingerprint_id:
+                return dna
+        raise KeyError(f"No VoiceDNA with fingerprint '{voice_fingerprint_id}'")
+
+    def invalidate(self, name: str | None = None) -> None:
+        with self._lock:
+            targets = list(self._entries) if name is None else [name]
+            for target in targets:
+                if target in self._entries:
+                    self._evict(target, count=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "indexed": len(self._paths),
+                "loaded": len(self._entries),
+                "loaded_bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, name: object) -> bool:
+        with self._lock:
+            return name in self._paths
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._paths)
+
+    def _load(self, name: str, path: Path) -> VoiceDNA:
+        if path.name.endswith(".json"):
+            return VoiceDNA.load(str(path))
+
+        with open(path, "rb") as file_handle:
+            # Enough for is_binary_container to look past the header and salt.
+            head = file_handle.read(BINARY_HEADER.size + 16 + len(FERNET_TOKEN_PREFIX))
+
+        password = self._resolve_password(name, path)
+        if is_binary_container(head):
+            return VoiceDNA.load_binary(str(path), password=password)
+        if not password:
+            raise ValueError(f"No password available for encrypted VoiceDNA '{name}'")
+        return VoiceDNA.load_encrypted(password=password, filepath=str(path))
+
+    def _resolve_password(self, name: str, path: Path) -> str | None:
+        if self.password_resolver is not None:
+            resolved = self.password_resolver(name, path)
+            if resolved:
+                return resolved
+        return self.password or os.getenv("VOICEDNA_PASSWORD") or None
+
+    def _enforce_limits(self, keep: str) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._evict(oldest)
+
+    def _evict(self, name: str, count: bool = True) -> None:
+        entry = self._entries.pop(name)
+        self._bytes -= entry.nbytes
+        if self._fingerprints.get(entry.dna.voice_fingerprint_id) == name:
+            del self._fingerprints[entry.dna.voice_fingerprint_id]
+        if count:
+            self.evictions += 1
+
+
+def _suffix_rank(path: Path) -> int:
+    for rank, suffix in enumerate(VOICE_SUFFIXES):
+        if path.name.endswith(suffix):
+            return rank
+    return len(VOICE_SUFFIXES)
+
+
+def _is_current(entry: _StoreEntry, path: Path, stat: os.stat_result) -> bool:
+    return (
+        entry.path == path
+        and entry.mtime_ns == stat.st_mtime_ns
+        and entry.size == stat.st_size
+    )
+
+
+def _maybe_copy(dna: VoiceDNA, copy: bool) -> VoiceDNA:
+    if not copy:
+        return dna
+    return dataclasses.replace(
+        dna,
+        core_embedding=list(dna.core_embedding),
+        unique_traits=list(dna.unique_traits),
+    )
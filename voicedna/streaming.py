@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+from .consistency import VoiceConsistencyEngine, _fit_embedding_dims
+from .embedding_cache import file_stat_hash, get_embedding_cache
+from .encoders import get_encoder_pool
+
+STREAMING_VERSION = "stream-v1"
+
+
+def iter_wav_windows(
+    path: str | Path, window_seconds: float = 3.0
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield ``(sample_rate, mono_window)`` pairs scaled to [-1, 1].
+
+    Frames are read ``window_seconds`` at a time, so memory stays bounded by a
+    single window regardless of the recording length.
+    """
+    with wave.open(str(path), "rb") as wave_file:
+        channels = wave_file.getnchannels()
+        sample_width = wave_file.getsampwidth()
+        sample_rate = wave_file.getframerate()
+        if sample_width != 2:
+            raise ValueError("Only 16-bit PCM WAV is supported for streaming extraction")
+
+        window_frames = max(1, int(window_seconds * sample_rate))
+        while True:
+            raw_frames = wave_file.readframes(window_frames)
+            if not raw_frames:
+                break
+            samples = np.frombuffer(raw_frames, dtype=np.int16).astype(np.float32)
+            if channels > 1:
+                samples = samples.reshape(-1, channels).mean(axis=1)
+            yield sample_rate, samples / 32768.0
+
+
+def wav_duration_seconds(path: str | Path) -> float:
+    with wave.open(str(path), "rb") as wave_file:
+        rate = wave_file.getframerate()
+        return wave_file.getnframes() / rate if rate else 0.0
+
+
+@dataclass
+class StreamingEmbeddingResult:
+    embedding: List[float]
+    backend: str
+    windows: int
+    skipped_windows: int
+    seconds_processed: float
+    converged: bool
+    cached: bool = False
+    history: List[float] = field(default_factory=list)
+
+
+class StreamingEmbeddingExtractor:
+    """Embed long WAV recordings window by window into a running centroid.
+
+    Each window is embedded with the pooled speaker encoder (or the numpy
+    extractor) and L2-normalised before it is folded into the centroid.
+    With ``early_stop`` enabled extraction ends once the centroid moves less
+    than ``1 - convergence`` (cosine) for ``patience`` consecutive windows.
+    Near-silent windows are skipped so pauses do not dilute the centroid.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 3.0,
+        min_window_seconds: float = 1.0,
+        early_stop: bool = True,
+        convergence: float = 0.999,
+        patience: int = 3,
+        min_windows: int = 4,
+        max_seconds: float | None = None,
+        silence_rms: float = 1e-3,
+        backend: str | None = None,
+        engine: VoiceConsistencyEngine | None = None,
+    ):
+        self.window_seconds = window_seconds
+        self.min_window_seconds = min_window_seconds
+        self.early_stop = early_stop
+        self.convergence = convergence
+        self.patience = patience
+        self.min_windows = min_windows
+        self.max_seconds = max_seconds
+        self.silence_rms = silence_rms
+        self.backend = backend
+        self.engine = engine or VoiceConsistencyEngine()
+
+    def extract(self, path: str | Path, dims: int = 256) -> StreamingEmbeddingResult:
+        cache = get_embedding_cache()
+        # Early stop may read only the start of the file, so the key must not
+        # hash its whole content.
+        content_hash = file_stat_hash(path) if cache.enabled else ""
+        last_error: Exception | None = None
+        for backend in self._candidate_backends():
+            cache_key = None
+            if cache.enabled:
+                cache_key = cache.make_key(
+                    content_hash,
+                    f"stream:{backend}",
+                    f"{self.engine.model_version(backend)}|{self._config_tag()}",
+                    dims,
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return StreamingEmbeddingResult(
+                        embedding=cached,
+                        backend=backend,
+                        windows=0,
+                        skipped_windows=0,
+                        seconds_processed=0.0,
+                        converged=True,
+                        cached=True,
+                    )
+            try:
+                result = self._extract_with(path, dims, backend)
+            except Exception as error:
+                last_error = error
+                continue
+            if cache_key is not None:
+                cache.put(cache_key, result.embedding, backend=backend)
+            return result
+        raise RuntimeError(f"No embedding backend could process {path}") from last_error
+
+    def _extract_with(
+        self, path: str | Path, dims: int, backend: str
+    ) -> StreamingEmbeddingResult:
+        centroid_sum = np.zeros(dims, dtype=np.float64)
+        centroid = np.zeros(dims, dtype=np.float64)
+        windows = 0
+        skipped = 0
+        seconds = 0.0
+        stable = 0
+        converged = False
+        history: List[float] = []
+
+        for sample_rate, window in iter_wav_windows(path, self.window_seconds):
+            seconds += window.size / sample_rate
+            short = window.size < int(self.min_window_seconds * sample_rate)
+            quiet = float(np.sqrt(np.mean(window * window))) < self.silence_rms
+            if (short and windows) or quiet:
+                skipped += 1
+            else:
+                vector = np.asarray(
+                    self.engine.embed_waveform(window, sample_rate, backend, dims),
+                    dtype=np.float64,
+                )
+                norm = float(np.linalg.norm(vector))
+                if norm > 0.0:
+                    centroid_sum += vector / norm
+                    windows += 1
+                    updated = centroid_sum / windows
+                    if windows > 1:
+                        drift = _cosine(updated, centroid)
+                        history.append(round(drift, 6))
+                        stable = stable + 1 if drift >= self.convergence else 0
+                    centroid = updated
+                else:
+                    skipped += 1
+
+            if (
+                self.early_stop
+                and windows >= self.min_windows
+                and stable >= self.patience
+            ):
+                converged = True
+                break
+            if self.max_seconds is not None and seconds >= self.max_seconds:
+                break
+
+        norm = float(np.linalg.norm(centroid))
+        if windows and norm > 0.0:
+            embedding = _fit_embedding_dims(centroid / norm, dims=dims)
+        else:
+            embedding = [0.0] * dims
+        return StreamingEmbeddingResult(
+            embedding=embedding,
+            backend=backend,
+            windows=windows,
+            skipped_windows=skipped,
+            seconds_processed=round(seconds, 3),
+            converged=converged,
+            history=history,
+        )
+
+    def _candidate_backends(self) -> List[str]:
+        if self.backend:
+            return [self.backend]
+        return get_encoder_pool().available_backends() + ["numpy"]
+
+    def _config_tag(self) -> str:
+        return (
+            f"{STREAMING_VERSION}:{self.window_seconds}:{self.min_window_seconds}:"
+            f"{int(self.early_stop)}:{self.convergence}:{self.patience}:"
+            f"{self.min_windows}:{self.max_seconds}:{self.silence_rms}"
+        )
+
+
+def streaming_threshold_seconds() -> float:
+    return float(os.getenv("VOICEDNA_STREAMING_MIN_SECONDS", "60"))
+
+
+def should_stream(path: str | Path) -> bool:
+    """True for WAV imprints long enough to benefit from windowed extraction."""
+    threshold = streaming_threshold_seconds()
+    if threshold < 0:
+        return False
+    try:
+        return wav_duration_seconds(path) >= threshold
+    except (wave.Error, EOFError, OSError):
+        return False
+
+
+def _cosine(left: np.ndarray, right: np.ndarray) -> float:
+    left_norm = float(np.linalg.norm(left))
+    right_norm = float(np.linalg.norm(right))
+    if left_norm == 0.0 or right_norm == 0.0:
+        return 0.0
+    return float(np.dot(left, right) / (left_norm * right_norm))
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import math
 import os
+import shutil
 import struct
 import subprocess
 import tempfile
+import time
 import wave
 from dataclasses import dataclass
 from pathlib import Path
@@ -13,8 +16,10 @@ from typing import Any, Dict, Tuple
 
 from voice_dna import VoiceDNA
 
+from .budget import remaining_budget_ms
 from .framework import VoiceDNAProcessor
 from .providers import PersonaPlexTTS, PiperTTS
+from .providers.async_exec import run_command_async
 from .providers.personaplex import check_personaplex_runtime, describe_personaplex_vram
 from .providers.piper import check_piper_runtime, piper_natural_message
 
@@ -185,6 +190,28 @@ class _SimpleLocalTTS:
             return self._synthesize_with_espeak(text)
         return self._synthesize_with_tone(text, sample_rate=sample_rate)
 
+    async def synthesize_async(self, text: str, sample_rate: int = 22050) -> bytes:
+        if not text or not text.strip():
+            raise ValueError("Text for synthesis must not be empty")
+
+        if shutil.which("espeak-ng") is None:
+            return await asyncio.to_thread(
+                self._synthesize_with_tone, text, sample_rate
+            )
+
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
+            wav_path = Path(handle.name)
+
+        try:
+            returncode, stderr = await run_command_async(
+                ["espeak-ng", "-w", str(wav_path), text]
+            )
+            if returncode != 0:
+                raise RuntimeError(stderr.strip() or "espeak-ng failed")
+            return wav_path.read_bytes()
+        finally:
+            wav_path.unlink(missing_ok=True)
+
     def _espeak_available(self) -> bool:
         return (
             subprocess.call(
@@ -261,14 +288,71 @@ def _build_provider(backend: str, low_vram: bool = False) -> Any:
     return _SimpleLocalTTS()
 
 
-def synthesize_and_process(
+@dataclass
+class _SynthesisPlan:
+    """Backend choice and report fields shared by the sync and async paths."""
+
+    resolved_backend: str
+    provider: Any
+    process_params: Dict[str, Any]
+    natural_backend_status: str | None = None
+    natural_backend_color: str | None = None
+    recommendation: str | None = None
+    detected_vram_gb: float | None = None
+    required_vram_gb: float | None = None
+    personaplex_low_vram_mode: bool = False
+    piper_model_path: str | None = None
+
+    def use_piper(self, fallback_status: str) -> None:
+        self.recommendation = (
+            "For full PersonaPlex quality, upgrade to 24GB+ card or use cloud proxy."
+        )
+        fallback_provider = _build_provider("piper")
+        self.piper_model_path = getattr(fallback_provider, "model_path", None)
+        self.process_params["base_model"] = "piper"
+        self.process_params["natural_backend_status"] = fallback_status
+        self.recommendation = "Using Piper fallback. For best 8GB quality, set VOICEDNA_PIPER_MODEL to a high-quality local .onnx voice."
+        self.process_params["natural_backend_recommendation"] = self.recommendation
+        self.provider = fallback_provider
+        self.resolved_backend = "piper"
+        self.natural_backend_status = fallback_status
+        self.natural_backend_color = "yellow"
+
+    def use_simple(self, fallback_status: str, error: Exception) -> None:
+        final_status = f"{fallback_status} Piper unavailable ({error}) -> falling back to simple local voice."
+        self.provider = _build_provider("simple")
+        self.process_params["base_model"] = "simple"
+        self.process_params["natural_backend_status"] = final_status
+        self.process_params["natural_backend_recommendation"] = self.recommendation
+        self.resolved_backend = "simple"
+        self.natural_backend_status = final_status
+        self.natural_backend_color = "yellow"
+
+    def decorate(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        if self.natural_backend_status:
+            report["natural_backend_status"] = self.natural_backend_status
+        if self.natural_backend_color:
+            report["natural_backend_color"] = self.natural_backend_color
+        if self.recommendation:
+            report["natural_backend_recommendation"] = self.recommendation
+        if self.detected_vram_gb is not None:
+            report["detected_vram_gb"] = round(self.detected_vram_gb, 2)
+        if self.required_vram_gb is not None:
+            report["required_vram_gb"] = round(self.required_vram_gb, 2)
+        report["personaplex_low_vram_mode"] = bool(self.personaplex_low_vram_mode)
+        report["resolved_backend"] = self.resolved_backend
+        if self.piper_model_path:
+            report["piper_model_path"] = self.piper_model_path
+        return report
+
+
+def _plan_synthesis(
     text: str,
-    dna: VoiceDNA,
-    backend: str = "auto",
-    natural_voice: bool = False,
-    low_vram: bool = False,
-    params: Dict[str, Any] | None = None,
-) -> Tuple[bytes, Dict[str, Any], str]:
+    backend: str,
+    natural_voice: bool,
+    low_vram: bool,
+    params: Dict[str, Any] | None,
+) -> _SynthesisPlan:
     resolved_backend = resolve_tts_backend(backend, natural_voice=natural_voice)
     natural_backend_status: str | None = None
     natural_backend_color: str | None = None
@@ -307,7 +391,6 @@ def synthesize_and_process(
         else:
             raise
 
-    processor = VoiceDNAProcessor()
     process_params: Dict[str, Any] = {
         "text": text,
         "audio_format": "wav",
@@ -322,64 +405,120 @@ def synthesize_and_process(
     if recommendation:
         process_params["natural_backend_recommendation"] = recommendation
 
-    try:
-        processed_audio = processor.synthesize_and_process(
-            text=text, dna=dna, tts_provider=provider, params=process_params
+    return _SynthesisPlan(
+        resolved_backend=resolved_backend,
+        provider=provider,
+        process_params=process_params,
+        natural_backend_status=natural_backend_status,
+        natural_backend_color=natural_backend_color,
+        recommendation=recommendation,
+        detected_vram_gb=detected_vram_gb,
+        required_vram_gb=required_vram_gb,
+        personaplex_low_vram_mode=personaplex_low_vram_mode,
+        piper_model_path=piper_model_path,
+    )
+
+
+def synthesize_and_process(
+    text: str,
+    dna: VoiceDNA,
+    backend: str = "auto",
+    natural_voice: bool = False,
+    low_vram: bool = False,
+    params: Dict[str, Any] | None = None,
+    budget_ms: float | None = None,
+) -> Tuple[bytes, Dict[str, Any], str]:
+    """Synthesize ``text`` and run the VoiceDNA chain.
+
+    ``budget_ms`` is the latency budget for the whole call, including backend
+    selection and any fallback attempts; see
+    :meth:`VoiceDNAProcessor.process_with_report`.
+    """
+    started_at = time.perf_counter()
+    plan = _plan_synthesis(text, backend, natural_voice, low_vram, params)
+    processor = VoiceDNAProcessor()
+
+    def _run() -> bytes:
+        return processor.synthesize_and_process(
+            text=text,
+            dna=dna,
+            tts_provider=plan.provider,
+            params=plan.process_params,
+            budget_ms=remaining_budget_ms(budget_ms, started_at),
         )
+
+    try:
+        processed_audio = _run()
     except Exception as error:
-        if resolved_backend == "personaplex":
-            fallback_status = f"PersonaPlex unavailable ({error}) -> falling back to Piper natural voice."
-            recommendation = "For full PersonaPlex quality, upgrade to 24GB+ card or use cloud proxy."
+        if plan.resolved_backend != "personaplex":
+            raise
+        fallback_status = _personaplex_failure(error)
+        try:
+            plan.use_piper(fallback_status)
+            processed_audio = _run()
+        except Exception as fallback_error:
+            plan.use_simple(fallback_status, fallback_error)
+            processed_audio = _run()
+
+    report = plan.decorate(processor.get_last_report())
+    return processed_audio, report, plan.resolved_backend
+
+
+async def synthesize_and_process_async(
+    text: str,
+    dna: VoiceDNA,
+    backend: str = "auto",
+    natural_voice: bool = False,
+    low_vram: bool = False,
+    params: Dict[str, Any] | None = None,
+    runtime: Any = None,
+    budget_ms: float | None = None,
+) -> Tuple[bytes, Dict[str, Any], str]:
+    """Async :func:`synthesize_and_process` for event-loop hosts.
+
+    Backend detection and model loading run in the runtime's executor,
+    subprocess providers (piper, espeak-ng) run via
+    ``asyncio.create_subprocess_exec`` and filter work is offloaded, all
+    within one of the runtime's concurrency slots. Cancelling the awaiting
+    task kills any synthesis subprocess.
+    """
+    from .aio import get_async_processor
+
+    started_at = time.perf_counter()
+    runtime = runtime or get_async_processor()
+    async with runtime.slot():
+        plan = await runtime.run_blocking(
+            _plan_synthesis, text, backend, natural_voice, low_vram, params
+        )
+
+        async def _run():
+            return await runtime.synthesize_and_process(
+                text,
+                dna,
+                plan.provider,
+                plan.process_params,
+                acquire=False,
+                budget_ms=remaining_budget_ms(budget_ms, started_at),
+            )
+
+        try:
+            result = await _run()
+        except Exception as error:
+            if plan.resolved_backend != "personaplex":
+                raise
+            fallback_status = _personaplex_failure(error)
             try:
-                fallback_provider = _build_provider("piper")
-                piper_model_path = getattr(fallback_provider, "model_path", None)
-                process_params["base_model"] = "piper"
-                process_params["natural_backend_status"] = fallback_status
-                recommendation = "Using Piper fallback. For best 8GB quality, set VOICEDNA_PIPER_MODEL to a high-quality local .onnx voice."
-                process_params["natural_backend_recommendation"] = recommendation
-                processed_audio = processor.synthesize_and_process(
-                    text=text,
-                    dna=dna,
-                    tts_provider=fallback_provider,
-                    params=process_params,
-                )
-                resolved_backend = "piper"
-                natural_backend_status = fallback_status
-                natural_backend_color = "yellow"
+                await runtime.run_blocking(plan.use_piper, fallback_status)
+                result = await _run()
             except Exception as fallback_error:
-                final_status = f"{fallback_status} Piper unavailable ({fallback_error}) -> falling back to simple local voice."
-                simple_provider = _build_provider("simple")
-                process_params["base_model"] = "simple"
-                process_params["natural_backend_status"] = final_status
-                process_params["natural_backend_recommendation"] = recommendation
-                processed_audio = processor.synthesize_and_process(
-                    text=text,
-                    dna=dna,
-                    tts_provider=simple_provider,
-                    params=process_params,
-                )
-                resolved_backend = "simple"
-                natural_backend_status = final_status
-                natural_backend_color = "yellow"
-        else:
-            raise
+                plan.use_simple(fallback_status, fallback_error)
+                result = await _run()
 
-    report = processor.get_last_report()
-    if natural_backend_status:
-        report["natural_backend_status"] = natural_backend_status
-    if natural_backend_color:
-        report["natural_backend_color"] = natural_backend_color
-    if recommendation:
-        report["natural_backend_recommendation"] = recommendation
-    if detected_vram_gb is not None:
-        report["detected_vram_gb"] = round(detected_vram_gb, 2)
-    if required_vram_gb is not None:
-        report["required_vram_gb"] = round(required_vram_gb, 2)
-    report["personaplex_low_vram_mode"] = bool(personaplex_low_vram_mode)
-    report["resolved_backend"] = resolved_backend
-    if piper_model_path:
-        report["piper_model_path"] = piper_model_path
-    return processed_audio, report, resolved_backend
+    return result.audio, plan.decorate(result.report), plan.resolved_backend
+
+
+def _personaplex_failure(error: Exception) -> str:
+    return f"PersonaPlex unavailable ({error}) -> falling back to Piper natural voice."
 
 
 def play_wav_bytes(audio_bytes: bytes) -> str:
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import numpy as np
+
+WINDOW_STRATEGIES = ("vad", "energy", "uniform")
+
+FRAME_SECONDS = 0.02
+
+
+def frame_rms(waveform: np.ndarray, frame: int) -> np.ndarray:
+    """RMS of consecutive ``frame``-sample frames; a trailing partial frame is dropped."""
+    count = waveform.size // frame
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = np.asarray(waveform[: count * frame], dtype=np.float32).reshape(count, frame)
+    return np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+
+
+def voiced_frames(
+    rms: np.ndarray, floor_margin_db: float = 6.0, silence_rms: float = 1e-3
+) -> np.ndarray:
+    """Energy VAD: frames louder than the noise floor by ``floor_margin_db``.
+
+    The floor is the 10th percentile frame level, so it adapts to steady
+    background noise without a model.
+    """
+    if rms.size == 0:
+        return np.zeros(0, dtype=bool)
+    level = 20.0 * np.log10(np.maximum(rms, 1e-9))
+    floor = float(np.percentile(level, 10))
+    return (level > floor + floor_margin_db) & (rms >= silence_rms)
+
+
+def select_scoring_windows(
+    waveform: np.ndarray,
+    sample_rate: int,
+    count: int,
+    window_seconds: float,
+    strategy: str = "vad",
+) -> np.ndarray | None:
+    """Start offsets of at most ``count`` non-overlapping scoring windows.
+
+    ``None`` means the clip is too short to be worth windowing and should be
+    scored whole. Strategies:
+
+    - ``vad``: windows whose frames are mostly voiced, spread evenly over
+      the clip so every part of a long narration is represented.
+    - ``energy``: the loudest windows.
+    - ``uniform``: evenly spaced windows regardless of content.
+
+    Cost is one RMS pass over the clip; the embedder then only sees
+    ``count * window_seconds`` of audio however long the clip is.
+    """
+    if strategy not in WINDOW_STRATEGIES:
+        raise ValueError(
+            f"Unknown window strategy '{strategy}'; expected one of {WINDOW_STRATEGIES}"
+        )
+    window = max(1, int(window_seconds * sample_rate))
+    slots = waveform.size // window
+    if count <= 0 or slots <= count:
+        return None
+
+    if strategy == "uniform":
+        chosen = _spread(np.arange(slots), count)
+        return chosen * window
+
+    frame = max(1, int(FRAME_SECONDS * sample_rate))
+    frames_per_window = max(1, window // frame)
+    rms = frame_rms(waveform[: slots * window], frame)
+    usable = (rms.size // frames_per_window) * frames_per_window
+    slots = usable // frames_per_window
+    if slots == 0:
+        return None
+    per_window = rms[:usable].reshape(slots, frames_per_window)
+
+    if strategy == "energy":
+        loudness = np.sqrt(np.mean(per_window * per_window, axis=1))
+        chosen = np.sort(np.argsort(-loudness, kind="stable")[:count])
+        return chosen * window
+
+    voiced = voiced_frames(rms[:usable]).reshape(slots, frames_per_window).mean(axis=1)
+    candidates = np.flatnonzero(voiced >= 0.5)
+    if candidates.size < count:
+        # Mostly silence: fall back to the most voiced windows available.
+        candidates = np.sort(np.argsort(-voiced, kind="stable")[:count])
+    return _spread(candidates, count) * window
+
+
+def _spread(candidates: np.ndarray, count: int) -> np.ndarray:
+    """``count`` entries of a sorted array, evenly spaced across it."""
+    if candidates.size <= count:
+        return candidates
+    positions = np.linspace(0, candidates.size - 1, count).round().astype(int)
+    return candidates[np.unique(positions)]
@@ -1,3 +1,17 @@
-from voice_dna import VoiceDNA
+from voice_dna import (
+    KEY_CACHE,
+    DerivedKeyCache,
+    VoiceDNA,
+    convert_to_binary,
+    is_binary_container,
+    load_embedding_array,
+)
 
-__all__ = ["VoiceDNA"]
+__all__ = [
+    "KEY_CACHE",
+    "DerivedKeyCache",
+    "VoiceDNA",
+    "convert_to_binary",
+    "is_binary_container",
+    "load_embedding_array",
+]
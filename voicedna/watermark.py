@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import threading
+import wave
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .audio import AudioBuffer
+
+WATERMARK_BITS = 256
+# z-score a candidate must reach; the null distribution is standard normal.
+DEFAULT_MIN_SCORE = 5.0
+MIN_DETECTION_BITS = 16
+
+
+def fingerprint_bits(voice_fingerprint_id: str) -> np.ndarray:
+    """The 256 watermark bits of a fingerprint (LSB-first within each byte)."""
+    digest = hashlib.sha256(voice_fingerprint_id.encode("utf-8")).digest()
+    return np.unpackbits(np.frombuffer(digest, dtype=np.uint8), bitorder="little")
+
+
+def bit_window(sample_rate: int) -> int:
+    return max(128, int(sample_rate * 0.015))
+
+
+def carrier_frequency(sample_rate: int) -> float:
+    return min(7800.0, sample_rate * 0.42)
+
+
+def watermark_amplitude(depth: float) -> float:
+    return 32768.0 * max(0.0, min(0.01, depth))
+
+
+def build_watermark_pattern(
+    bits: np.ndarray, sample_rate: int, amplitude: float
+) -> np.ndarray:
+    """Full watermark waveform in PCM16 units: one phase-keyed carrier window per bit.
+
+    The watermark only covers ``len(bits) * bit_window(sample_rate)`` frames;
+    audio past the end of the pattern is left untouched.
+    """
+    window = bit_window(sample_rate)
+    indices = np.arange(len(bits) * window, dtype=np.float32)
+    phase = np.where(
+        np.repeat(np.asarray(bits, dtype=bool), window),
+        np.float32(math.pi / 3),
+        np.float32(-math.pi / 3),
+    )
+    carrier = np.sin(
+        (2.0 * math.pi * carrier_frequency(sample_rate) * indices / sample_rate)
+        + phase
+    )
+    return carrier * amplitude
+
+
+def add_watermark(
+    samples: np.ndarray, pattern: np.ndarray, offset: int = 0, scale: float = 1.0
+) -> np.ndarray:
+    """Add ``pattern[offset:]`` into float ``samples`` in place and return them.
+
+    ``samples`` is ``(frames,)`` or ``(frames, channels)``; every channel gets
+    the same watermark. Only the frames that overlap the pattern are touched.
+    """
+    start = min(max(offset, 0), pattern.shape[0])
+    stop = min(pattern.shape[0], offset + samples.shape[0])
+    if stop <= start:
+        return samples
+    segment = pattern[start:stop]
+    if scale != 1.0:
+        segment = segment * np.float32(scale)
+    target = samples[start - offset : stop - offset]
+    if samples.ndim == 1:
+        target += segment
+    else:
+        target += segment[:, None]
+    return samples
+
+
+class WatermarkCache:
+    """LRU of precomputed watermark waveforms.
+
+    Patterns are keyed by fingerprint digest, sample rate and amplitude. A
+    pattern already spans every frame the watermark can touch, so one entry
+    serves clips and stream blocks of any length and offset. Cached arrays are
+    read-only.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[bytes, int, float], np.ndarray]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_env() -> "WatermarkCache":
+        return WatermarkCache(
+            max_entries=int(os.getenv("VOICEDNA_WATERMARK_CACHE_SIZE", "64"))
+        )
+
+    def pattern(
+        self, voice_fingerprint_id: str, sample_rate: int, depth: float
+    ) -> np.ndarray:
+        bits = fingerprint_bits(voice_fingerprint_id)
+        amplitude = watermark_amplitude(depth)
+        key = (np.packbits(bits).tobytes(), int(sample_rate), amplitude)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        pattern = build_watermark_pattern(bits, sample_rate, amplitude)
+        pattern.flags.writeable = False
+        if self.max_entries <= 0:
+            return pattern
+        with self._lock:
+            self._entries[key] = pattern
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return pattern
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(pattern.nbytes for pattern in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class CandidateSet:
+    """Fingerprint ids with their watermark bits precomputed as +/-1 signs."""
+
+    def __init__(self, voice_fingerprint_ids: Iterable[str]):
+        self.ids: List[str] = list(dict.fromkeys(voice_fingerprint_ids))
+        bits = np.array(
+            [fingerprint_bits(fingerprint_id) for fingerprint_id in self.ids],
+            dtype=np.float32,
+        ).reshape(len(self.ids), WATERMARK_BITS)
+        self.signs = bits * 2.0 - 1.0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def best_match(self, soft_bits: np.ndarray) -> Tuple[str | None, float]:
+        """Brute-force the best candidate for demodulated soft bits."""
+        if not self.ids:
+            return None, 0.0
+        scores = match_scores(self.signs, soft_bits)
+        best = int(np.argmax(scores))
+        return self.ids[best], float(scores[best])
+
+
+def tail_probability(score: float) -> float:
+    """``P(Z >= score)`` for a standard normal ``Z``."""
+    return 0.5 * math.erfc(score / math.sqrt(2.0))
+
+
+def detection_threshold(min_score: float, candidates: int = 1) -> float:
+    """z-score the best of ``candidates`` matches must reach.
+
+    ``min_score`` fixes the false-attribution rate for a single candidate,
+    ``tail_probability(min_score)``. The best of N unrelated candidates
+    exceeds a bar N times as often, so the bar rises to the z-score whose
+    tail is that rate divided by N (Bonferroni).
+    """
+    if candidates <= 1:
+        return min_score
+    alpha = tail_probability(min_score) / candidates
+    if alpha <= 0.0:
+        return min_score
+    return max(min_score, -NormalDist().inv_cdf(alpha))
+
+
+def match_scores(signs: np.ndarray, soft_bits: np.ndarray) -> np.ndarray:
+    """z-scores of +/-1 bit rows against soft bits (standard normal if unrelated)."""
+    norm = float(np.linalg.norm(soft_bits)) or 1.0
+    return signs[:, : soft_bits.size] @ soft_bits / norm
+
+
+@dataclass
+class WatermarkDetection:
+    """Result of :func:`detect_sonic_watermark`.
+
+    ``score`` is a z-score: the best candidate's match when candidates were
+    given, otherwise the strength of the common carrier component. Each
+    candidate's score is standard normal on unwatermarked audio, so the best
+    of ``candidates`` is judged family-wise: ``threshold`` comes from
+    :func:`detection_threshold` and ``confidence`` is
+    ``1 - candidates * P(Z >= score)``.
+    """
+
+    bits: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.uint8))
+    soft_bits: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    score: float = 0.0
+    confidence: float = 0.0
+    detected: bool = False
+    voice_fingerprint_id: str | None = None
+    sample_rate: int = 0
+    threshold: float = 0.0
+    candidates: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "detected": self.detected,
+            "voice_fingerprint_id": self.voice_fingerprint_id,
+            "score": round(self.score, 3),
+            "threshold": round(self.threshold, 3),
+            "candidates": self.candidates,
+            "confidence": round(self.confidence, 6),
+            "bits_recovered": int(self.bits.size),
+            "bits": np.packbits(self.bits, bitorder="little").tobytes().hex(),
+        }
+
+
+def demodulate_watermark(
+    samples: np.ndarray, sample_rate: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Matched-filter each full bit window; return ``(in_phase, quadrature)``.
+
+    Correlating a window with ``exp(-j*w*n)`` yields a phasor at ``-30deg``
+    for a one bit and ``-150deg`` for a zero bit, so the real part carries the
+    bit and the imaginary part is the same for every bit. A Hann taper keeps
+    low-frequency speech energy from leaking into the carrier bin.
+    """
+    mono = samples if samples.ndim == 1 else samples.mean(axis=1)
+    window = bit_window(sample_rate)
+    bit_count = min(WATERMARK_BITS, mono.shape[0] // window)
+    cosine, sine = _demodulation_reference(sample_rate)
+    windows = np.asarray(mono[: bit_count * window], dtype=np.float32).reshape(
+        bit_count, window
+    )
+    in_phase = np.einsum("ij,ij->i", windows, cosine[:bit_count])
+    quadrature = -np.einsum("ij,ij->i", windows, sine[:bit_count])
+    return in_phase, quadrature
+
+
+@functools.lru_cache(maxsize=8)
+def _demodulation_reference(sample_rate: int) -> Tuple[np.ndarray, np.ndarray]:
+    window = bit_window(sample_rate)
+    omega = 2.0 * math.pi * carrier_frequency(sample_rate) / sample_rate
+    phase = (omega * np.arange(WATERMARK_BITS * window)).reshape(WATERMARK_BITS, window)
+    taper = np.hanning(window)
+    return (
+        (np.cos(phase) * taper).astype(np.float32),
+        (np.sin(phase) * taper).astype(np.float32),
+    )
+
+
+def detect_sonic_watermark(
+    audio: bytes | str | Path | AudioBuffer | np.ndarray,
+    candidates: Iterable[str] | CandidateSet | Any | None = None,
+    sample_rate: int | None = None,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> WatermarkDetection:
+    """Read back the watermark embedded by ``apply_sonic_watermark``.
+
+    ``audio`` is WAV bytes, a WAV path, an :class:`AudioBuffer` or float
+    samples (with ``sample_rate``); only the frames the watermark covers are
+    decoded. The clip must start where the watermark started and keep its
+    sample rate. With ``candidates`` (fingerprint ids, a :class:`CandidateSet`
+    or a :class:`~voicedna.watermark_index.WatermarkIndex`) the best-matching
+    fingerprint id is returned when its score reaches ``min_score``,
+    corrected for the number of candidates (see :func:`detection_threshold`).
+    """
+    samples, rate = _watermark_head(audio, sample_rate)
+    in_phase, quadrature = demodulate_watermark(samples, rate)
+    detection = WatermarkDetection(
+        bits=(in_phase > 0).astype(np.uint8), soft_bits=in_phase, sample_rate=rate
+    )
+    if in_phase.size < MIN_DETECTION_BITS:
+        return detection
+
+    if candidates is None:
+        spread = float(np.std(quadrature))
+        mean = -float(np.mean(quadrature))
+        score = mean * math.sqrt(quadrature.size) / max(spread, abs(mean) * 1e-3, 1e-12)
+        fingerprint_id = None
+        family = 1
+    else:
+        if not hasattr(candidates, "best_match"):
+            candidates = CandidateSet(candidates)
+        fingerprint_id, score = candidates.best_match(in_phase)
+        if fingerprint_id is None:
+            return detection
+        family = max(1, len(candidates))
+
+    detection.score = score
+    detection.candidates = family
+    detection.threshold = detection_threshold(min_score, family)
+    detection.confidence = max(0.0, 1.0 - family * tail_probability(score))
+    detection.detected = score >= detection.threshold
+    detection.voice_fingerprint_id = fingerprint_id if detection.detected else None
+    return detection
+
+
+def scan_watermarks(
+    paths: Sequence[str | Path],
+    candidates: Iterable[str] | None = None,
+    min_score: float = DEFAULT_MIN_SCORE,
+    executor: str | Executor = "process",
+    max_workers: int | None = None,
+    chunk_size: int = 64,
+    index_dir: str | Path | None = None,
+) -> Iterator[Tuple[str, WatermarkDetection | None, str | None]]:
+    """Detect watermarks in many WAV files; yields ``(path, detection, error)`` in order.
+
+    ``executor`` is ``"process"`` (a spawn pool over all cores), ``"thread"``
+    or an existing executor, which is left running. ``index_dir`` is a saved
+    :class:`~voicedna.watermark_index.WatermarkIndex` that each worker
+    memory-maps instead of brute-forcing ``candidates``.
+
+    Every task carries its own candidate source, so concurrent scans do not
+    share state and caller-supplied process pools (of any start method)
+    resolve the candidates themselves, once per worker.
+    """
+    source = _ScanSource.build(candidates, index_dir)
+    paths = [str(path) for path in paths]
+    if executor == "process":
+        # Our own workers build the candidates in their initializer, so tasks
+        # need not carry the (possibly large) id list.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_resolve_scan_source,
+            initargs=(source,),
+        ) as pool:
+            yield from _scan_with(pool, paths, chunk_size, source.by_reference(), min_score)
+        return
+    if executor == "thread":
+        _resolve_scan_source(source)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield from _scan_with(pool, paths, chunk_size, source, min_score)
+        return
+    if not isinstance(executor, Executor):
+        raise ValueError("executor must be 'process', 'thread' or an Executor")
+    if not isinstance(executor, ProcessPoolExecutor):
+        _resolve_scan_source(source)
+    yield from _scan_with(executor, paths, chunk_size, source, min_score)
+
+
+@dataclass(frozen=True)
+class _ScanSource:
+    """Picklable description of a scan's candidates, keyed by its content."""
+
+    key: str
+    candidate_ids: Tuple[str, ...] | None = None
+    index_dir: str | None = None
+    by_key: bool = False
+
+    @classmethod
+    def build(
+        cls, candidates: Iterable[str] | None, index_dir: str | Path | None
+    ) -> "_ScanSource":
+        if index_dir is not None:
+            return cls(key=f"index:{Path(index_dir).resolve()}", index_dir=str(index_dir))
+        if candidates is None:
+            return cls(key="none")
+        ids = tuple(candidates)
+        digest = hashlib.blake2b("\n".join(ids).encode("utf-8"), digest_size=16)
+        return cls(key=f"ids:{digest.hexdigest()}", candidate_ids=ids)
+
+    def by_reference(self) -> "_ScanSource":
+        """The same source without its id list, for workers that already hold it."""
+        if self.candidate_ids is None:
+            return self
+        return _ScanSource(key=self.key, by_key=True)
+
+
+_SCAN_SOURCES: "OrderedDict[str, Any]" = OrderedDict()
+_SCAN_SOURCES_LOCK = threading.Lock()
+_SCAN_SOURCES_MAX = 4
+
+
+def _resolve_scan_source(source: _ScanSource) -> Any:
+    with _SCAN_SOURCES_LOCK:
+        if source.key in _SCAN_SOURCES:
+            _SCAN_SOURCES.move_to_end(source.key)
+            return _SCAN_SOURCES[source.key]
+    if source.index_dir is not None:
+        from .watermark_index import WatermarkIndex
+
+        resolved = WatermarkIndex.load(source.index_dir)
+    elif source.candidate_ids is not None:
+        resolved = CandidateSet(source.candidate_ids)
+    elif source.by_key:
+        raise RuntimeError("scan worker lost its candidate set")
+    else:
+        resolved = None
+    with _SCAN_SOURCES_LOCK:
+        _SCAN_SOURCES[source.key] = resolved
+        while len(_SCAN_SOURCES) > _SCAN_SOURCES_MAX:
+            _SCAN_SOURCES.popitem(last=False)
+    return resolved
+
+
+def _scan_one(
+    source: _ScanSource, min_score: float, path: str
+) -> Tuple[str, WatermarkDetection | None, str | None]:
+    try:
+        detection = detect_sonic_watermark(
+            path, _resolve_scan_source(source), min_score=min_score
+        )
+    except (OSError, ValueError, EOFError, wave.Error) as error:
+        return path, None, f"{type(error).__name__}: {error}"
+    return path, detection, None
+
+
+def _scan_with(
+    pool: Executor,
+    paths: List[str],
+    chunk_size: int,
+    source: _ScanSource,
+    min_score: float,
+) -> Iterator[Tuple[str, WatermarkDetection | None, str | None]]:
+    task = functools.partial(_scan_one, source, min_score)
+    if isinstance(pool, ProcessPoolExecutor):
+        yield from pool.map(task, paths, chunksize=max(1, chunk_size))
+    else:
+        yield from pool.map(task, paths)
+
+
+def _watermark_head(
+    audio: bytes | str | Path | AudioBuffer | np.ndarray, sample_rate: int | None
+) -> Tuple[np.ndarray, int]:
+    if isinstance(audio, AudioBuffer):
+        return audio.samples, audio.sample_rate
+    if isinstance(audio, np.ndarray):
+        if sample_rate is None:
+            raise ValueError("sample_rate is required for raw samples")
+        return audio, sample_rate
+
+    source = io.BytesIO(audio) if isinstance(audio, (bytes, bytearray)) else str(audio)
+    with wave.open(source, "rb") as wave_file:
+        if wave_file.getsampwidth() != 2:
+            raise ValueError("Only 16-bit PCM WAV is supported for watermark detection")
+        rate = wave_file.getframerate()
+        channels = wave_file.getnchannels()
+        raw_frames = wave_file.readframes(WATERMARK_BITS * bit_window(rate))
+    samples = np.frombuffer(raw_frames, dtype="<i2").astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    return samples, rate
+
+
+WATERMARK_CACHE = WatermarkCache.from_env()
+
+
+def get_watermark_cache() -> WatermarkCache:
+    return WATERMARK_CACHE
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .watermark import (
+    DEFAULT_MIN_SCORE,
+    WATERMARK_BITS,
+    WatermarkDetection,
+    detect_sonic_watermark,
+    match_scores,
+)
+
+
+SearchHit = Tuple[str, float]
+
+
+class WatermarkIndex:
+    """Inverted index from watermark bit bands to ``voice_fingerprint_id``.
+
+    The 256 watermark bits of a fingerprint are split into ``band_bits``-wide
+    bands; each band value is a bucket key in one sorted table per band, so a
+    lookup is a binary search per probe regardless of fleet size. Queries
+    are demodulated soft bits. Multi-probe LSH absorbs the bit errors of
+    noisy clips. Each band is also probed with the ``probes`` most likely
+    flip patterns of its ``probe_bits`` least reliable bits, ranked by the
+    total soft-bit magnitude they flip. Bucket hits are then re-scored
+    exactly against the soft bits. Clips shorter than the full watermark only
+    probe the bands they cover.
+    """
+
+    def __init__(self, band_bits: int = 16, probe_bits: int = 12, probes: int = 128):
+        if WATERMARK_BITS % band_bits or not 1 <= band_bits <= 32:
+            raise ValueError("band_bits must divide 256 and be at most 32")
+        self.band_bits = band_bits
+        self.probe_bits = max(0, min(probe_bits, band_bits, 16))
+        self.probes = max(1, probes)
+        self._codes = np.zeros((0, WATERMARK_BITS // 8), dtype=np.uint8)
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: List[str] = []
+        self._rows: dict[str, int] = {}
+        self._size = 0
+        self._keys: np.ndarray | None = None
+        self._order: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, voice_fingerprint_id: object) -> bool:
+        return voice_fingerprint_id in self._rows
+
+    @property
+    def bands(self) -> int:
+        return WATERMARK_BITS // self.band_bits
+
+    def ids(self) -> List[str]:
+        return [self._ids[row] for row in sorted(self._rows.values())]
+
+    def add(self, voice_fingerprint_id: str) -> None:
+        self.add_many([voice_fingerprint_id])
+
+    def add_many(self, voice_fingerprint_ids: Iterable[str]) -> None:
+        ids = [
+            fingerprint_id
+            for fingerprint_id in dict.fromkeys(voice_fingerprint_ids)
+            if fingerprint_id not in self._rows
+        ]
+        if not ids:
+            return
+        # Packed LSB-first, the watermark bits are exactly the SHA-256 digest.
+        codes = np.frombuffer(
+            b"".join(
+                hashlib.sha256(fingerprint_id.encode("utf-8")).digest()
+                for fingerprint_id in ids
+            ),
+            dtype=np.uint8,
+        ).reshape(len(ids), WATERMARK_BITS // 8)
+        start = self._size
+        self._codes = np.concatenate([self._codes[: self._size], codes])
+        self._alive = np.concatenate(
+            [self._alive[: self._size], np.ones(len(ids), dtype=bool)]
+        )
+        for offset, fingerprint_id in enumerate(ids):
+            self._rows[fingerprint_id] = start + offset
+        self._ids.extend(ids)
+        self._size += len(ids)
+        self._keys = self._order = None
+
+    def remove(self, voice_fingerprint_id: str) -> bool:
+        row = self._rows.pop(voice_fingerprint_id, None)
+        if row is None:
+            return False
+        if isinstance(self._alive, np.memmap) or not self._alive.flags.writeable:
+            self._alive = np.array(self._alive)
+        self._alive[row] = False
+        if self._size and (self._size - len(self._rows)) > self._size // 4:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        keep = np.flatnonzero(self._alive[: self._size])
+        if keep.size == self._size:
+            return
+        self._codes = np.ascontiguousarray(self._codes[keep])
+        self._alive = np.ones(keep.size, dtype=bool)
+        self._ids = [self._ids[row] for row in keep]
+        self._rows = {fingerprint_id: row for row, fingerprint_id in enumerate(self._ids)}
+        self._size = keep.size
+        self._keys = self._order = None
+
+    def search(self, soft_bits: Sequence[float], k: int = 5) -> List[SearchHit]:
+        """Top ``k`` fingerprints for demodulated soft bits, best first."""
+        soft = np.asarray(soft_bits, dtype=np.float32)[:WATERMARK_BITS]
+        rows = self.candidate_rows(soft)
+        if rows.size == 0:
+            return []
+        scores = match_scores(self._signs(rows), soft)
+        order = np.argsort(-scores, kind="stable")[:k]
+        return [(self._ids[rows[position]], float(scores[position])) for position in order]
+
+    def best_match(self, soft_bits: np.ndarray) -> Tuple[str | None, float]:
+        hits = self.search(soft_bits, k=1)
+        return hits[0] if hits else (None, 0.0)
+
+    def identify(
+        self, audio, min_score: float = DEFAULT_MIN_SCORE
+    ) -> WatermarkDetection:
+        """:func:`detect_sonic_watermark` resolved against this index."""
+        return detect_sonic_watermark(audio, self, min_score=min_score)
+
+    def candidate_rows(self, soft_bits: np.ndarray) -> np.ndarray:
+        """Live rows sharing at least one probed band key with the query."""
+        bands = min(self.bands, soft_bits.size // self.band_bits)
+        if not self._rows or bands == 0:
+            return np.zeros(0, dtype=np.int64)
+        keys, order = self._tables()
+        values = soft_bits[: bands * self.band_bits].reshape(bands, self.band_bits)
+        weights = np.left_shift(np.uint64(1), np.arange(self.band_bits, dtype=np.uint64))
+        base = ((values > 0).astype(np.uint64) * weights).sum(axis=1)
+        reliability = np.abs(values)
+        weakest = np.argsort(reliability, axis=1, kind="stable")[:, : self.probe_bits]
+        masks = _probe_masks(self.probe_bits)
+        # Most likely error patterns first: the cheapest total reliability to flip.
+        costs = masks.astype(np.float32) @ np.take_along_axis(reliability, weakest, 1).T
+        chosen = np.argsort(costs, axis=0, kind="stable")[: self.probes]
+        flips = np.take_along_axis(masks @ weights[weakest].T, chosen, axis=0)
+        probes = np.bitwise_xor(base[None, :], flips).astype(np.uint32)
+
+        found = []
+        for band in range(bands):
+            band_keys = keys[band]
+            left = np.searchsorted(band_keys, probes[:, band], side="left")
+            right = np.searchsorted(band_keys, probes[:, band], side="right")
+            hit = right > left
+            if hit.any():
+                found.append(np.asarray(order[band][_ranges(left[hit], right[hit])]))
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        rows = np.unique(np.concatenate(found))
+        return rows[self._alive[rows]]
+
+    def save(self, directory: str | Path) -> Path:
+        self.compact()
+        keys, order = self._tables()
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        np.save(target / "codes.npy", self._codes[: self._size])
+        np.save(target / "band_keys.npy", keys)
+        np.save(target / "band_order.npy", order)
+        meta = {
+            "version": 1,
+            "band_bits": self.band_bits,
+            "probe_bits": self.probe_bits,
+            "probes": self.probes,
+            "ids": self._ids,
+        }
+        (target / "watermark_index.json").write_text(json.dumps(meta), encoding="utf-8")
+        return target
+
+    @staticmethod
+    def load(directory: str | Path, mmap: bool = True) -> "WatermarkIndex":
+        source = Path(directory)
+        meta = json.loads(
+            (source / "watermark_index.json").read_text(encoding="utf-8")
+        )
+        mode = "r" if mmap else None
+        index = WatermarkIndex(
+            band_bits=int(meta["band_bits"]),
+            probe_bits=int(meta["probe_bits"]),
+            probes=int(meta.get("probes", 128)),
+        )
+        index._codes = np.load(source / "codes.npy", mmap_mode=mode)
+        index._keys = np.load(source / "band_keys.npy", mmap_mode=mode)
+        index._order = np.load(source / "band_order.npy", mmap_mode=mode)
+        index._ids = list(meta["ids"])
+        index._size = len(index._ids)
+        index._alive = np.ones(index._size, dtype=bool)
+        index._rows = {fingerprint_id: row for row, fingerprint_id in enumerate(index._ids)}
+        return index
+
+    @staticmethod
+    def from_store(store, **options) -> "WatermarkIndex":
+        index = WatermarkIndex(**options)
+        index.add_many(store.get(name).voice_fingerprint_id for name in store.names())
+        return index
+
+    def _tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Rebuilt lazily after adds, so add voices in batches.
+        if self._keys is None or self._order is None:
+            bits = np.unpackbits(
+                np.asarray(self._codes[: self._size]), axis=1, bitorder="little"
+            )
+            weights = np.left_shift(
+                np.uint64(1), np.arange(self.band_bits, dtype=np.uint64)
+            )
+            band_keys = (
+                (
+                    bits.reshape(self._size, self.bands, self.band_bits).astype(np.uint64)
+                    * weights
+                )
+                .sum(axis=2)
+                .T.astype(np.uint32)
+            )
+            order = np.argsort(band_keys, axis=1, kind="stable").astype(np.int32)
+            self._keys = np.take_along_axis(band_keys, order, axis=1)
+            self._order = order
+        return self._keys, self._order
+
+    def _signs(self, rows: np.ndarray) -> np.ndarray:
+        bits = np.unpackbits(np.asarray(self._codes[rows]), axis=1, bitorder="little")
+        return bits.astype(np.float32) * 2.0 - 1.0
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Concatenation of ``arange(start, stop)`` for each pair."""
+    lengths = stops - starts
+    offsets = np.repeat(stops - lengths.cumsum(), lengths)
+    return offsets + np.arange(lengths.sum())
+
+
+def _probe_masks(probe_bits: int) -> np.ndarray:
+    """All ``2**probe_bits`` subsets of the weakest bits as a 0/1 matrix."""
+    subsets = np.arange(1 << probe_bits, dtype=np.uint64)[:, None]
+    return ((subsets >> np.arange(probe_bits, dtype=np.uint64)) & np.uint64(1)).astype(
+        np.uint64
+    )